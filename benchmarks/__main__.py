@@ -0,0 +1,37 @@
+import sys
+from argparse import ArgumentParser
+
+from benchmarks import runner
+from benchmarks.scenes import SCENES
+
+
+def main() -> None:
+    parser = ArgumentParser(prog='python -m benchmarks', description='Runs the engine benchmarks.')
+    parser.add_argument('scenes', nargs='*', metavar='SCENE', help=f"the scenes to run, from: {', '.join(SCENES)}")
+    parser.add_argument('--frames', type=int, default=runner.DEFAULT_FRAMES, help='measured frames per scene')
+    parser.add_argument('--scale', type=float, default=1, help='multiplier for the amount of entities per scene')
+    parser.add_argument('--output', metavar='FILE', default='bench_output.json', help='where to write the report')
+    parser.add_argument('--baseline', metavar='FILE', help='a previous report to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative change counted as a regression')
+    args = parser.parse_args()
+    if unknown := [name for name in args.scenes if name not in SCENES]:
+        parser.error(f"unknown scene(s): {', '.join(unknown)}")
+
+    report = runner.run(args.scenes or None, args.frames, args.scale)
+    if args.baseline:
+        report['comparison'] = runner.compare(report, runner.load(args.baseline), args.threshold)
+    runner.save(report, args.output)
+
+    for result in report['results']:
+        print(f"{result['name']:<16} n={result['count']:<6} p50={result['p50_ms']:7.2f}ms "
+              f"p95={result['p95_ms']:7.2f}ms p99={result['p99_ms']:7.2f}ms throughput={result['throughput']:.0f}/s")
+    regressions = [c for c in report.get('comparison', []) if c['regression']]
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} {regression['metric']}: "
+              f"{regression['baseline']:.2f} -> {regression['current']:.2f} ({regression['change']:+.1%})")
+    print(f'Report written to {args.output}.')
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
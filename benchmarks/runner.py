@@ -0,0 +1,170 @@
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+import pygame
+import pymunk
+
+from benchmarks.scenes import SCENES
+from engine.memory import tracker
+
+REPORT_VERSION = 1
+DEFAULT_FRAMES = 300
+WARMUP_FRAMES = 10
+FRAME_TIME = 1000 // 60
+COMPARED_METRICS = {'p50_ms': False, 'p95_ms': False, 'p99_ms': False, 'throughput': True}
+"""The metrics compared against a baseline, and whether higher is better for each."""
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Gets the given percentile of the values, using the nearest-rank method.
+
+    :param values: The values. Does not need to be sorted.
+    :param percent: The percentile, from 0 to 100.
+    :return: The value at the given percentile.
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_scene(name: str, count: int, frames: int = DEFAULT_FRAMES) -> dict:
+    """
+    Builds and runs the named benchmark scene, measuring every frame.
+    Should be run in its own process so peak memory isn't shared with other scenes.
+
+    :param name: The name of the scene.
+    :param count: The amount of entities to create.
+    :param frames: The amount of measured frames.
+    :return: The results of the scene.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    create, _ = SCENES[name]
+    tracemalloc.start()
+    setup_start = time.perf_counter()
+    scene = create(count)
+    setup_ms = (time.perf_counter() - setup_start) * 1000
+    for i in range(WARMUP_FRAMES):
+        scene.frame(i, FRAME_TIME)
+    # Tracing every allocation slows down the frames, so only setup and warmup are traced.
+    _, peak_python = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    frame_times = []
+    active_scene = scene.window.scenes.active
+    for i in range(frames):
+        start = time.perf_counter()
+        scene.frame(WARMUP_FRAMES + i, FRAME_TIME)
+        frame_times.append((time.perf_counter() - start) * 1000)
+        if active_scene.governor is not None:
+            active_scene.governor.record(active_scene, frame_times[-1])
+    total_ms = sum(frame_times)
+    result = {
+        'name': name,
+        'count': count,
+        'frames': frames,
+        'setup_ms': setup_ms,
+        'mean_ms': statistics.fmean(frame_times),
+        'p50_ms': percentile(frame_times, 50),
+        'p95_ms': percentile(frame_times, 95),
+        'p99_ms': percentile(frame_times, 99),
+        'max_ms': max(frame_times),
+        'fps': frames / total_ms * 1000,
+        'throughput': scene.count * frames / total_ms * 1000,
+        'peak_python_bytes': peak_python,
+        'peak_rss_bytes': _peak_rss(),
+        'surface_bytes': tracker.total()
+    }
+    if active_scene.has_physics:
+        result['physics'] = active_scene.physics.stats.as_dict()
+    if active_scene.governor is not None:
+        result['governor'] = active_scene.governor.stats.as_dict()
+    return result
+
+
+def run(names: Optional[list[str]] = None, frames: int = DEFAULT_FRAMES, scale: float = 1) -> dict:
+    """
+    Runs the given benchmark scenes, each in a fresh process.
+
+    :param names: The names of the scenes to run, or None to run all scenes.
+    :param frames: The amount of measured frames per scene.
+    :param scale: The multiplier for each scene's default amount of entities.
+    :return: The benchmark report.
+    """
+    results = []
+    for name in names or list(SCENES):
+        _, count = SCENES[name]
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            results.append(executor.submit(run_scene, name, max(1, int(count * scale)), frames).result())
+    return {
+        'version': REPORT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'pymunk': pymunk.version,
+        'platform': platform.platform(),
+        'results': results
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    Compares a report against a baseline report.
+
+    :param report: The new report.
+    :param baseline: The baseline report.
+    :param threshold: The relative change past which a metric counts as a regression (0.1 being 10%).
+    :return: A comparison for each metric of each scene present in both reports.
+    """
+    baseline_results = {result['name']: result for result in baseline['results']}
+    comparisons = []
+    for result in report['results']:
+        base = baseline_results.get(result['name'], None)
+        if base is None or base['count'] != result['count']:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if not base[metric]:
+                continue
+            change = (result[metric] - base[metric]) / base[metric]
+            worse = -change if higher_is_better else change
+            comparisons.append({
+                'name': result['name'],
+                'metric': metric,
+                'baseline': base[metric],
+                'current': result[metric],
+                'change': change,
+                'regression': worse > threshold
+            })
+    return comparisons
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save(report: dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+
+def _peak_rss() -> Optional[int]:
+    """
+    Gets the peak resident memory of the current process, if the platform supports it.
+
+    :return: The peak resident memory in bytes, or None if it's unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
@@ -0,0 +1,296 @@
+from typing import Callable, Optional
+
+import pygame
+from pygame.event import Event
+from pygame.surface import Surface
+
+from engine.entity.circle import Circle, PymunkCircle
+from engine.entity.entity import Entity
+from engine.entity.parallax import Parallax
+from engine.entity.particles import ParticleSystem
+from engine.entity.rectangle import PymunkRectangle, Rectangle
+from engine.entity.sprite import Sprite, SpriteState
+from engine.entity.string import String
+from engine.event.events import new_event
+from engine.physics.physics import Physics
+from engine.utils import random_color, rng
+from engine.window.location import Location
+from engine.window.resolution import Resolutions, Resolution
+from engine.window.window import Window
+
+BAT_PATH = 'game/assets/bat/mid_air'
+FONT_PATH = 'game/assets/font/kenpixel_mini_square.ttf'
+PARALLAX_PATH = 'game/assets/parallax/jungle'
+PARALLAX_LAYERS = 6
+SWITCH_FRAMES = 20
+"""The amount of frames between resolution switches in the resolution switch benchmark."""
+
+
+class BenchmarkScene:
+    """
+    A synthetic scene built against a headless window, run for a fixed amount of frames by the benchmark runner.
+    """
+
+    def __init__(self, window: Window, count: int, update: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Creates a new benchmark scene.
+
+        :param window: The headless window the scene was built in.
+        :param count: The amount of entities (or other units of work) the scene updates each frame.
+        :param update: Called with the frame number before each frame, or None if the scene needs no extra work.
+        """
+        self.window = window
+        self.count = count
+        self.update = update
+
+    def frame(self, index: int, delta: int) -> None:
+        """
+        Runs a single frame of the scene.
+
+        :param index: The frame number.
+        :param delta: The frame time, in milliseconds.
+        :return: None.
+        """
+        if self.update is not None:
+            self.update(index)
+        self.window.step(delta, self.window.event_handler.fetch())
+
+
+def _window(res: Resolution = Resolutions.P720.value) -> Window:
+    return Window(res, title='Benchmark', headless=True, seed=0)
+
+
+def sprites(count: int) -> BenchmarkScene:
+    """
+    Animated, moving sprites, like the platformer's bats.
+
+    :param count: The amount of sprites.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    for _ in range(count):
+        sprite = Sprite(window.res, scalar=3.5, gravity=False, default_state=SpriteState.MID_AIR)
+        sprite.add_state(SpriteState.MID_AIR, BAT_PATH, 4)
+        sprite.loc = Location.random(window.res, sprite.bounds())
+        sprite.velocity = (rng.choice((-1, 1)), 0)
+        window.entity_handler.register_entity(sprite)
+    window.entity_handler.spawn_all()
+    return BenchmarkScene(window, count)
+
+
+def physics(count: int) -> BenchmarkScene:
+    """
+    Bouncing pymunk circles inside walls, like the cannon fodder game.
+
+    :param count: The amount of circles.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    window.physics = Physics(gravity=(0, 200))
+    w, h = window.res.as_tuple()
+    for p1, p2 in (((0, 0), (w, 0)), ((0, 0), (0, h)), ((w, 0), (w, h)), ((0, h), (w, h))):
+        wall = PymunkRectangle(p1, p2, 10, window.physics)
+        window.entity_handler.register_entity(wall)
+    for _ in range(count):
+        circle = PymunkCircle(7, window.physics, random_color(), Location(rng.randint(100, w - 100),
+                                                                          rng.randint(100, h - 100)))
+        circle.body.velocity = (500, -20)
+        window.entity_handler.register_entity(circle)
+    window.entity_handler.spawn_all()
+    return BenchmarkScene(window, count)
+
+
+def collisions(count: int) -> BenchmarkScene:
+    """
+    A single sprite listening for collisions with many targets.
+
+    :param count: The amount of collision targets.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    collide_event = new_event()
+    window.event_handler.register(collide_event, _ignore)
+    player = Sprite(window.res, scalar=3.5, gravity=False, default_state=SpriteState.MID_AIR)
+    player.add_state(SpriteState.MID_AIR, BAT_PATH, 4)
+    player.loc = Location.center(window.res, player.bounds())
+    targets = []
+    for _ in range(count):
+        target = Sprite(window.res, scalar=3.5, gravity=False, default_state=SpriteState.MID_AIR)
+        target.add_state(SpriteState.MID_AIR, BAT_PATH, 4)
+        target.loc = Location.random(window.res, target.bounds())
+        targets.append(target)
+    window.entity_handler.register_entities(player, *targets)
+    window.entity_handler.listen(player, targets, collide_event)
+    window.entity_handler.spawn_all()
+    return BenchmarkScene(window, count)
+
+
+def layered_collisions(count: int) -> BenchmarkScene:
+    """
+    Many sprites in four collision categories, where players collide with enemies and pickups,
+    and projectiles with enemies, all found in the EntityHandler's single collision pass.
+
+    :param count: The amount of sprites.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    player, enemy, pickup, projectile = (1 << i for i in range(4))
+    masks = {player: enemy | pickup, enemy: player | projectile, pickup: player, projectile: enemy}
+    categories = list(masks)
+    for i in range(count):
+        sprite = Sprite(window.res, scalar=3.5, gravity=False, default_state=SpriteState.MID_AIR)
+        sprite.add_state(SpriteState.MID_AIR, BAT_PATH, 4)
+        sprite.loc = Location.random(window.res, sprite.bounds())
+        sprite.collision_category = categories[i % len(categories)]
+        sprite.collision_mask = masks[sprite.collision_category]
+        window.entity_handler.register_entity(sprite)
+    window.entity_handler.on_collision(player, enemy | pickup, _ignore_pair)
+    window.entity_handler.on_collision(projectile, enemy, _ignore_pair)
+    window.entity_handler.spawn_all()
+    return BenchmarkScene(window, count)
+
+
+def particles(count: int) -> BenchmarkScene:
+    """
+    A single particle system kept at a steady amount of falling, fading particles.
+
+    :param count: The amount of living particles.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    center = Location.center(window.res, pygame.Rect(0, 0, 0, 0))
+    system = ParticleSystem(count, palette=[random_color() for _ in range(4)], gravity=(0, 200), drag=0.2, seed=0,
+                            loc=center)
+    window.entity_handler.register_entity(system)
+    window.entity_handler.spawn_all()
+    lifetime = 1000
+    system.emit(count, life=(1, lifetime))
+
+    def update(_: int) -> None:
+        # Replaces the particles that died, about count / (lifetime / frame time) per frame.
+        system.emit(count - system.count, life=(lifetime // 2, lifetime))
+
+    return BenchmarkScene(window, count, update)
+
+
+def shapes(rasterize: bool) -> Callable[[int], BenchmarkScene]:
+    """
+    Creates a benchmark of many circles and rectangles in a few colors, like the cannon fodder game.
+
+    :param rasterize: Whether shapes are drawn with `pygame.draw` every frame, as a baseline for the shape cache.
+    :return: A function creating the benchmark scene. Its count is the amount of shapes.
+    """
+    def create(count: int) -> BenchmarkScene:
+        window = _window()
+        colors = [random_color() for _ in range(8)]
+        circle, rectangle = (_RasterCircle, _RasterRectangle) if rasterize else (Circle, Rectangle)
+        for i in range(count):
+            loc = Location(rng.randint(0, window.res.width), rng.randint(0, window.res.height))
+            if i % 2:
+                entity = rectangle(rng.randint(5, 30), rng.randint(5, 30), colors[i % len(colors)], loc)
+            else:
+                entity = circle(rng.randint(5, 15), colors[i % len(colors)], loc)
+            window.entity_handler.register_entity(entity)
+        window.entity_handler.spawn_all()
+        return BenchmarkScene(window, count)
+    return create
+
+
+def parallax(res: Resolutions) -> Callable[[int], BenchmarkScene]:
+    """
+    Creates a benchmark of a scrolling parallax background at the given resolution.
+
+    :param res: The resolution of the window and parallax.
+    :return: A function creating the benchmark scene. Its count is the amount of parallax backgrounds.
+    """
+    def create(count: int) -> BenchmarkScene:
+        window = _window(res.value)
+        for _ in range(count):
+            background = Parallax(PARALLAX_PATH, PARALLAX_LAYERS, res, scroll=2, speed=1, delta=2)
+            window.entity_handler.register_entity(background)
+        window.entity_handler.spawn_all()
+        return BenchmarkScene(window, count * PARALLAX_LAYERS)
+    return create
+
+
+def resolution_switch(count: int) -> BenchmarkScene:
+    """
+    A parallax background and anchored text, while the resolution switches between 720p and 1080p.
+    Rescaling happens in the background, so the frames around a switch should be barely slower than others.
+
+    :param count: The amount of anchored strings.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    background = Parallax(PARALLAX_PATH, PARALLAX_LAYERS, window.res, scroll=2, speed=1, delta=2)
+    window.entity_handler.register_entity(background)
+    font = pygame.font.Font(FONT_PATH, 24)
+    placements = (Location.top_left, Location.top_right, Location.center, Location.bottom_left, Location.bottom_right)
+    for i in range(count):
+        text = String(font, str(i))
+        window.entity_handler.register_entity(text)
+        window.scenes.active.layout.anchor(text, placements[i % len(placements)], (0, i // len(placements)))
+    window.entity_handler.spawn_all()
+
+    def update(frame: int) -> None:
+        if frame % SWITCH_FRAMES == 0:
+            switches = frame // SWITCH_FRAMES
+            window.set_resolution(Resolutions.P1080 if switches % 2 else Resolutions.P720)
+    return BenchmarkScene(window, count, update)
+
+
+def strings(count: int) -> BenchmarkScene:
+    """
+    Text that is re-rendered every frame, like a score counter.
+
+    :param count: The amount of strings.
+    :return: The benchmark scene.
+    """
+    window = _window()
+    font = pygame.font.Font(FONT_PATH, 24)
+    texts = []
+    for i in range(count):
+        text = String(font, '0', loc=Location(rng.randint(0, window.res.width), rng.randint(0, window.res.height)))
+        texts.append(text)
+    window.entity_handler.register_entities(*texts)
+    window.entity_handler.spawn_all()
+
+    def update(frame: int) -> None:
+        for text in texts:
+            text.set_text(str(frame))
+    return BenchmarkScene(window, count, update)
+
+
+class _RasterCircle(Circle):
+
+    def draw(self, surface: Surface) -> None:
+        pygame.draw.circle(surface, self.color, self.loc.as_tuple(), self.r)
+
+
+class _RasterRectangle(Rectangle):
+
+    def draw(self, surface: Surface) -> None:
+        pygame.draw.rect(surface, self.color, self.bounds())
+
+
+def _ignore(_: Event) -> None:
+    pass
+
+
+def _ignore_pair(_: Entity, __: Entity) -> None:
+    pass
+
+
+SCENES: dict[str, tuple[Callable[[int], BenchmarkScene], int]] = {
+    'sprites': (sprites, 500),
+    'physics': (physics, 500),
+    'collisions': (collisions, 1000),
+    'layered_collisions': (layered_collisions, 1000),
+    'strings': (strings, 200),
+    'particles': (particles, 10000),
+    'shapes': (shapes(False), 2000),
+    'shapes_raster': (shapes(True), 2000),
+    'resolution_switch': (resolution_switch, 50),
+    **{f'parallax_{res.name.lower()}': (parallax(res), 1) for res in Resolutions}
+}
+"""Every benchmark scene by name, with the default amount of entities to create."""
@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+
+TARGET = 'game.platformer'
+"""The module whose import time is measured."""
+
+FIRST_FRAME_SCRIPT = '''
+import json, time
+start = time.perf_counter()
+from game.platformer import Platformer
+imported = time.perf_counter()
+game = Platformer(autostart=False, headless=True, seed=0)
+created = time.perf_counter()
+game.window.step(1000 // game.window.fps, [])
+drawn = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_ms': (created - imported) * 1000,
+    'first_frame_ms': (drawn - created) * 1000,
+    'total_ms': (drawn - start) * 1000
+}))
+'''
+"""Run in a fresh interpreter to time the import, setup and first frame of the platformer."""
+
+
+def _environment() -> dict[str, str]:
+    env = dict(os.environ)
+    env['SDL_VIDEODRIVER'] = 'dummy'
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    return env
+
+
+def import_times(module: str = TARGET, top: int = 15) -> list[dict]:
+    """
+    Imports the module in a fresh interpreter with `python -X importtime`, and gets the slowest imports.
+
+    :param module: The module to import.
+    :param top: The amount of imports to return.
+    :return: The slowest imports by cumulative time, each with its own (self) and cumulative time in milliseconds.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             capture_output=True, text=True, env=_environment(), check=True)
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        imports.append({'module': name.strip(), 'self_ms': int(own) / 1000, 'cumulative_ms': int(cumulative) / 1000})
+    imports.sort(key=lambda entry: entry['cumulative_ms'], reverse=True)
+    return imports[:top]
+
+
+def time_to_first_frame() -> dict[str, float]:
+    """
+    Starts a fresh interpreter that imports the platformer, creates a headless game and draws its first frame.
+
+    :return: The time each phase took, plus the process time including interpreter startup, in milliseconds.
+    """
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, '-c', FIRST_FRAME_SCRIPT],
+                             capture_output=True, text=True, env=_environment(), check=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    timings = json.loads(process.stdout.strip().splitlines()[-1])
+    timings['process_ms'] = elapsed
+    return timings
+
+
+def main() -> None:
+    parser = ArgumentParser(prog='python -m benchmarks.startup', description='Measures startup time.')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to time the first frame in')
+    parser.add_argument('--top', type=int, default=15, help='slowest imports to list')
+    parser.add_argument('--output', metavar='FILE', help='also write the report as JSON to the given file')
+    args = parser.parse_args()
+
+    runs = [time_to_first_frame() for _ in range(args.runs)]
+    best = {name: min(run[name] for run in runs) for name in runs[0]}
+    report = {'first_frame': best, 'imports': import_times(top=args.top)}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    print(f'Best of {args.runs} runs:')
+    for name, value in best.items():
+        print(f'  {name:<16}{value:9.1f}ms')
+    print(f'Slowest imports of {TARGET}:')
+    for entry in report['imports']:
+        print(f"  {entry['cumulative_ms']:9.1f}ms {entry['self_ms']:9.1f}ms  {entry['module']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+import pygame.mixer
+from pygame.mixer import Channel, Sound
+
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHANNELS = 8
+
+
+class AudioManager:
+    """
+    Plays sound effects from decoded, in-memory Sounds on a fixed pool of channels.
+    When every channel is busy, the lowest priority (then oldest) sound is cut off, unless the new sound's
+    priority is lower still, in which case the new sound is dropped.
+    Long tracks should be streamed with `play_music()` instead of being decoded into memory.
+    """
+
+    def __init__(self, *, channels: int = DEFAULT_CHANNELS, enabled: bool = True) -> None:
+        """
+        Creates a new audio manager. The mixer is initialized on first use.
+
+        :param channels: The amount of sounds that can play at once.
+        :param enabled: Whether to play anything. Disabled managers never initialize the mixer, such as when headless.
+        """
+        self._channel_count = channels
+        self._enabled = enabled
+        self._channels: list[Channel] = []
+        self._playing: dict[int, tuple[int, float]] = {}
+        self._sounds: dict[str, Sound] = {}
+        self._pending: dict[str, Future] = {}
+        self._loader: Optional[ThreadPoolExecutor] = None
+        # The mixer may be initialized by the background loader while a sound is played.
+        self._init_lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def _init(self) -> None:
+        """
+        Initializes the mixer and the channel pool, if they aren't already.
+
+        :return: None.
+        """
+        with self._init_lock:
+            if self._channels:
+                return
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(self._channel_count)
+            self._channels = [Channel(i) for i in range(self._channel_count)]
+
+    def preload(self, *paths: str, background: bool = False) -> None:
+        """
+        Decodes the given sound files into memory, so playing them later never touches the disk.
+        Decoding needs the mixer, so preloading in the background initializes it in the background as well.
+
+        :param paths: The paths of the sound files.
+        :param background: Whether to decode the sounds on a background thread instead of waiting for them.
+        :return: None.
+        """
+        if not self._enabled:
+            return
+        if not background:
+            self._init()
+        for path in paths:
+            if path in self._sounds or path in self._pending:
+                continue
+            if background:
+                if self._loader is None:
+                    self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='audio')
+                self._pending[path] = self._loader.submit(self._load, path)
+            else:
+                self._sounds[path] = Sound(path)
+
+    def _load(self, path: str) -> Sound:
+        """
+        Decodes a sound file on the background loader, initializing the mixer first if it isn't already.
+
+        :param path: The path of the sound file.
+        :return: The decoded sound.
+        """
+        self._init()
+        return Sound(path)
+
+    def sound(self, path: str) -> Sound:
+        """
+        Gets the decoded sound for the given file, decoding it now if it wasn't preloaded.
+        If the sound is still being decoded in the background, waits for it.
+
+        :param path: The path of the sound file.
+        :return: The decoded sound.
+        """
+        if sound := self._sounds.get(path, None):
+            return sound
+        if future := self._pending.pop(path, None):
+            sound = future.result()
+        else:
+            logger.debug("Sound '%s' was not preloaded.", path)
+            sound = Sound(path)
+        self._sounds[path] = sound
+        return sound
+
+    def play(self, path: str, *, priority: int = 0, volume: float = 1.0, loops: int = 0) -> Optional[Channel]:
+        """
+        Plays the sound on a free channel, or steals one from a sound of lower or equal priority.
+
+        :param path: The path of the sound file.
+        :param priority: The priority of the sound. Higher priority sounds cut off lower priority sounds.
+        :param volume: The volume to play the sound at, from 0 to 1.
+        :param loops: The amount of times to repeat the sound after the first time, or -1 to repeat it forever.
+        :return: The channel the sound is playing on, or None if it was dropped (or the manager is disabled).
+        """
+        if not self._enabled:
+            return None
+        self._init()
+        sound = self.sound(path)
+        index = self._free_channel(priority)
+        if index is None:
+            logger.debug("Dropped sound '%s', all channels are playing higher priority sounds.", path)
+            return None
+        channel = self._channels[index]
+        channel.set_volume(volume)
+        channel.play(sound, loops)
+        self._playing[index] = (priority, time.perf_counter())
+        return channel
+
+    def play_music(self, path: str, *, volume: float = 1.0, loops: int = -1) -> None:
+        """
+        Streams a long track from disk, such as background music. Only one track plays at a time.
+
+        :param path: The path of the music file.
+        :param volume: The volume to play the track at, from 0 to 1.
+        :param loops: The amount of times to repeat the track after the first time, or -1 to repeat it forever.
+        :return: None.
+        """
+        if not self._enabled:
+            return
+        self._init()
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+    def stop(self) -> None:
+        """
+        Stops every sound and the music.
+
+        :return: None.
+        """
+        if not self._channels:
+            return
+        pygame.mixer.stop()
+        pygame.mixer.music.stop()
+        self._playing.clear()
+
+    def close(self) -> None:
+        """
+        Stops everything and releases the decoded sounds.
+
+        :return: None.
+        """
+        self.stop()
+        if self._loader is not None:
+            self._loader.shutdown(wait=True, cancel_futures=True)
+            self._loader = None
+        self._pending.clear()
+        self._sounds.clear()
+
+    def _free_channel(self, priority: int) -> Optional[int]:
+        """
+        Finds a channel to play a sound of the given priority on.
+
+        :param priority: The priority of the sound.
+        :return: The index of an idle channel, or of the lowest priority and oldest busy channel if its priority
+        isn't higher than the given priority, otherwise None.
+        """
+        victim = None
+        for index, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return index
+            playing = self._playing.get(index, (0, 0.0))
+            if victim is None or playing < self._playing.get(victim, (0, 0.0)):
+                victim = index
+        if victim is None or self._playing.get(victim, (0, 0.0))[0] > priority:
+            return None
+        self._channels[victim].stop()
+        return victim
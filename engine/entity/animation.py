@@ -0,0 +1,234 @@
+from concurrent.futures import Future
+from typing import Sequence, Union
+
+from pygame.surface import Surface
+
+from engine.entity.entity import EntityError
+from engine.memory import tracker
+from engine.window.scaling import scaler
+
+DEFAULT_FRAME_TIME = 42
+"""The default time each frame is shown for, in milliseconds (roughly 24 frames per second)."""
+
+
+class AnimationClip:
+    """
+    An immutable sequence of frames, each with a duration in milliseconds.
+    Clips hold no playback state, so a single clip can be shared by any number of entities.
+    """
+
+    __slots__ = ('_frames', '_durations', '_length')
+
+    _cache: dict[tuple[str, int, float, int], 'AnimationClip'] = {}
+    _pending: dict[tuple[str, int, float, int], 'Future[AnimationClip]'] = {}
+
+    def __init__(self, frames: Sequence[Surface], duration: Union[int, Sequence[int]] = DEFAULT_FRAME_TIME) -> None:
+        """
+        Creates a new animation clip.
+
+        :param frames: The frames of the clip, in order.
+        :param duration: The time each frame is shown for in milliseconds, either one value for all or one per frame.
+        :raise EntityError: Raised if there are no frames, or the durations don't match the frames.
+        """
+        if not frames:
+            raise EntityError('An animation clip requires at least one frame.')
+        durations = (duration,) * len(frames) if isinstance(duration, int) else tuple(duration)
+        if len(durations) != len(frames):
+            raise EntityError(f'Got {len(durations)} frame durations for {len(frames)} frames.')
+        if min(durations) <= 0:
+            raise EntityError('Frame durations must be positive.')
+        self._frames = tuple(frames)
+        self._durations = durations
+        self._length = sum(durations)
+
+    @property
+    def frames(self) -> tuple[Surface, ...]:
+        return self._frames
+
+    @property
+    def durations(self) -> tuple[int, ...]:
+        return self._durations
+
+    @property
+    def length(self) -> int:
+        """
+        Gets the total duration of the clip.
+
+        :return: The total duration of the clip, in milliseconds.
+        """
+        return self._length
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @staticmethod
+    def load(path: str, count: int, *, scalar: float = 1, duration: int = DEFAULT_FRAME_TIME) -> 'AnimationClip':
+        """
+        Loads the frames `{path}/0.png` to `{path}/{count - 1}.png`, scaled by the given scalar.
+        Clips are cached, so loading the same frames again returns the already-loaded clip.
+        Frames are scaled from the originals kept by the asset scaler, if they're acquired (see `AssetScaler`).
+
+        :param path: The directory of the frames.
+        :param count: The amount of frames.
+        :param scalar: The amount to scale each frame by.
+        :param duration: The time each frame is shown for, in milliseconds.
+        :return: The loaded (or cached) animation clip.
+        """
+        key = (path, count, scalar, duration)
+        if clip := AnimationClip._cache.get(key, None):
+            return clip
+        frames = []
+        for frame in AnimationClip.frame_paths(path, count):
+            frames.append(tracker.track(scaler.scale(frame, scaler.scaled_size(frame, scalar)), frame))
+        clip = AnimationClip(frames, duration)
+        AnimationClip._cache[key] = clip
+        return clip
+
+    @staticmethod
+    def rescale(path: str,
+                count: int,
+                *,
+                scalar: float = 1,
+                duration: int = DEFAULT_FRAME_TIME) -> 'Future[AnimationClip]':
+        """
+        Loads the same frames as `load()` with the frames scaled on the asset scaler's background thread,
+        such as when the resolution changes. Entities rescaling the same clip share a single rescale.
+
+        :param path: The directory of the frames.
+        :param count: The amount of frames.
+        :param scalar: The amount to scale each frame by.
+        :param duration: The time each frame is shown for, in milliseconds.
+        :return: A future of the loaded (or cached) animation clip.
+        """
+        key = (path, count, scalar, duration)
+        if future := AnimationClip._pending.get(key, None):
+            return future
+        future = Future()
+        if clip := AnimationClip._cache.get(key, None):
+            future.set_result(clip)
+            return future
+        paths = AnimationClip.frame_paths(path, count)
+        scaled = scaler.rescale([(frame, scaler.scaled_size(frame, scalar)) for frame in paths])
+
+        def done(frames: 'Future[list[Surface]]') -> None:
+            # Runs on the scaler's thread. Cached before it stops being pending, so the clip is never rescaled twice.
+            if error := frames.exception():
+                AnimationClip._pending.pop(key, None)
+                future.set_exception(error)
+                return
+            clip = AnimationClip([tracker.track(frame, name) for frame, name in zip(frames.result(), paths)], duration)
+            AnimationClip._cache[key] = clip
+            AnimationClip._pending.pop(key, None)
+            future.set_result(clip)
+
+        AnimationClip._pending[key] = future
+        scaled.add_done_callback(done)
+        return future
+
+    @staticmethod
+    def frame_paths(path: str, count: int) -> list[str]:
+        """
+        Gets the paths of the frames loaded by `load()`.
+
+        :param path: The directory of the frames.
+        :param count: The amount of frames.
+        :return: The path of each frame.
+        """
+        return [f'{path}/{i}.png' for i in range(count)]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears the loaded clip cache. Clips that are still in use are unaffected.
+
+        :return: None.
+        """
+        AnimationClip._cache.clear()
+
+
+class AnimationCursor:
+    """
+    The playback state of a single entity playing an AnimationClip.
+    Playback is time-based, so the animation plays at the same speed regardless of frame rate.
+    """
+
+    __slots__ = ('_clip', '_index', '_elapsed')
+
+    def __init__(self, clip: AnimationClip) -> None:
+        self._clip = clip
+        self._index = 0
+        self._elapsed = 0
+
+    @property
+    def clip(self) -> AnimationClip:
+        return self._clip
+
+    @clip.setter
+    def clip(self, value: AnimationClip) -> None:
+        """
+        Sets the clip being played and restarts playback.
+
+        :param value: The new clip.
+        :return: None.
+        """
+        self._clip = value
+        self.reset()
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def elapsed(self) -> int:
+        """
+        Gets the time the current frame has been shown for, in milliseconds.
+
+        :return: The time the current frame has been shown for.
+        """
+        return self._elapsed
+
+    @property
+    def frame(self) -> Surface:
+        return self._clip.frames[self._index]
+
+    def advance(self, delta: int) -> None:
+        """
+        Advances playback by the given amount of time, looping back to the first frame at the end of the clip.
+
+        :param delta: The time to advance by, in milliseconds.
+        :return: None.
+        """
+        elapsed = self._elapsed + delta
+        if elapsed >= self._clip.length:
+            # Whole loops of the clip end on the same frame, so skip them.
+            elapsed %= self._clip.length
+        durations = self._clip.durations
+        index = self._index
+        while elapsed >= durations[index]:
+            elapsed -= durations[index]
+            index = index + 1 if index < len(durations) - 1 else 0
+        self._index = index
+        self._elapsed = elapsed
+
+    def seek(self, index: int, elapsed: int = 0) -> None:
+        """
+        Moves playback to the given frame.
+
+        :param index: The index of the frame.
+        :param elapsed: The time the frame has already been shown for, in milliseconds.
+        :return: None.
+        :raise EntityError: Raised if the index is out of range for the clip.
+        """
+        if not 0 <= index < len(self._clip):
+            raise EntityError(f'Given index {index} out of range for size {len(self._clip)}')
+        self._index = index
+        self._elapsed = elapsed
+
+    def reset(self) -> None:
+        """
+        Restarts playback from the first frame.
+
+        :return: None.
+        """
+        self._index = 0
+        self._elapsed = 0
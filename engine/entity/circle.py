@@ -1,10 +1,13 @@
-import pygame.draw
+from typing import Any, Iterator, Optional
+
+import pygame
 import pymunk
 from pygame import Rect, Color
 from pygame.surface import Surface
-from pymunk import Space
 
+from engine.entity import shapes
 from engine.entity.entity import Entity
+from engine.physics.physics import Physics
 from engine.utils import BLACK
 from engine.window.location import Location
 
@@ -14,17 +17,16 @@ class Circle(Entity):
     Represents a circle entity.
     """
 
-    def __init__(self, r: int, color: Color = BLACK, loc: Location = Location(0, 0)):
+    def __init__(self, r: int, color: Color = BLACK, loc: Optional[Location] = None):
         super().__init__(loc)
+        self._sprite: Optional[Surface] = None
         self.r = r
         self.color = color
 
-    def tick(self, tick_count: int) -> None:
-        # Method is empty as we do not need to update our location each tick - we're a static body.
-        pass
-
     def draw(self, surface: Surface) -> None:
-        pygame.draw.circle(surface, self.color, self.loc.as_tuple(), self.r)
+        if self._sprite is None:
+            self._sprite = shapes.circle(self._r, self._color)
+        surface.blit(self._sprite, (self.loc.x - self._r, self.loc.y - self._r))
 
     def on_load(self) -> None:
         # Method is empty as we do not need to load any resources beforehand.
@@ -33,43 +35,109 @@ class Circle(Entity):
     def bounds(self) -> Rect:
         return pygame.Rect(self.loc.x, self.loc.y, self.r, self.r)
 
+    @property
+    def r(self) -> int:
+        return self._r
+
+    @r.setter
+    def r(self, r: int) -> None:
+        self._r = r
+        self._sprite = None
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        """
+        Sets the color of the circle. Colors should be replaced rather than changed in place,
+        as the circle's cached surface is only refreshed when a color is set.
+
+        :param color: The new color.
+        :return: None.
+        """
+        self._color = color
+        self._sprite = None
+
 
 class PymunkCircle(Entity):
     """
     Represents a circle entity with elasticity, gravity, and a dynamic body.
     """
 
-    def __init__(self, r: int, space: Space, color: Color = BLACK, loc: Location = Location(0, 0)):
+    def __init__(self, r: int, physics: Physics, color: Color = BLACK, loc: Optional[Location] = None):
         super().__init__(loc)
+        self._sprite: Optional[Surface] = None
         self.r = r
         self.color = color
-        self._space = space
+        self._physics = physics
         self.body = pymunk.Body(1, 100, pymunk.Body.DYNAMIC)
         self.shape = pymunk.Circle(self.body, r)
         self.shape.elasticity = 1
-        self.body.position = loc.as_tuple()
-
-    def tick(self, tick_count: int) -> None:
-        # Method is empty because our Window handles updating Pymunk objects.
-        pass
+        self.body.position = self.loc.as_tuple()
 
     def draw(self, surface: Surface) -> None:
-        pygame.draw.circle(surface, self.color, self.body.position, self.r)
+        if self._sprite is None:
+            self._sprite = shapes.circle(self._r, self._color)
+        surface.blit(self._sprite, (self.loc.x - self._r, self.loc.y - self._r))
 
     def on_load(self) -> None:
         # Method is empty as we do not need to load any resources beforehand.
         pass
 
     def bounds(self) -> Rect:
-        return pygame.Rect(self.body.position.x, self.body.position.y, self.r, self.r)
+        return pygame.Rect(self.loc.x, self.loc.y, self.r, self.r)
+
+    @property
+    def r(self) -> int:
+        return self._r
+
+    @r.setter
+    def r(self, r: int) -> None:
+        self._r = r
+        self._sprite = None
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        """
+        Sets the color of the circle. Colors should be replaced rather than changed in place,
+        as the circle's cached surface is only refreshed when a color is set.
+
+        :param color: The new color.
+        :return: None.
+        """
+        self._color = color
+        self._sprite = None
+
+    def state_format(self) -> str:
+        return super().state_format() + 'dddddd'
+
+    def save_state(self) -> tuple:
+        body = self.body
+        return super().save_state() + (*body.position, *body.velocity, body.angle, body.angular_velocity)
+
+    def load_state(self, state: Iterator[Any]) -> None:
+        super().load_state(state)
+        body = self.body
+        body.position = (next(state), next(state))
+        body.velocity = (next(state), next(state))
+        body.angle = next(state)
+        body.angular_velocity = next(state)
+        if body.space is not None:
+            body.activate()
 
     def spawn(self) -> None:
         super().spawn()
-        self._space.add(self.body, self.shape)
+        self._physics.add(self)
 
     def remove(self) -> None:
         super().remove()
-        self._space.remove(self.body, self.shape)
+        self._physics.remove(self)
 
     @Entity.loc.setter
     def loc(self, loc: Location) -> None:
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
 
 import pygame.event
 from pygame import Rect
 from pygame.surface import Surface
 
 from engine.entity.render_priority import RenderPriority, Priority
+from engine.entity.spatial import SpatialGrid, DEFAULT_CELL_SIZE
+from engine.log import get_logger
+from engine.memory import tracker
 from engine.window.location import Location
+from engine.window.render import RenderBuffer
+from engine.window.resolution import Resolution
+
+logger = get_logger(__name__)
+
+E = TypeVar('E', bound='Entity')
 
 
 class Entity(ABC):
@@ -15,26 +24,39 @@ class Entity(ABC):
     An entity is anything that can be drawn to the screen or interacted with through the window.
     """
 
-    def __init__(self, loc: Location = Location(0, 0), priority: Union[int, RenderPriority, Priority] = 10) -> None:
-        self._loc = loc
+    def __init__(self, loc: Optional[Location] = None, priority: Union[int, RenderPriority, Priority] = 10) -> None:
+        # Each entity gets its own location by default, as locations are mutable.
+        self._loc = loc if loc is not None else Location(0, 0)
         self._loaded = False
         self._visible = False
         self._removed = False
         self._should_remove = False
+        self._handler: Optional['EntityHandler'] = None
+        self._collision_category = 0
+        self._collision_mask = 0
         if isinstance(priority, RenderPriority | Priority):
             self._priority = priority if isinstance(priority, RenderPriority) else priority.value
         else:
             self._priority = RenderPriority(priority)
 
-    @abstractmethod
-    def tick(self, tick_count: int) -> None:
+    def tick(self, delta: int) -> None:
         """
         Ticks the Entity, telling it to update its state.
+        Entities that don't override this are static, and are never ticked by the EntityHandler.
 
-        :param tick_count: The current tick represented as an integer.
+        :param delta: The time elapsed since the last tick, in milliseconds.
         :return: None.
         """
-        ...
+        pass
+
+    @property
+    def ticks(self) -> bool:
+        """
+        Checks if the Entity needs to be ticked, which is the case if its class overrides `tick()`.
+
+        :return: True if the Entity is ticked every frame, False if it's static.
+        """
+        return type(self).tick is not Entity.tick
 
     @abstractmethod
     def draw(self, surface: Surface) -> None:
@@ -46,6 +68,16 @@ class Entity(ABC):
         """
         ...
 
+    def render(self, buffer: RenderBuffer) -> None:
+        """
+        Tells the Entity to record its draw calls to the given RenderBuffer, to be drawn later.
+        By default, this calls draw() with the buffer, which works for entities that only blit surfaces.
+
+        :param buffer: The buffer to record to.
+        :return: None.
+        """
+        self.draw(buffer)
+
     @abstractmethod
     def on_load(self) -> None:
         """
@@ -64,6 +96,39 @@ class Entity(ABC):
         """
         ...
 
+    def state_format(self) -> str:
+        """
+        Gets the `struct` format of the Entity's state, one character per value of `save_state()`.
+        Subclasses with more state append their own values to their parent's format.
+
+        :return: The format of the Entity's state, without a byte order.
+        """
+        return 'dd?i'
+
+    def save_state(self) -> tuple:
+        """
+        Gets the Entity's state: its location, visibility and render priority, plus anything subclasses add.
+        Used by `SnapshotBuffer` to save and restore entities without re-creating them.
+
+        :return: The state values, matching `state_format()`.
+        """
+        return self._loc.x, self._loc.y, self._visible, self._priority.priority
+
+    def load_state(self, state: Iterator[Any]) -> None:
+        """
+        Restores state saved by `save_state()`. Each class takes its own values from the iterator,
+        after its parent has taken theirs.
+
+        :param state: The state values, in the order of `state_format()`.
+        :return: None.
+        """
+        self._loc.x = _number(next(state))
+        self._loc.y = _number(next(state))
+        self._visible = next(state)
+        priority = next(state)
+        if priority != self._priority.priority:
+            self.priority = priority
+
     @property
     def loc(self) -> Location:
         """
@@ -82,6 +147,19 @@ class Entity(ABC):
         :return: None.
         """
         self._loc = loc if isinstance(loc, Location) else Location(loc[0], loc[1])
+        self.bounds_changed()
+
+    def bounds_changed(self) -> None:
+        """
+        Tells the EntityHandler that the bounding box of the Entity changed, so it's re-indexed before the next query.
+        Ticking entities are re-indexed anyway, but static entities are only re-indexed when this is called.
+        Setting `loc` calls this, entities that change size and code moving a static entity's location in place
+        (such as with `loc.add()`) should call it too.
+
+        :return: None.
+        """
+        if self._handler is not None:
+            self._handler._moved(self)
 
     @property
     def priority(self) -> RenderPriority:
@@ -100,6 +178,50 @@ class Entity(ABC):
         else:
             self._priority = RenderPriority(priority)
 
+    @property
+    def collision_category(self) -> int:
+        return self._collision_category
+
+    @collision_category.setter
+    def collision_category(self, value: int) -> None:
+        """
+        Sets the collision categories the Entity belongs to, as a bitfield.
+        Entities without categories and mask (the default) are left out of the EntityHandler's collision pass.
+
+        :param value: The categories of the Entity, such as `1 << 2`.
+        :return: None.
+        """
+        self._collision_category = value
+        if self._handler is not None:
+            self._handler._update_collider(self)
+
+    @property
+    def collision_mask(self) -> int:
+        return self._collision_mask
+
+    @collision_mask.setter
+    def collision_mask(self, value: int) -> None:
+        """
+        Sets the collision categories the Entity collides with, as a bitfield.
+        Two entities only collide if each one's mask contains one of the other's categories.
+
+        :param value: The categories the Entity collides with.
+        :return: None.
+        """
+        self._collision_mask = value
+        if self._handler is not None:
+            self._handler._update_collider(self)
+
+    def can_collide(self, entity: 'Entity') -> bool:
+        """
+        Checks if the collision categories and masks of both entities allow them to collide.
+
+        :param entity: The other entity.
+        :return: True if each entity's mask contains one of the other's categories, False otherwise.
+        """
+        return bool(self._collision_mask & entity._collision_category
+                    and entity._collision_mask & self._collision_category)
+
     @property
     def visible(self) -> bool:
         return self._visible
@@ -133,8 +255,12 @@ class Entity(ABC):
 
         :return: None.
         """
+        if self._should_remove:
+            return
         self._should_remove = True
-        print(f"Entity '{type(self).__name__}' marked for disposal.")
+        if self._handler is not None:
+            self._handler._disposed.append(self)
+        logger.debug("Entity '%s' marked for disposal.", type(self).__name__)
 
     def remove(self) -> None:
         """
@@ -149,7 +275,8 @@ class Entity(ABC):
         self._visible = False
         self._removed = True
         self._loaded = False
-        print(f"Entity '{type(self).__name__}' removed.")
+        tracker.removed(self)
+        logger.debug("Entity '%s' removed.", type(self).__name__)
 
     def spawn(self) -> None:
         """
@@ -162,10 +289,24 @@ class Entity(ABC):
             self.on_load()
             self._loaded = True
             self._visible = True
+            self.bounds_changed()
+
+    def on_resize(self, old: Resolution, new: Resolution) -> None:
+        """
+        Called when the window's resolution changes, for entities whose assets depend on the resolution.
+        Rescaling should be done in the background (see `AssetScaler.rescale()`), drawing the current assets
+        until the rescaled ones are ready, so changing resolution doesn't stall the frame loop.
+
+        :param old: The previous resolution.
+        :param new: The new resolution.
+        :return: None.
+        """
+        pass
 
     def clicked_on(self, mouse_pos: tuple[int, int]) -> bool:
         """
         Checks if the Entity was clicked on, given the mouse position.
+        To find which entity was clicked on, use `EntityHandler.query_point()` rather than checking every entity.
 
         :param mouse_pos: The coordinates of the mouse as a tuple (x, y)
         :return: True if the Entity collides with the given mouse position, false otherwise.
@@ -185,35 +326,61 @@ class Entity(ABC):
 class EntityHandler:
     """
     Represents an Entity registry and handles passive Entity states.
+    Entities are kept in draw lists by render priority, and entities that tick are also kept in an update list,
+    so static entities (such as text and backgrounds) cost nothing per tick until they're disposed.
     """
 
-    def __init__(self):
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        """
+        Creates a new entity handler.
+
+        :param cell_size: The size of the cells of the spatial index used by the query methods, in pixels.
+        """
         self._entities: dict[int, list[Entity]] = {}
+        self._updating: dict[Entity, None] = {}
+        self._static: dict[Entity, None] = {}
+        self._disposed: list[Entity] = []
+        self._colliders: dict[Entity, None] = {}
+        self._collision_callbacks: list[tuple[int, int, Callable[[Entity, Entity], None]]] = []
+        self._updating_moved = False
+        self._moved_static: dict[Entity, None] = {}
         self._collision_listeners: list[CollisionListener] = []
+        self._grid = SpatialGrid(cell_size)
+        self._tags: dict[str, dict[Entity, None]] = {}
+        self._types: dict[type, dict[Entity, None]] = {}
+        self._entity_tags: dict[Entity, set[str]] = {}
+        self.spawn_limit: Optional[int] = None
+        """The most entities a game should have active at once, or None for no limit. See `can_spawn()`."""
+
+    def __iter__(self) -> Iterator[Entity]:
+        for entity_list in list(self._entities.values()):
+            yield from list(entity_list)
 
-    def tick(self, tick_count: int) -> None:
+    def tick(self, delta: int) -> None:
         """
-        Ticks all registered entities.
+        Ticks all registered entities that aren't static.
         Also checks:
         - If any entity's render priorities have changed, if true, will be re-sorted.
-        - If any entity is marked as disposed, if true, will remove the entity.
+        - If any entity was disposed, if true, will remove the entity along with its collision listeners.
+        Ticked entities are moved to their new place in the spatial index before the next query, if there is one.
 
-        :param tick_count: The current tick count.
+        :param delta: The time elapsed since the last tick, in milliseconds.
         :return: None.
         """
         for listener in self._collision_listeners:
             listener.collision_check()
+        if self._colliders and self._collision_callbacks:
+            self._collide()
 
         if self._check_dirty():
             self._clean()
 
-        for _, entity_list in self._entities.items():
-            for entity in entity_list:
-                if entity.should_remove():
-                    entity.remove()
-                    entity_list.remove(entity)
-                    continue
-                entity.tick(tick_count)
+        if self._disposed:
+            self._remove_disposed()
+
+        for entity in list(self._updating):
+            entity.tick(delta)
+        self._updating_moved = True
 
     def draw(self, surface: Surface) -> None:
         """
@@ -228,30 +395,272 @@ class EntityHandler:
                 if entity.should_draw():
                     entity.draw(surface)
 
-    def register_entities(self, *args: Entity) -> None:
+    def render(self, buffer: RenderBuffer) -> None:
+        """
+        Records the draw calls of all registered entities to the given buffer, in the order they would be drawn.
+        If the entity is invisible or should not be drawn, it will be skipped over.
+
+        :param buffer: The buffer to record to.
+        :return: None.
+        """
+        for priority, entity_list in self._entities.items():
+            buffer.layer = priority
+            for entity in entity_list:
+                if entity.should_draw():
+                    entity.render(buffer)
+
+    def query_point(self, pos: tuple[int, int], *, visible_only: bool = True) -> list[Entity]:
+        """
+        Finds the entities whose bounding box contains the given point, such as the entities under the mouse.
+        Uses the spatial index, which is brought up to date first.
+
+        :param pos: The point as a tuple (x, y).
+        :param visible_only: Whether to only find entities that are drawn.
+        :return: The entities containing the point, the one drawn on top first.
+        """
+        self._index()
+        return self._topmost(self._grid.query_point(pos), visible_only)
+
+    def query_rect(self, rect: Rect, *, visible_only: bool = True) -> list[Entity]:
+        """
+        Finds the entities whose bounding box overlaps the given rectangle, such as the entities on screen.
+        Uses the spatial index, which is brought up to date first.
+
+        :param rect: The rectangle to search.
+        :param visible_only: Whether to only find entities that are drawn.
+        :return: The overlapping entities, the one drawn on top first.
+        """
+        self._index()
+        return self._topmost(self._grid.query_rect(rect), visible_only)
+
+    def nearest(self,
+                pos: tuple[int, int],
+                count: int = 1,
+                *,
+                max_distance: Optional[float] = None,
+                predicate: Optional[Callable[[Entity], bool]] = None,
+                visible_only: bool = True) -> list[Entity]:
+        """
+        Finds the entities closest to the given point, by the distance to the edge of their bounding box.
+        Uses the spatial index, which is brought up to date first.
+
+        :param pos: The point as a tuple (x, y).
+        :param count: The most entities to find.
+        :param max_distance: The greatest distance to search, or None for no limit.
+        :param predicate: Only entities for which this returns True are found, or None to find any entity.
+        :param visible_only: Whether to only find entities that are drawn.
+        :return: The closest entities, closest first.
+        """
+        def accept(entity: Entity) -> bool:
+            if visible_only and not entity.should_draw():
+                return False
+            return predicate is None or predicate(entity)
+
+        self._index()
+        return self._grid.nearest(pos, count, max_distance=max_distance, predicate=accept)
+
+    def on_collision(self, first: int, second: int, callback: Callable[[Entity, Entity], None]) -> None:
+        """
+        Calls the callback every tick for each pair of colliding entities where one entity is in (one of) the first
+        categories and the other in the second categories. The entity in the first categories is passed first.
+        Only entities whose categories and masks allow them to collide are tested, see `Entity.can_collide()`.
+        Like a CollisionListener, hidden entities still collide, only removed (or not yet spawned) ones are skipped.
+
+        :param first: The categories of the first entity of a pair, as a bitfield.
+        :param second: The categories of the second entity of a pair, as a bitfield.
+        :param callback: Called with both entities of each colliding pair.
+        :return: None.
+        """
+        self._collision_callbacks.append((first, second, callback))
+
+    def collisions(self) -> list[tuple[Entity, Entity]]:
+        """
+        Finds every pair of colliding entities in a single pass, using the spatial index as a broad phase,
+        so only nearby entities are tested and only if their categories and masks allow them to collide.
+
+        :return: The colliding pairs, each pair only once.
+        """
+        colliders: dict[Entity, tuple[int, Rect]] = {}
+        for i, entity in enumerate(self._colliders):
+            if entity._loaded and not entity._removed:
+                bounds = entity.bounds()
+                # Colliders may have been moved by events since they were ticked.
+                self._grid.update(entity, bounds)
+                colliders[entity] = (i, bounds)
+        pairs = []
+        for entity, (i, bounds) in colliders.items():
+            for other in self._grid.candidates(bounds):
+                entry = colliders.get(other, None)
+                if entry is None or entry[0] <= i or not entity.can_collide(other):
+                    continue
+                if bounds.colliderect(entry[1]):
+                    pairs.append((entity, other))
+        return pairs
+
+    def _collide(self) -> None:
+        """
+        Calls the collision callbacks of every colliding pair of entities.
+
+        :return: None.
+        """
+        for entity, other in self.collisions():
+            for first, second, callback in self._collision_callbacks:
+                if entity.collision_category & first and other.collision_category & second:
+                    callback(entity, other)
+                elif other.collision_category & first and entity.collision_category & second:
+                    callback(other, entity)
+
+    def _update_collider(self, entity: Entity) -> None:
+        """
+        Adds the entity to the collision pass if it has collision categories or a mask, or removes it otherwise.
+
+        :param entity: The registered entity.
+        :return: None.
+        """
+        if entity.collision_category or entity.collision_mask:
+            self._colliders[entity] = None
+        else:
+            self._colliders.pop(entity, None)
+
+    def _moved(self, entity: Entity) -> None:
+        """
+        Notes that the bounding box of the entity changed, so it's re-indexed before the next query.
+
+        :param entity: The registered entity.
+        :return: None.
+        """
+        if entity in self._static:
+            self._moved_static[entity] = None
+        else:
+            self._updating_moved = True
+
+    def _index(self) -> None:
+        """
+        Moves the entities that may have moved since the last query to their current place in the spatial index:
+        every ticking entity if there was a tick (or one of them was moved), and the static entities that were moved.
+        Indexing is left to the queries, so frames without queries don't pay for it.
+
+        :return: None.
+        """
+        if self._updating_moved:
+            for entity in self._updating:
+                if entity._loaded:
+                    self._grid.update(entity)
+            self._updating_moved = False
+        if self._moved_static:
+            for entity in self._moved_static:
+                if entity._loaded:
+                    self._grid.update(entity)
+            self._moved_static.clear()
+
+    @staticmethod
+    def _topmost(entities: list[Entity], visible_only: bool) -> list[Entity]:
+        if visible_only:
+            entities = [entity for entity in entities if entity.should_draw()]
+        return sorted(entities, key=lambda entity: entity.priority.priority, reverse=True)
+
+    def can_spawn(self, active: int) -> bool:
+        """
+        Checks if the game may spawn another entity, given how many of its (pooled or spawned) entities are active.
+        Games that spawn entities over time should check this, so the spawn limit can be lowered under load.
+
+        :param active: The amount of currently active entities the limit applies to.
+        :return: True if another entity may be spawned, False otherwise.
+        """
+        return self.spawn_limit is None or active < self.spawn_limit
+
+    def register_entities(self, *args: Entity, tags: Iterable[str] = ()) -> None:
         """
         Registers the given entities, sorted by their render priority.
 
         :param args: The entities to register.
+        :param tags: The tags to give every one of the entities.
         :return: None.
         """
         for entity in args:
-            priority = entity.priority.priority
-            entity_list = self._entities.get(priority, [])
-            entity_list.append(entity)
-            self._entities[priority] = entity_list
+            self.register_entity(entity, *tags)
 
-    def register_entity(self, entity: Entity) -> None:
+    def register_entity(self, entity: Entity, *tags: str) -> None:
         """
         Registers the given entity, sorted by their render priority.
 
         :param entity: The entity to register.
+        :param tags: The tags to give the entity, see `group()`.
         :return: None.
         """
         priority = entity.priority.priority
         entity_list = self._entities.get(priority, [])
         entity_list.append(entity)
         self._entities[priority] = entity_list
+        if entity.ticks:
+            self._updating[entity] = None
+            self._updating_moved = True
+        else:
+            self._static[entity] = None
+            self._moved_static[entity] = None
+        self._types.setdefault(type(entity), {})[entity] = None
+        self.tag(entity, *tags)
+        entity._handler = self
+        self._update_collider(entity)
+        if entity._should_remove and not entity._removed:
+            self._disposed.append(entity)
+
+    def tag(self, entity: Entity, *tags: str) -> None:
+        """
+        Adds the registered entity to the groups of the given tags.
+
+        :param entity: The entity to tag.
+        :param tags: The tags to give the entity.
+        :return: None.
+        """
+        for tag in tags:
+            self._tags.setdefault(tag, {})[entity] = None
+        if tags:
+            self._entity_tags.setdefault(entity, set()).update(tags)
+
+    def untag(self, entity: Entity, *tags: str) -> None:
+        """
+        Removes the entity from the groups of the given tags.
+
+        :param entity: The entity to untag.
+        :param tags: The tags to remove from the entity.
+        :return: None.
+        """
+        entity_tags = self._entity_tags.get(entity, set())
+        for tag in tags:
+            self._tags.get(tag, {}).pop(entity, None)
+            entity_tags.discard(tag)
+        if not entity_tags:
+            self._entity_tags.pop(entity, None)
+
+    def group(self, tag: str) -> list[Entity]:
+        """
+        Gets the registered entities with the given tag, in the order they were tagged.
+        Removed entities leave their groups, so the group never has to be filtered.
+
+        :param tag: The tag of the group.
+        :return: A copy of the group, empty if no entity has the tag.
+        """
+        return list(self._tags.get(tag, ()))
+
+    def of_type(self, cls: type[E]) -> list[E]:
+        """
+        Gets the registered entities that are instances of the given class, including its subclasses.
+
+        :param cls: The entity class.
+        :return: The entities of the class, grouped by their exact class.
+        """
+        return [entity for entity_type, entities in self._types.items() if issubclass(entity_type, cls)
+                for entity in entities]
+
+    def tags_of(self, entity: Entity) -> set[str]:
+        """
+        Gets the tags of the given entity.
+
+        :param entity: The entity.
+        :return: A copy of the entity's tags.
+        """
+        return set(self._entity_tags.get(entity, ()))
 
     def spawn_all(self) -> None:
         """
@@ -276,20 +685,28 @@ class EntityHandler:
     def remove_all(self) -> None:
         """
         Removes all registered entities, regardless if they're marked for disposal.
+        Entities that were never spawned are skipped.
 
         :return: None.
         """
         for _, entity_list in self._entities.items():
             for entity in entity_list:
-                entity.remove()
+                if entity._loaded and not entity._removed:
+                    entity.remove()
+        self._collision_listeners.clear()
+        self._grid.clear()
+        self._clear_indices()
 
     def clear(self) -> None:
         """
-        Clears all entities. Does not call `Entity.dispose()` or `Entity.remove()`.
+        Clears all entities and collision listeners. Does not call `Entity.dispose()` or `Entity.remove()`.
 
         :return: None.
         """
         self._entities.clear()
+        self._collision_listeners.clear()
+        self._grid.clear()
+        self._clear_indices()
 
     def _check_dirty(self) -> bool:
         """
@@ -311,7 +728,7 @@ class EntityHandler:
         """
         dirty = []
         for _, entities in self._entities.items():
-            for entity in entities:
+            for entity in list(entities):
                 if entity.priority.dirty:
                     dirty.append(entity)
                     entities.remove(entity)
@@ -321,23 +738,195 @@ class EntityHandler:
             self._entities[entity.priority.priority] = entity_list
             entity.priority.clean()
 
-    def listen(self, entity: Entity, collides_with: list[Entity], event_id: int) -> None:
-        self._collision_listeners.append(CollisionListener(entity, collides_with, event_id))
+    @property
+    def listeners(self) -> list['CollisionListener']:
+        """
+        Gets the registered collision listeners.
+
+        :return: A copy of the list of collision listeners.
+        """
+        return list(self._collision_listeners)
+
+    def listen(self, entity: Entity, collides_with: Union[list[Entity], str], event_id: int) -> 'CollisionListener':
+        """
+        Sends the given event whenever the entity collides with any of the other entities.
+        The listener is removed along with the entity, and removed entities stop being checked against.
+
+        :param entity: The entity to check collisions for.
+        :param collides_with: The entities to check the entity against, or a tag to check against its group.
+        A tag's group is checked as it is at each tick, so entities tagged later are checked too.
+        :param event_id: The ID of the event to send on collision.
+        :return: The new listener, which can be passed to `unlisten()` to stop listening early.
+        """
+        if isinstance(collides_with, str):
+            listener = CollisionListener(entity, self._tags.setdefault(collides_with, {}), event_id, shared=True)
+        else:
+            listener = CollisionListener(entity, collides_with, event_id)
+        self._collision_listeners.append(listener)
+        return listener
+
+    def unlisten(self, listener: 'CollisionListener') -> None:
+        """
+        Stops the given collision listener.
+
+        :param listener: The listener to stop.
+        :return: None.
+        :raise EntityError: Raised if the listener isn't registered with this handler.
+        """
+        if listener not in self._collision_listeners:
+            raise EntityError('Tried to remove a collision listener that is not registered.')
+        self._collision_listeners.remove(listener)
+
+    def _unindex(self, entity: Entity) -> None:
+        """
+        Removes the entity from its type and tag groups.
+
+        :param entity: The removed entity.
+        :return: None.
+        """
+        self._types.get(type(entity), {}).pop(entity, None)
+        for tag in self._entity_tags.pop(entity, ()):
+            self._tags[tag].pop(entity, None)
+
+    def _clear_indices(self) -> None:
+        for entity in self._updating:
+            entity._handler = None
+        for entity in self._static:
+            entity._handler = None
+        self._updating.clear()
+        self._static.clear()
+        self._moved_static.clear()
+        self._updating_moved = False
+        self._disposed.clear()
+        self._colliders.clear()
+        # Tag groups are emptied rather than dropped, as listeners may be sharing them.
+        for group in self._tags.values():
+            group.clear()
+        self._types.clear()
+        self._entity_tags.clear()
+
+    def _remove_disposed(self) -> None:
+        """
+        Removes the disposed entities along with their collision listeners.
+        Entities disposed before they were spawned are kept until they've been spawned.
+
+        :return: None.
+        """
+        disposed, self._disposed = self._disposed, []
+        removed = []
+        for entity in disposed:
+            if not entity.should_remove():
+                if not entity._removed:
+                    self._disposed.append(entity)
+                continue
+            entity.remove()
+            entity_list = self._entities.get(entity.priority.priority, [])
+            if entity in entity_list:
+                entity_list.remove(entity)
+            else:
+                for entity_list in self._entities.values():
+                    if entity in entity_list:
+                        entity_list.remove(entity)
+                        break
+            self._updating.pop(entity, None)
+            self._static.pop(entity, None)
+            self._moved_static.pop(entity, None)
+            self._colliders.pop(entity, None)
+            self._grid.remove(entity)
+            self._unindex(entity)
+            entity._handler = None
+            removed.append(entity)
+        if removed:
+            self._forget(*removed)
+
+    def _forget(self, *removed: Entity) -> None:
+        """
+        Drops every collision listener of the removed entities, and the removed entities from all other listeners.
+
+        :param removed: The removed entities.
+        :return: None.
+        """
+        for listener in list(self._collision_listeners):
+            if listener.entity in removed:
+                self._collision_listeners.remove(listener)
+                continue
+            for entity in removed:
+                listener.discard(entity)
 
 
 class CollisionListener:
+    """
+    Sends an event whenever an entity collides with any of a group of other entities.
+    The listener keeps its own copy of the group, so it can drop removed entities without touching the caller's list,
+    unless it shares a tag group with its EntityHandler.
+    """
+
+    def __init__(self,
+                 entity: Entity,
+                 collides_with: Union[list[Entity], dict[Entity, None]],
+                 event_id: int,
+                 *,
+                 shared: bool = False):
+        """
+        Creates a new collision listener.
 
-    def __init__(self, entity: Entity, collides_with: list[Entity], event_id: int):
+        :param entity: The entity to check collisions for.
+        :param collides_with: The entities to check the entity against.
+        :param event_id: The ID of the event to send on collision.
+        :param shared: Whether collides_with is a tag group kept up to date by an EntityHandler,
+        in which case the listener uses it directly instead of copying it.
+        """
         self._entity = entity
-        self._collides_with = collides_with
+        self._shared = shared
+        self._collides_with = collides_with if shared else dict.fromkeys(collides_with)
         self._event_id = event_id
 
+    @property
+    def entity(self) -> Entity:
+        return self._entity
+
+    @property
+    def collides_with(self) -> list[Entity]:
+        return list(self._collides_with)
+
+    def add(self, *entities: Entity) -> None:
+        """
+        Adds the given entities to the group checked against.
+
+        :param entities: The entities to add.
+        :return: None.
+        :raise EntityError: Raised if the listener checks against a tag group, which should be tagged instead.
+        """
+        if self._shared:
+            raise EntityError('Tried to add entities to a tag group listener, tag the entities instead.')
+        self._collides_with.update(dict.fromkeys(entities))
+
+    def discard(self, entity: Entity) -> None:
+        """
+        Removes the entity from the group checked against, if it's in it.
+
+        :param entity: The entity to remove.
+        :return: None.
+        """
+        if not self._shared:
+            self._collides_with.pop(entity, None)
+
     def collision_check(self) -> None:
         for entity in self._collides_with:
             if entity.collides_with(self._entity):
                 pygame.event.post(pygame.event.Event(self._event_id))
 
 
+def _number(value: float) -> Union[int, float]:
+    """
+    Converts a restored float back to an int if it holds a whole number, as most locations are ints.
+
+    :param value: The restored value.
+    :return: The value as an int if it's whole, otherwise the value itself.
+    """
+    return int(value) if value.is_integer() else value
+
+
 class EntityError(Exception):
 
     def __init__(self, msg: str = ''):
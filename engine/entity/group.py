@@ -0,0 +1,192 @@
+from typing import Iterator, Optional, Union
+
+from pygame import Rect
+from pygame.surface import Surface
+
+from engine.entity.entity import Entity, EntityError
+from engine.entity.render_priority import Priority, RenderPriority
+from engine.window.location import Location
+from engine.window.render import RenderBuffer
+from engine.window.resolution import Resolution
+
+
+class EntityGroup(Entity):
+    """
+    An entity made of child entities placed relative to the group, which move, show, hide and draw together,
+    such as the lines of a menu or the parts of a multi-part entity.
+    Only the group is registered with the EntityHandler, its children are ticked and drawn by the group,
+    in the order they were attached and at the group's render priority.
+
+    The world locations of the children are cached, and only recomputed when the group has moved (or an offset
+    changed), so moving the group is a single change however many children it has, and so is hiding it.
+    Groups can be nested, a moved child group places its own children when it's next drawn or ticked.
+    Children are only placed by the group: to move a child within the group, change its offset.
+    """
+
+    def __init__(self,
+                 loc: Optional[Location] = None,
+                 priority: Union[int, RenderPriority, Priority] = 10,
+                 *,
+                 cull: bool = True) -> None:
+        """
+        Creates a new, empty entity group.
+
+        :param loc: The location of the group, children are placed relative to it.
+        :param priority: The render priority of the group and all of its children.
+        :param cull: Whether to skip drawing the group when its bounds are entirely outside the surface.
+        """
+        super().__init__(loc, priority)
+        self.cull = cull
+        self._children: dict[Entity, tuple[int, int]] = {}
+        self._ticking: list[Entity] = []
+        self._placed: Optional[tuple[int, int]] = None
+        self._bounds: Optional[Rect] = None
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(list(self._children))
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self._children
+
+    @property
+    def children(self) -> list[Entity]:
+        return list(self._children)
+
+    def attach(self, entity: Entity, offset: tuple[int, int] = (0, 0)) -> Entity:
+        """
+        Adds a child to the group. Children should not also be registered with the EntityHandler.
+        Children attached to a group that's already spawned are spawned right away.
+        Disposed children are detached and removed by the group on its next tick.
+
+        :param entity: The child to add.
+        :param offset: The location of the child relative to the group's location.
+        :return: The given child, so creating a child can be wrapped in a call to this method.
+        :raise EntityError: Raised if the entity is already a child of the group, or is the group itself.
+        """
+        if entity is self or entity in self._children:
+            raise EntityError(f"Entity '{type(entity).__name__}' is already part of the group.")
+        self._children[entity] = offset
+        if entity.ticks:
+            self._ticking.append(entity)
+        self._placed = None
+        if self._loaded:
+            entity.spawn()
+        return entity
+
+    def detach(self, entity: Entity, *, remove: bool = True) -> None:
+        """
+        Takes a child out of the group. The child keeps its last location.
+
+        :param entity: The child to take out.
+        :param remove: Whether to remove the child if it's loaded, False to keep it loaded, in which case the caller
+        owns it and should register it with the EntityHandler or attach it to another group.
+        :return: None.
+        :raise EntityError: Raised if the entity isn't a child of the group.
+        """
+        if self._children.pop(entity, None) is None:
+            raise EntityError(f"Entity '{type(entity).__name__}' is not part of the group.")
+        if entity in self._ticking:
+            self._ticking.remove(entity)
+        self._bounds = None
+        if remove and entity._loaded:
+            entity.remove()
+
+    def offset(self, entity: Entity) -> tuple[int, int]:
+        """
+        Gets the location of a child relative to the group's location.
+
+        :param entity: The child.
+        :return: The offset of the child.
+        :raise EntityError: Raised if the entity isn't a child of the group.
+        """
+        if entity not in self._children:
+            raise EntityError(f"Entity '{type(entity).__name__}' is not part of the group.")
+        return self._children[entity]
+
+    def set_offset(self, entity: Entity, offset: tuple[int, int]) -> None:
+        """
+        Moves a child relative to the group's location.
+
+        :param entity: The child.
+        :param offset: The new offset of the child.
+        :return: None.
+        :raise EntityError: Raised if the entity isn't a child of the group.
+        """
+        if entity not in self._children:
+            raise EntityError(f"Entity '{type(entity).__name__}' is not part of the group.")
+        self._children[entity] = offset
+        self._placed = None
+
+    def tick(self, delta: int) -> None:
+        # Children aren't registered with the EntityHandler, so the group removes those that were disposed.
+        for child in [child for child in self._children if child.should_remove()]:
+            self.detach(child)
+        self._place()
+        # Children may change size (such as text that changed), so bounds are measured again once per tick.
+        self._bounds = None
+        for child in self._ticking:
+            child.tick(delta)
+
+    def draw(self, surface: Surface) -> None:
+        self._place()
+        if self.cull and not self.bounds().colliderect(surface.get_rect()):
+            return
+        for child in self._children:
+            if child.should_draw():
+                child.draw(surface)
+
+    def render(self, buffer: RenderBuffer) -> None:
+        # Buffers don't know the size of the surface they'll be drawn to, so recorded groups aren't culled.
+        self._place()
+        for child in self._children:
+            if child.should_draw():
+                child.render(buffer)
+
+    def on_load(self) -> None:
+        for child in self._children:
+            child.spawn()
+
+    def on_resize(self, old: Resolution, new: Resolution) -> None:
+        for child in self._children:
+            child.on_resize(old, new)
+
+    def remove(self) -> None:
+        super().remove()
+        for child in self._children:
+            if child._loaded:
+                child.remove()
+
+    def bounds(self) -> Rect:
+        """
+        Gets the smallest rectangle containing every child.
+        Bounds are cached until the group moves or the next tick.
+
+        :return: The bounding box of the children, or an empty box at the group's location if it has none.
+        """
+        self._place()
+        if self._bounds is None:
+            if self._children:
+                first, *others = (child.bounds() for child in self._children)
+                self._bounds = first.unionall(others) if others else first
+            else:
+                self._bounds = Rect(self._loc.x, self._loc.y, 0, 0)
+        return self._bounds
+
+    def _place(self) -> None:
+        """
+        Moves every child to its world location, if the group moved since the children were last placed.
+        The group's location is compared rather than watched, so moving it in place (such as with `loc.add()`)
+        is noticed too.
+
+        :return: None.
+        """
+        x, y = self._loc.x, self._loc.y
+        if self._placed == (x, y):
+            return
+        for child, (offset_x, offset_y) in self._children.items():
+            child.loc = Location(x + offset_x, y + offset_y)
+        self._placed = (x, y)
+        self._bounds = None
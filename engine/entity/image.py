@@ -1,9 +1,14 @@
-import pygame.image
+from concurrent.futures import Future
+from typing import Any, Iterator, Optional
+
 from pygame import Rect
 from pygame.surface import Surface
 
 from engine.entity.entity import Entity, EntityError
 from engine.entity.render_priority import Priority
+from engine.memory import tracker
+from engine.window.resolution import Resolution
+from engine.window.scaling import scaler
 
 
 class Image(Entity):
@@ -11,30 +16,67 @@ class Image(Entity):
     def __init__(self, path: str, count: int, *, scalar: float = 1):
         super().__init__(priority=Priority.HIGHEST)
         self._index = 0
-        self._images: list[Surface] = []
-        for i in range(count):
-            image = pygame.image.load(f'{path}/{i}.png')
-            new_width = image.get_width() * scalar
-            new_height = image.get_height() * scalar
-            image = pygame.transform.scale(image, (new_width, new_height))
-            self._images.append(image)
-
-    def tick(self, tick_count: int) -> None:
-        # We do not need to tick the static image.
-        pass
+        self._paths = [f'{path}/{i}.png' for i in range(count)]
+        self._scalar = scalar
+        scaler.acquire(*self._paths)
+        self._images: list[Surface] = [tracker.track(scaler.scale(path, scaler.scaled_size(path, scalar)), path, self)
+                                       for path in self._paths]
+        self._rescaling: Optional[Future] = None
 
     def draw(self, surface: Surface) -> None:
+        if self._rescaling is not None:
+            self._swap()
         surface.blit(self._images[self._index], self.loc.as_tuple())
 
+    def on_resize(self, old: Resolution, new: Resolution) -> None:
+        """
+        Rescales the images along with the resolution in the background, drawing the current images until then.
+
+        :param old: The previous resolution.
+        :param new: The new resolution.
+        :return: None.
+        """
+        self._scalar *= old.ratio_to(new)
+        self._rescaling = scaler.rescale([(path, scaler.scaled_size(path, self._scalar)) for path in self._paths])
+
     def on_load(self) -> None:
         # Nothing to be loaded.
         pass
 
+    def remove(self) -> None:
+        super().remove()
+        scaler.release(*self._paths)
+
+    def state_format(self) -> str:
+        return super().state_format() + 'H'
+
+    def save_state(self) -> tuple:
+        return super().save_state() + (self._index,)
+
+    def load_state(self, state: Iterator[Any]) -> None:
+        super().load_state(state)
+        self._index = next(state)
+
     def bounds(self) -> Rect:
+        # Swapped here too, so anchors are placed by the new size before the new images are drawn.
+        if self._rescaling is not None:
+            self._swap()
         x, y = self.loc.as_tuple()
         image = self._images[0]
         return Rect(x, y, image.get_width(), image.get_height())
 
+    def _swap(self) -> None:
+        """
+        Swaps in the images rescaled by `on_resize()`, if they're ready.
+
+        :return: None.
+        """
+        if self._rescaling.done():
+            self._images = [tracker.track(image, path, self)
+                            for image, path in zip(self._rescaling.result(), self._paths)]
+            self._rescaling = None
+            self.bounds_changed()
+
     @property
     def index(self) -> int:
         return self._index
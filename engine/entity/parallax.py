@@ -1,13 +1,15 @@
 import math
-from typing import Union
+from concurrent.futures import Future
+from typing import Any, Iterator, Optional, Union
 
-import pygame.image
 from pygame import Rect
 from pygame.surface import Surface
 
 from engine.entity.entity import Entity
 from engine.entity.render_priority import Priority
+from engine.memory import tracker
 from engine.window.resolution import Resolution, Resolutions
+from engine.window.scaling import scaler
 
 
 class Parallax(Entity):
@@ -32,31 +34,91 @@ class Parallax(Entity):
         self._total_scroll = 0
         self._res = res if isinstance(res, Resolution) else res.value
         self._tiles = 0
-
-    def tick(self, tick_count: int) -> None:
-        pass
+        self._skipped_layers = 0
+        self._rescaling: Optional[tuple[Resolution, Future]] = None
 
     def draw(self, surface: Surface) -> None:
+        if self._rescaling is not None and self._rescaling[1].done():
+            self._swap()
         speed = self._speed
-        for image, image_scroll in self._images.items():
+        for layer, (image, image_scroll) in enumerate(self._images.items()):
             speed += self._delta
             if image_scroll + (self._scroll * speed) >= image.get_width():
                 new_scroll = self._scroll * speed
             else:
                 new_scroll = math.ceil(image_scroll + (self._scroll * speed))
+            self._images[image] = new_scroll
+            # Skipped layers keep scrolling, so they're in the right place once they're drawn again.
+            if layer < self._skipped_layers:
+                continue
             for x in range(self._tiles):
                 surface.blit(image, ((x * image.get_width()) - new_scroll, 0))
-                self._images[image] = new_scroll
 
     def on_load(self) -> None:
-        for i in range(self._layers):
-            image = pygame.image.load(f'{self._path}/{i}.png').convert_alpha()
-            image = pygame.transform.scale(image, self._res.as_tuple())
+        scaler.acquire(*self._paths())
+        for path in self._paths():
+            image = tracker.track(scaler.scale(path, self._res.as_tuple()), path, self)
             self._height = max(self._height, image.get_height())
             self._width = max(self._width, image.get_width())
             self._images[image] = 0
         self._tiles = math.ceil(self._res.width / self._width) + 1
 
+    def on_resize(self, old: Resolution, new: Resolution) -> None:
+        """
+        Rescales the layers to the new resolution in the background. Until they're ready, the current layers
+        are tiled across the new resolution.
+
+        :param old: The previous resolution.
+        :param new: The new resolution.
+        :return: None.
+        """
+        if not self._loaded:
+            self._res = new
+            return
+        jobs = [(path, new.as_tuple()) for path in self._paths()]
+        self._rescaling = (new, scaler.rescale(jobs))
+        self._tiles = math.ceil(new.width / self._width) + 1
+
+    def _swap(self) -> None:
+        """
+        Swaps in the layers rescaled by `on_resize()`, keeping how far each layer has scrolled.
+
+        :return: None.
+        """
+        res, future = self._rescaling
+        self._rescaling = None
+        ratio = res.width / self._width
+        self._images = {tracker.track(image, path, self): math.ceil(scroll * ratio)
+                        for path, image, scroll in zip(self._paths(), future.result(), self._images.values())}
+        self._res = res
+        self._width = max(image.get_width() for image in self._images)
+        self._height = max(image.get_height() for image in self._images)
+        self._tiles = math.ceil(res.width / self._width) + 1
+
+    def remove(self) -> None:
+        super().remove()
+        scaler.release(*self._paths())
+
+    def _paths(self) -> list[str]:
+        return [f'{self._path}/{i}.png' for i in range(self._layers)]
+
+    def state_format(self) -> str:
+        return super().state_format() + 'ddd' + 'd' * self._layers
+
+    def save_state(self) -> tuple:
+        # Layers that aren't loaded yet are saved as unscrolled, so the format doesn't depend on loading.
+        scrolls = list(self._images.values()) + [0] * (self._layers - len(self._images))
+        return super().save_state() + (self._scroll, self._speed, self._delta, *scrolls)
+
+    def load_state(self, state: Iterator[Any]) -> None:
+        super().load_state(state)
+        self._scroll = next(state)
+        self._speed = next(state)
+        self._delta = next(state)
+        scrolls = [next(state) for _ in range(self._layers)]
+        for image, scroll in zip(list(self._images), scrolls):
+            self._images[image] = scroll
+
     def bounds(self) -> Rect:
         pass
 
@@ -68,6 +130,20 @@ class Parallax(Entity):
     def scroll(self, value: int) -> None:
         self._scroll = value
 
+    @property
+    def skipped_layers(self) -> int:
+        return self._skipped_layers
+
+    @skipped_layers.setter
+    def skipped_layers(self, value: int) -> None:
+        """
+        Sets the amount of layers, starting from the farthest, that aren't drawn.
+
+        :param value: The amount of layers to skip.
+        :return: None.
+        """
+        self._skipped_layers = max(0, min(value, self._layers - 1))
+
     @property
     def speed(self) -> float:
         return self._scroll
@@ -0,0 +1,206 @@
+import math
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pygame
+from pygame import Rect
+from pygame.color import Color
+from pygame.surface import Surface
+
+from engine.entity.entity import Entity
+from engine.entity.render_priority import Priority, RenderPriority
+from engine.memory import tracker
+from engine.utils import WHITE
+from engine.window.location import Location
+
+DEFAULT_CAPACITY = 10000
+FADE_LEVELS = 8
+"""The amount of opacity steps particles fade out in. Each step of each color is a cached sprite."""
+
+
+class ParticleSystem(Entity):
+    """
+    A single entity simulating and drawing many small particles, such as sparks or dust.
+    Particles are stored in NumPy arrays (position, velocity, remaining life and color) and updated with vectorized
+    operations, so the cost of a tick barely depends on the amount of particles.
+    Particles are drawn in a single `Surface.blits()` call with a cached sprite per color and fade level.
+
+    Living particles are kept packed at the start of the arrays, so dead particles are never visited.
+    """
+
+    def __init__(self,
+                 capacity: int = DEFAULT_CAPACITY,
+                 *,
+                 palette: Sequence[Color] = (WHITE,),
+                 radius: int = 2,
+                 gravity: tuple[float, float] = (0, 0),
+                 drag: float = 0,
+                 fade: bool = True,
+                 seed: Optional[int] = None,
+                 loc: Optional[Location] = None,
+                 priority: Union[int, RenderPriority, Priority] = Priority.HIGH) -> None:
+        """
+        Creates a new particle system.
+
+        :param capacity: The most particles alive at once. Particles emitted beyond this are dropped.
+        :param palette: The colors particles can have.
+        :param radius: The radius of each particle, in pixels.
+        :param gravity: The acceleration of every particle, in pixels per second squared.
+        :param drag: The share of velocity lost per second, from 0 (none) to 1 (all).
+        :param fade: Whether particles fade out over their life.
+        :param seed: The seed for the randomness of emitted particles, or None for a random seed.
+        Particles don't use the shared random number generator, so effects never change the outcome of a game.
+        :param loc: The location particles are emitted from by default.
+        :param priority: The render priority.
+        """
+        super().__init__(loc, priority)
+        self._capacity = capacity
+        self._count = 0
+        self._positions = np.zeros((capacity, 2), dtype=np.float32)
+        self._velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self._life = np.zeros(capacity, dtype=np.float32)
+        self._lifespan = np.ones(capacity, dtype=np.float32)
+        self._colors = np.zeros(capacity, dtype=np.uint8)
+        self._palette = [Color(color) for color in palette]
+        self._radius = radius
+        self._fade = fade
+        self.gravity = gravity
+        self.drag = drag
+        self._random = np.random.default_rng(seed)
+        self._sprites = np.empty(0, dtype=object)
+
+    def tick(self, delta: int) -> None:
+        count = self._count
+        if count == 0:
+            return
+        life = self._life[:count]
+        life -= delta
+        alive = life > 0
+        if not alive.all():
+            count = self._compact(alive)
+        seconds = delta / 1000
+        velocities = self._velocities[:count]
+        velocities += np.asarray(self.gravity, dtype=np.float32) * seconds
+        if self.drag:
+            velocities *= max(0.0, 1 - self.drag * seconds)
+        self._positions[:count] += velocities * seconds
+
+    def draw(self, surface: Surface) -> None:
+        count = self._count
+        if count == 0:
+            return
+        sprites = self._sprites[self._sprite_keys()]
+        positions = (self._positions[:count] - self._radius).astype(np.int32)
+        surface.blits(zip(sprites.tolist(), positions.tolist()), False)
+
+    def on_load(self) -> None:
+        size = self._radius * 2
+        sprites = []
+        for color in self._palette:
+            for level in range(FADE_LEVELS):
+                sprite = Surface((size, size), pygame.SRCALPHA)
+                alpha = color.a * (level + 1) // FADE_LEVELS if self._fade else color.a
+                pygame.draw.circle(sprite, (color.r, color.g, color.b, alpha), (self._radius, self._radius),
+                                   self._radius)
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert_alpha()
+                sprites.append(tracker.track(sprite, owner=self))
+        # Filled one by one, so NumPy doesn't try to read the surfaces as arrays.
+        self._sprites = np.empty(len(sprites), dtype=object)
+        for i, sprite in enumerate(sprites):
+            self._sprites[i] = sprite
+
+    def bounds(self) -> Rect:
+        """
+        Gets the smallest rectangle containing every living particle.
+
+        :return: The bounding box of the particles, or an empty box at the emitter's location if there are none.
+        """
+        if self._count == 0:
+            return Rect(self.loc.x, self.loc.y, 0, 0)
+        positions = self._positions[:self._count]
+        left, top = np.floor(positions.min(axis=0)) - self._radius
+        right, bottom = np.ceil(positions.max(axis=0)) + self._radius
+        return Rect(int(left), int(top), int(right - left), int(bottom - top))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def emit(self,
+             amount: int,
+             *,
+             position: Optional[tuple[float, float]] = None,
+             speed: tuple[float, float] = (50, 150),
+             angle: tuple[float, float] = (0, 2 * math.pi),
+             life: tuple[int, int] = (500, 1000),
+             colors: Optional[Sequence[int]] = None) -> int:
+        """
+        Emits particles from a point, each with a random speed, direction, life and color within the given ranges.
+
+        :param amount: The amount of particles to emit.
+        :param position: The point to emit from, or None to emit from the system's location.
+        :param speed: The range of speeds, in pixels per second.
+        :param angle: The range of directions, in radians, where 0 is to the right and pi / 2 is down.
+        :param life: The range of lifetimes, in milliseconds.
+        :param colors: The indices in the palette of the colors to pick from, or None to pick from the whole palette.
+        :return: The amount of particles emitted, which is less than asked if the system is full.
+        """
+        start = self._count
+        amount = max(0, min(amount, self._capacity - start))
+        if amount == 0:
+            return 0
+        end = start + amount
+        random = self._random
+        self._positions[start:end] = position if position is not None else self.loc.as_tuple()
+        speeds = random.uniform(speed[0], speed[1], amount)
+        angles = random.uniform(angle[0], angle[1], amount)
+        self._velocities[start:end, 0] = np.cos(angles) * speeds
+        self._velocities[start:end, 1] = np.sin(angles) * speeds
+        lifetimes = random.uniform(life[0], life[1], amount)
+        self._life[start:end] = lifetimes
+        self._lifespan[start:end] = lifetimes
+        choices = np.asarray(colors if colors is not None else range(len(self._palette)), dtype=np.uint8)
+        self._colors[start:end] = random.choice(choices, amount)
+        self._count = end
+        return amount
+
+    def clear(self) -> None:
+        """
+        Kills every particle.
+
+        :return: None.
+        """
+        self._count = 0
+
+    def _compact(self, alive: np.ndarray) -> int:
+        """
+        Moves the living particles to the start of the arrays, keeping their order.
+
+        :param alive: Whether each of the current particles is alive.
+        :return: The new amount of particles.
+        """
+        count = int(np.count_nonzero(alive))
+        for array in (self._positions, self._velocities, self._life, self._lifespan, self._colors):
+            array[:count] = array[:self._count][alive]
+        self._count = count
+        return count
+
+    def _sprite_keys(self) -> np.ndarray:
+        """
+        Gets the index of the cached sprite of each living particle, from its color and how far it has faded.
+
+        :return: The sprite indices.
+        """
+        count = self._count
+        keys = self._colors[:count].astype(np.intp) * FADE_LEVELS
+        if self._fade:
+            levels = np.ceil(self._life[:count] / self._lifespan[:count] * FADE_LEVELS).astype(np.intp) - 1
+            keys += np.clip(levels, 0, FADE_LEVELS - 1)
+        else:
+            keys += FADE_LEVELS - 1
+        return keys
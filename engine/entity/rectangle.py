@@ -1,11 +1,14 @@
+from typing import Optional
+
 import pygame
 import pymunk
 from pygame import Rect
 from pygame.color import Color
 from pygame.surface import Surface
-from pymunk import Space
 
+from engine.entity import shapes
 from engine.entity.entity import Entity
+from engine.physics.physics import Physics
 from engine.utils import BLACK
 from engine.window.location import Location
 
@@ -15,18 +18,17 @@ class Rectangle(Entity):
     Represents a rectangular static-body entity.
     """
 
-    def __init__(self, w: int, h: int, color: Color = BLACK, loc: Location = Location(0, 0)) -> None:
+    def __init__(self, w: int, h: int, color: Color = BLACK, loc: Optional[Location] = None) -> None:
         super().__init__(loc)
+        self._sprite: Optional[Surface] = None
         self.w = w
         self.h = h
         self.color = color
 
-    def tick(self, tick_count: int) -> None:
-        # Method empty due to not needing to update the location.
-        pass
-
     def draw(self, surface: Surface) -> None:
-        pygame.draw.rect(surface, color=self.color, rect=self.bounds())
+        if self._sprite is None:
+            self._sprite = shapes.rectangle(self._w, self._h, self._color)
+        surface.blit(self._sprite, (self.loc.x, self.loc.y))
 
     def on_load(self) -> None:
         # Method empty due to not needing to load any resources.
@@ -35,6 +37,40 @@ class Rectangle(Entity):
     def bounds(self) -> Rect:
         return pygame.Rect(self.loc.x, self.loc.y, self.w, self.h)
 
+    @property
+    def w(self) -> int:
+        return self._w
+
+    @w.setter
+    def w(self, w: int) -> None:
+        self._w = w
+        self._sprite = None
+
+    @property
+    def h(self) -> int:
+        return self._h
+
+    @h.setter
+    def h(self, h: int) -> None:
+        self._h = h
+        self._sprite = None
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        """
+        Sets the color of the rectangle. Colors should be replaced rather than changed in place,
+        as the rectangle's cached surface is only refreshed when a color is set.
+
+        :param color: The new color.
+        :return: None.
+        """
+        self._color = color
+        self._sprite = None
+
 
 class PymunkRectangle(Entity):
     """
@@ -45,24 +81,21 @@ class PymunkRectangle(Entity):
                  p1: tuple[int, int],
                  p2: tuple[int, int],
                  r: int,
-                 space: Space,
+                 physics: Physics,
                  color: Color = BLACK):
         super().__init__(Location(p1[0], p1[1]))
         self.color = color
         self.r = r
         self.p1 = p1
         self.p2 = p2
-        self._space = space
+        self._physics = physics
         self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
         self.shape = pymunk.Segment(self.body, p1, p2, r)
         self.shape.elasticity = 0.9
 
-    def tick(self, tick_count: int) -> None:
-        # Method empty since Pymunk handles ticking in the window.
-        pass
-
     def draw(self, surface: Surface) -> None:
-        pygame.draw.line(surface, self.color, self.p1, self.p2, self.r)
+        sprite, offset = shapes.segment(self.p1, self.p2, self.r, self.color)
+        surface.blit(sprite, (self.p1[0] + offset[0], self.p1[1] + offset[1]))
 
     def on_load(self) -> None:
         # Method empty since
@@ -77,11 +110,11 @@ class PymunkRectangle(Entity):
 
     def spawn(self) -> None:
         super().spawn()
-        self._space.add(self.body, self.shape)
+        self._physics.add(self)
 
     def remove(self) -> None:
         super().remove()
-        self._space.remove(self.body, self.shape)
+        self._physics.remove(self)
 
     @Entity.loc.setter
     def loc(self, loc: Location) -> None:
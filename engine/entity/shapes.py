@@ -0,0 +1,144 @@
+from functools import cache
+from typing import Optional, Union
+
+import pygame
+from pygame import Color
+from pygame.surface import Surface
+
+from engine.memory import tracker
+
+ColorValue = Union[Color, tuple[int, int, int], tuple[int, int, int, int], str]
+
+_KEY = (255, 0, 255)
+"""The color of the transparent pixels around cached shapes."""
+_OTHER_KEY = (0, 255, 0)
+"""The color of the transparent pixels around cached shapes that are the same color as `_KEY`."""
+
+
+def _rgb(color: ColorValue) -> tuple[int, int, int]:
+    """
+    Gets the opaque RGB value of a color, so equal colors share a cached surface however they were given.
+    `pygame.draw` ignores alpha when drawing onto the screen, so cached shapes are opaque as well.
+
+    :param color: The color.
+    :return: The color as a tuple (r, g, b).
+    """
+    if isinstance(color, str):
+        color = Color(color)
+    return color[0], color[1], color[2]
+
+
+def _transparent(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """
+    Gets the key color of a shape's transparent pixels, which must differ from the shape's own color.
+
+    :param color: The color of the shape.
+    :return: The key color.
+    """
+    return _KEY if color != _KEY else _OTHER_KEY
+
+
+def _keyed(size: tuple[int, int], color: tuple[int, int, int]) -> tuple[Surface, tuple[int, int, int]]:
+    """
+    Creates a surface filled with a key color, to draw a shape with transparent pixels around it onto.
+    Colorkeyed surfaces are run-length encoded once converted, which blits faster than per-pixel alpha.
+
+    :param size: The size of the surface.
+    :param color: The color of the shape.
+    :return: The surface and its key color.
+    """
+    key = _transparent(color)
+    surface = Surface(size)
+    surface.fill(key)
+    return surface, key
+
+
+def _convert(surface: Surface, key: Optional[tuple[int, int, int]] = None) -> Surface:
+    """
+    Converts the surface to the display's pixel format, if there is a display, and starts tracking it.
+
+    :param surface: The surface to convert.
+    :param key: The color of the surface's transparent pixels, or None if it's opaque.
+    :return: The converted surface.
+    """
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    if key is not None:
+        surface.set_colorkey(key, pygame.RLEACCEL)
+    return tracker.track(surface)
+
+
+def circle(radius: int, color: ColorValue) -> Surface:
+    """
+    Gets a surface of a filled circle, drawn once per radius and color.
+    Blitting the surface at `(x - radius, y - radius)` draws the same pixels as `pygame.draw.circle()` at (x, y).
+
+    :param radius: The radius of the circle.
+    :param color: The color of the circle.
+    :return: The circle's surface, which should not be changed as it's shared.
+    """
+    return _circle(radius, _rgb(color))
+
+
+def rectangle(width: int, height: int, color: ColorValue) -> Surface:
+    """
+    Gets a surface of a filled rectangle, drawn once per size and color.
+
+    :param width: The width of the rectangle.
+    :param height: The height of the rectangle.
+    :param color: The color of the rectangle.
+    :return: The rectangle's surface, which should not be changed as it's shared.
+    """
+    return _rectangle(max(0, width), max(0, height), _rgb(color))
+
+
+def segment(start: tuple[int, int],
+            end: tuple[int, int],
+            width: int,
+            color: ColorValue) -> tuple[Surface, tuple[int, int]]:
+    """
+    Gets a surface of a thick line, drawn once per direction, length, width and color.
+    Blitting the surface at `start` plus the returned offset draws the same pixels as `pygame.draw.line()`.
+
+    :param start: The start of the line.
+    :param end: The end of the line.
+    :param width: The width of the line.
+    :param color: The color of the line.
+    :return: The line's surface, which should not be changed as it's shared, and its offset from the start.
+    """
+    return _segment(int(end[0] - start[0]), int(end[1] - start[1]), width, _rgb(color))
+
+
+def clear_cache() -> None:
+    """
+    Forgets every cached shape, such as when the display's pixel format changed.
+
+    :return: None.
+    """
+    _circle.cache_clear()
+    _rectangle.cache_clear()
+    _segment.cache_clear()
+
+
+@cache
+def _circle(radius: int, color: tuple[int, int, int]) -> Surface:
+    surface, key = _keyed((radius * 2, radius * 2), color)
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    return _convert(surface, key)
+
+
+@cache
+def _rectangle(width: int, height: int, color: tuple[int, int, int]) -> Surface:
+    surface = Surface((width, height))
+    surface.fill(color)
+    return _convert(surface)
+
+
+@cache
+def _segment(dx: int, dy: int, width: int, color: tuple[int, int, int]) -> tuple[Surface, tuple[int, int]]:
+    # Drawn with a margin of the line's width on every side, then cropped to the pixels pygame actually drew.
+    surface, key = _keyed((abs(dx) + width * 2 + 1, abs(dy) + width * 2 + 1), color)
+    start = (width + max(0, -dx), width + max(0, -dy))
+    drawn = pygame.draw.line(surface, color, start, (start[0] + dx, start[1] + dy), width)
+    cropped = surface.subsurface(drawn).copy()
+    return _convert(cropped, key), (drawn.x - start[0], drawn.y - start[1])
@@ -0,0 +1,204 @@
+import math
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING
+
+from pygame import Rect
+
+if TYPE_CHECKING:
+    from engine.entity.entity import Entity
+
+DEFAULT_CELL_SIZE = 128
+"""The width and height of a grid cell, in pixels. Should be around the size of a typical entity or larger."""
+
+CellRange = tuple[int, int, int, int]
+
+
+class SpatialGrid:
+    """
+    A uniform grid of the bounding boxes of entities, for finding entities by position without checking every entity.
+    Each entity is kept in every cell its bounding box overlaps. Updating an entity that stayed within the same
+    cells only costs a call to `bounds()`, so the grid can be updated every tick.
+    Cells keep their entities in insertion order, so queries return entities in a deterministic order.
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict['Entity', None]] = {}
+        self._ranges: dict['Entity', CellRange] = {}
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        return entity in self._ranges
+
+    def update(self, entity: 'Entity', bounds: Optional[Rect] = None) -> None:
+        """
+        Moves the entity to the cells its current bounding box overlaps, adding it if needed.
+        Entities without a bounding box are removed from the grid.
+
+        :param entity: The entity to update.
+        :param bounds: The entity's current bounding box, if the caller already has it.
+        :return: None.
+        """
+        if bounds is None:
+            bounds = entity.bounds()
+        if bounds is None:
+            self.remove(entity)
+            return
+        cells = self._range(bounds)
+        previous = self._ranges.get(entity, None)
+        if cells == previous:
+            return
+        if previous is not None:
+            self._discard(entity, previous)
+        self._ranges[entity] = cells
+        for key in _keys(cells):
+            self._cells.setdefault(key, {})[entity] = None
+
+    def remove(self, entity: 'Entity') -> None:
+        """
+        Removes the entity from the grid, if it's in it.
+
+        :param entity: The entity to remove.
+        :return: None.
+        """
+        cells = self._ranges.pop(entity, None)
+        if cells is not None:
+            self._discard(entity, cells)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._ranges.clear()
+
+    def query_rect(self, rect: Rect) -> list['Entity']:
+        """
+        Finds the entities whose bounding box overlaps the given rectangle.
+
+        :param rect: The rectangle to search.
+        :return: The overlapping entities.
+        """
+        return [entity for entity in self._candidates(self._range(rect)) if entity.bounds().colliderect(rect)]
+
+    def candidates(self, rect: Rect) -> Iterable['Entity']:
+        """
+        Finds the entities in the cells the given rectangle overlaps, without checking their bounding boxes.
+        Useful when the caller can rule out most candidates more cheaply than by their bounding box.
+
+        :param rect: The rectangle to search.
+        :return: The entities that may overlap the rectangle, each only once.
+        """
+        return self._candidates(self._range(rect))
+
+    def query_point(self, pos: tuple[int, int]) -> list['Entity']:
+        """
+        Finds the entities whose bounding box contains the given point.
+
+        :param pos: The point as a tuple (x, y).
+        :return: The entities containing the point.
+        """
+        key = self._key(pos[0], pos[1])
+        return [entity for entity in self._cells.get(key, {}) if entity.bounds().collidepoint(pos)]
+
+    def nearest(self,
+                pos: tuple[int, int],
+                count: int = 1,
+                *,
+                max_distance: Optional[float] = None,
+                predicate: Optional[Callable[['Entity'], bool]] = None) -> list['Entity']:
+        """
+        Finds the entities closest to the given point, by the distance to the edge of their bounding box.
+        Searches rings of cells outwards from the point, stopping as soon as no unsearched entity can be closer.
+
+        :param pos: The point as a tuple (x, y).
+        :param count: The most entities to find.
+        :param max_distance: The greatest distance to search, or None to search the whole grid.
+        :param predicate: Only entities for which this returns True are found, or None to find any entity.
+        :return: The closest entities, closest first.
+        """
+        if not self._cells or count < 1:
+            return []
+        center_x, center_y = self._key(pos[0], pos[1])
+        last_ring = max(max(abs(x - center_x), abs(y - center_y)) for x, y in self._cells)
+        if max_distance is not None:
+            last_ring = min(last_ring, math.ceil(max_distance / self._cell_size))
+        found: dict['Entity', float] = {}
+        for ring in range(last_ring + 1):
+            for key in _ring(center_x, center_y, ring):
+                for entity in self._cells.get(key, ()):
+                    if entity in found or (predicate is not None and not predicate(entity)):
+                        continue
+                    found[entity] = _distance(pos, entity.bounds())
+            # Entities outside the searched rings are at least this far away.
+            covered = ring * self._cell_size
+            if sum(1 for distance in found.values() if distance <= covered) >= count:
+                break
+        closest = sorted(found.items(), key=lambda item: item[1])
+        return [entity for entity, distance in closest if max_distance is None or distance <= max_distance][:count]
+
+    def _key(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self._cell_size), int(y // self._cell_size)
+
+    def _range(self, rect: Rect) -> CellRange:
+        left, top = self._key(rect.left, rect.top)
+        right, bottom = self._key(rect.right - 1 if rect.width else rect.right,
+                                  rect.bottom - 1 if rect.height else rect.bottom)
+        return left, top, right, bottom
+
+    def _candidates(self, cells: CellRange) -> Iterable['Entity']:
+        candidates: dict['Entity', None] = {}
+        for key in _keys(cells):
+            candidates.update(self._cells.get(key, {}))
+        return candidates
+
+    def _discard(self, entity: 'Entity', cells: CellRange) -> None:
+        for key in _keys(cells):
+            cell = self._cells.get(key, None)
+            if cell is None:
+                continue
+            cell.pop(entity, None)
+            if not cell:
+                del self._cells[key]
+
+
+def _keys(cells: CellRange) -> Iterator[tuple[int, int]]:
+    left, top, right, bottom = cells
+    for x in range(left, right + 1):
+        for y in range(top, bottom + 1):
+            yield x, y
+
+
+def _ring(center_x: int, center_y: int, ring: int) -> Iterator[tuple[int, int]]:
+    """
+    Gets the keys of the cells at exactly the given (Chebyshev) distance from the center cell.
+
+    :param center_x: The x key of the center cell.
+    :param center_y: The y key of the center cell.
+    :param ring: The distance from the center cell, in cells.
+    :return: The keys of the cells in the ring.
+    """
+    if ring == 0:
+        yield center_x, center_y
+        return
+    for x in range(center_x - ring, center_x + ring + 1):
+        yield x, center_y - ring
+        yield x, center_y + ring
+    for y in range(center_y - ring + 1, center_y + ring):
+        yield center_x - ring, y
+        yield center_x + ring, y
+
+
+def _distance(pos: tuple[int, int], rect: Rect) -> float:
+    """
+    Gets the distance from a point to the closest point of a rectangle.
+
+    :param pos: The point as a tuple (x, y).
+    :param rect: The rectangle.
+    :return: The distance, 0 if the point is inside the rectangle.
+    """
+    dx = max(rect.left - pos[0], 0, pos[0] - rect.right)
+    dy = max(rect.top - pos[1], 0, pos[1] - rect.bottom)
+    return math.hypot(dx, dy)
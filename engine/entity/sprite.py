@@ -1,12 +1,15 @@
+from concurrent.futures import Future
 from enum import Enum
+from typing import Any, Iterator, Optional
 
-import pygame.image
 from pygame import Rect
 from pygame.surface import Surface
 
+from engine.entity.animation import AnimationClip, AnimationCursor, DEFAULT_FRAME_TIME
 from engine.entity.entity import Entity, EntityError
 from engine.entity.render_priority import Priority
 from engine.window.resolution import Resolution
+from engine.window.scaling import scaler
 
 
 class SpriteState(Enum):
@@ -18,55 +21,159 @@ class SpriteState(Enum):
     LAND = 4
 
 
+_STATES = list(SpriteState)
+
+
 class Sprite(Entity):
 
     def __init__(self,
                  res: Resolution,
                  *,
-                 speed: int = 1,
+                 frame_time: int = DEFAULT_FRAME_TIME,
                  scalar: float = 1,
                  gravity: bool = True,
+                 gravity_scale: float = 1,
                  min_y: int = 0,
                  default_state: SpriteState = SpriteState.IDLE):
+        """
+        Creates a new sprite, without any states.
+
+        :param res: The resolution of the window, the sprite can't fall below its bottom.
+        :param frame_time: The default time each frame is shown for, in milliseconds.
+        :param scalar: The amount to scale each frame by.
+        :param gravity: Whether the sprite falls.
+        :param gravity_scale: The amount to scale the sprite's gravity and fall speed by, such as the ratio between
+        the resolution the game was made for and the resolution it's drawn at.
+        :param min_y: The height of the ground above the bottom of the window.
+        :param default_state: The state the sprite starts in.
+        """
         super().__init__(priority=Priority.HIGHEST)
-        self._animations: dict[SpriteState, list[Surface]] = {}
-        self._states: dict[SpriteState, tuple[str, int]] = {}
+        self._clips: dict[SpriteState, AnimationClip] = {}
+        self._sources: dict[SpriteState, tuple[str, int, int]] = {}
+        self._rescaling: Optional[dict[SpriteState, Future[AnimationClip]]] = None
+        self._foot_state: Optional[SpriteState] = None
+        self._cursor: Optional[AnimationCursor] = None
         self._state = default_state
-        self._speed = speed
-        self._index = 0
+        self._frame_time = frame_time
         self._scalar = scalar
+        self._min_y: float = min_y
         self._max_y = res.height - min_y
         self._gravity = gravity
-        self._velocity: tuple[int, int] = (0, 0)
+        self._gravity_scale = gravity_scale
+        self._velocity: tuple[float, float] = (0, 0)
+        self._animation_step = 1
+        self._pending_ticks = 0
+        self._pending_delta = 0
 
-    def tick(self, tick_count: int) -> None:
-        if self.loc.y < self._max_y and self.state is SpriteState.RUN:
-            self.state = SpriteState.MID_AIR
-        elif self.loc.y >= self._max_y and self.state is SpriteState.MID_AIR:
-            self.state = SpriteState.RUN
+    def tick(self, delta: int) -> None:
+        if self._rescaling is not None:
+            self._swap()
+        # Only sprites with gravity fall and land, flying sprites (such as one left below a lowered ground
+        # by a resolution change) keep their state.
+        if self._gravity:
+            if self.loc.y < self._max_y and self.state is SpriteState.RUN:
+                self.state = SpriteState.MID_AIR
+            elif self.loc.y >= self._max_y and self.state is SpriteState.MID_AIR:
+                self.state = SpriteState.RUN
         vel_x, vel_y = self._velocity
         if self._gravity:
-            self._velocity = (vel_x, min(30, vel_y + 1))
+            self._velocity = (vel_x, min(30 * self._gravity_scale, vel_y + self._gravity_scale))
         self.loc.x -= vel_x
         self.loc.y = min(self.loc.y + vel_y, self._max_y)
-        if tick_count % self._speed == 0:
-            if self._index < len(self._animations[self._state]) - 1:
-                self._index += 1
-            else:
-                self._index = 0
+        self._pending_ticks += 1
+        self._pending_delta += delta
+        if self._pending_ticks >= self._animation_step:
+            self._cursor.advance(self._pending_delta)
+            self._pending_ticks = 0
+            self._pending_delta = 0
 
     def draw(self, surface: Surface) -> None:
-        current_frame = self._animations[self._state][self._index]
-        surface.blit(current_frame, self.loc.as_tuple())
+        surface.blit(self._cursor.frame, self.loc.as_tuple())
+
+    def state_format(self) -> str:
+        return super().state_format() + 'ddBiiiiB'
+
+    def save_state(self) -> tuple:
+        index, elapsed = (self._cursor.index, self._cursor.elapsed) if self._cursor is not None else (0, 0)
+        return super().save_state() + (*self._velocity, _STATES.index(self._state), index, elapsed,
+                                       self._pending_ticks, self._pending_delta, self._animation_step)
+
+    def load_state(self, state: Iterator[Any]) -> None:
+        super().load_state(state)
+        self._velocity = (next(state), next(state))
+        self._state = _STATES[next(state)]
+        index, elapsed = next(state), next(state)
+        if self._cursor is not None:
+            if self._state in self._clips and self._cursor.clip is not self._clips[self._state]:
+                self._cursor.clip = self._clips[self._state]
+            self._cursor.seek(index, elapsed)
+        self._pending_ticks = next(state)
+        self._pending_delta = next(state)
+        self._animation_step = next(state)
 
     def bounds(self) -> Rect:
+        # Swapped here too, so anchors are placed by the new size before the new frames are drawn.
+        if self._rescaling is not None:
+            self._swap()
         x, y = self.loc.as_tuple()
-        state_image = self._animations[self.state][0]
+        state_image = self._clips[self.state].frames[0]
         return Rect(x, y, state_image.get_width(), state_image.get_height())
 
     def on_load(self) -> None:
         pass
 
+    def on_resize(self, old: Resolution, new: Resolution) -> None:
+        """
+        Moves the ground along with the bottom of the window, scaling its distance from the bottom,
+        and rescales the frames, velocity and gravity along with the resolution.
+        Frames are rescaled in the background, the current frames are used until then.
+        The sprite itself isn't moved, anchor it in the scene's layout to place it again.
+
+        :param old: The previous resolution.
+        :param new: The new resolution.
+        :return: None.
+        """
+        ratio = old.ratio_to(new)
+        min_y = self._min_y * ratio
+        self._max_y = round(self._max_y + (new.height - old.height) - (min_y - self._min_y))
+        self._min_y = min_y
+        self._gravity_scale *= ratio
+        self._velocity = (self._velocity[0] * ratio, self._velocity[1] * ratio)
+        self._scalar *= ratio
+        self._rescaling = {state: AnimationClip.rescale(path, count, scalar=self._scalar, duration=duration)
+                           for state, (path, count, duration) in self._sources.items()}
+
+    def remove(self) -> None:
+        super().remove()
+        for path, count, _ in self._sources.values():
+            scaler.release(*AnimationClip.frame_paths(path, count))
+
+    def _swap(self) -> None:
+        """
+        Swaps in the frames rescaled by `on_resize()` once every state's are ready, keeping the animation's position.
+        Sprites with gravity keep their feet at the same height, so a sprite on the ground stays on the ground.
+
+        :return: None.
+        """
+        if not all(future.done() for future in self._rescaling.values()):
+            return
+        foot = self._foot_height()
+        for state, future in self._rescaling.items():
+            self._clips[state] = future.result()
+        self._rescaling = None
+        if self._cursor is not None and self._state in self._clips:
+            index, elapsed = self._cursor.index, self._cursor.elapsed
+            self._cursor.clip = self._clips[self._state]
+            self._cursor.seek(index, elapsed)
+        if self._gravity and self._foot_state is not None:
+            lift = self._foot_height() - foot
+            self._max_y -= lift
+            self.loc.y -= lift
+        self.bounds_changed()
+
+    def _foot_height(self) -> int:
+        return self._clips[self._foot_state].frames[0].get_height() if self._foot_state is not None else 0
+
     @property
     def state(self) -> SpriteState:
         return self._state
@@ -74,27 +181,79 @@ class Sprite(Entity):
     @state.setter
     def state(self, value: SpriteState) -> None:
         self._state = value
-        self._index = 0
+        if value in self._clips:
+            self._cursor.clip = self._clips[value]
+
+    @property
+    def cursor(self) -> Optional[AnimationCursor]:
+        """
+        Gets the playback cursor of the current animation.
+
+        :return: The playback cursor, or None if no states have been added yet.
+        """
+        return self._cursor
 
     @property
-    def velocity(self) -> tuple[int, int]:
+    def animation_step(self) -> int:
+        return self._animation_step
+
+    @animation_step.setter
+    def animation_step(self, value: int) -> None:
+        """
+        Sets how many ticks pass between animation updates. The animation keeps its speed, but skips frames.
+
+        :param value: The amount of ticks per animation update, 1 to update every tick.
+        :return: None.
+        """
+        self._animation_step = max(1, value)
+
+    @property
+    def velocity(self) -> tuple[float, float]:
         return self._velocity
 
     @velocity.setter
-    def velocity(self, value: tuple[int, int]) -> None:
+    def velocity(self, value: tuple[float, float]) -> None:
         self._velocity = value
 
     def min_y(self, res: Resolution, min_y: int):
-        self._max_y = res.height - min_y - self._animations[self._state][0].get_height()
+        self._min_y = min_y
+        self._foot_state = self._state
+        self._max_y = res.height - min_y - self._clips[self._state].frames[0].get_height()
+
+    def add_state(self, state: SpriteState, path: str, count: int, *, frame_time: Optional[int] = None) -> None:
+        """
+        Loads the animation for the given state.
+        Animations are shared, so sprites loading the same animation share a single copy of its frames.
+
+        :param state: The state to add.
+        :param path: The directory of the animation frames.
+        :param count: The amount of frames.
+        :param frame_time: The time each frame is shown for in milliseconds, or None for the sprite's default.
+        :return: None.
+        :raise EntityError: Raised if the state has already been added.
+        """
+        duration = self._frame_time if frame_time is None else frame_time
+        # The originals are kept so the frames can be rescaled when the resolution changes.
+        paths = AnimationClip.frame_paths(path, count)
+        scaler.acquire(*paths)
+        try:
+            self.add_clip(state, AnimationClip.load(path, count, scalar=self._scalar, duration=duration))
+        except EntityError:
+            scaler.release(*paths)
+            raise
+        self._sources[state] = (path, count, duration)
+
+    def add_clip(self, state: SpriteState, clip: AnimationClip) -> None:
+        """
+        Sets the animation clip for the given state.
 
-    def add_state(self, state: SpriteState, path: str, count: int) -> None:
-        if state in self._states:
+        :param state: The state to add.
+        :param clip: The animation clip to play while in the state.
+        :return: None.
+        :raise EntityError: Raised if the state has already been added.
+        """
+        if state in self._clips:
             raise EntityError(f'The sprite state {state.name} has already been set.')
-        images = []
-        for i in range(count):
-            image = pygame.image.load(f'{path}/{i}.png')
-            new_width = image.get_width() * self._scalar
-            new_height = image.get_height() * self._scalar
-            image = pygame.transform.scale(image, (new_width, new_height))
-            images.append(image)
-        self._animations[state] = images
+        self._clips[state] = clip
+        if state is self._state or self._cursor is None:
+            self._cursor = AnimationCursor(clip)
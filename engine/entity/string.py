@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 from pygame import Rect
 from pygame.color import Color
@@ -12,17 +12,11 @@ from engine.window.location import Location
 
 class String(Entity):
 
-    def __init__(self, font: Font, text: str, *, color: Color = WHITE, loc: Location = Location(0, 0)):
+    def __init__(self, font: Font, text: str, *, color: Color = WHITE, loc: Optional[Location] = None):
         super().__init__(loc)
         self._font = font
         self._color = color
         self._surface = self._font.render(text, True, self._color)
-        self._surface.get_rect().x = self._loc.x
-        self._surface.get_rect().y = self._loc.y
-
-    def tick(self, tick_count: int) -> None:
-        # This method is empty since text is static.
-        pass
 
     def draw(self, surface: Surface) -> None:
         surface.blit(self._surface, self._loc.as_tuple())
@@ -32,7 +26,7 @@ class String(Entity):
         pass
 
     def bounds(self) -> Rect:
-        return self._surface.get_rect()
+        return self._surface.get_rect(topleft=self._loc.as_tuple())
 
     def set_text(self, text: str) -> None:
         """
@@ -42,14 +36,12 @@ class String(Entity):
         :return: None.
         """
         self._surface = self._font.render(text, True, self._color)
+        self.bounds_changed()
 
     @Entity.loc.setter
     def loc(self, loc: Union[Location, tuple[int, int]]) -> None:
         self._loc = loc if isinstance(loc, Location) else Location(loc[0], loc[1])
-        x = loc.x if isinstance(loc, Location) else loc[0]
-        y = loc.y if isinstance(loc, Location) else loc[1]
-        self._surface.get_rect().x = x
-        self._surface.get_rect().y = y
+        self.bounds_changed()
 
     @property
     def color(self) -> Color:
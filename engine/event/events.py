@@ -1,16 +1,33 @@
-from typing import Callable
+from typing import Any, Callable, Optional
 
 import pygame
 from pygame.event import Event
 
+from engine.log import get_logger
+
+logger = get_logger(__name__)
+
+_allowed: Optional[tuple[int, ...]] = None
+"""The event types SDL currently lets into the queue, or None if the queue isn't filtered."""
+SYSTEM_EVENTS = (pygame.QUIT, pygame.ACTIVEEVENT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+                 pygame.WINDOWCLOSE, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED, pygame.WINDOWEXPOSED,
+                 pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED)
+"""The event types always let into the queue, even if no callback is registered for them."""
+
 
 class EventHandler:
     """
     Handles events sent to the window by PyGame.
+    Only events of registered types are let into PyGame's event queue (see `fetch()`), so input nobody handles,
+    such as mouse motion, costs nothing.
     """
 
     def __init__(self):
         self._events: dict[int, Callable[[Event], None]] = {}
+        self._types: tuple[int, ...] = ()
+        self._queued: tuple[int, ...] = SYSTEM_EVENTS
+        self._timers: dict[int, Timer] = {}
+        self.stats = EventStats()
 
     def register(self, event_id: int, callback: Callable[[Event], None]) -> None:
         """
@@ -24,7 +41,44 @@ class EventHandler:
         if event_id in self._events:
             raise EventError(f'Given event ID {event_id} already registered.')
         self._events[event_id] = callback
-        print(f'Event with ID {event_id} registered.')
+        self._set_types(tuple(self._events))
+        logger.debug('Event with ID %d registered.', event_id)
+
+    @property
+    def types(self) -> tuple[int, ...]:
+        """
+        Gets the event types with a registered callback.
+
+        :return: The registered event types, in the order they were registered.
+        """
+        return self._types
+
+    def fetch(self) -> list[Event]:
+        """
+        Takes the events of the registered types from PyGame's event queue, and drops every other queued event.
+        The queue is filtered to the registered types with `pygame.event.set_blocked()` and `set_allowed()`,
+        so other events are never queued at all, and the registered types are fetched in a single call.
+        The filter is only changed when the registered types changed (or another handler filtered the queue).
+        `SYSTEM_EVENTS` are always queued, and dropped here if no callback is registered for them.
+        Also starts a new frame of event stats.
+
+        The filter is global, so events of any other type are lost, including those posted with
+        `pygame.event.post()` (which then returns False), such as an event only registered on another scene.
+
+        :return: The events of the registered types, in the order they were queued.
+        """
+        self.stats.next_frame()
+        if _allowed != self._queued:
+            # Blocking an event type flushes it from the queue, so queued events are taken out first.
+            queued = pygame.event.get()
+            self._filter()
+        else:
+            queued = pygame.event.get(self._queued)
+        if len(self._queued) == len(self._types):
+            return queued
+        events = [event for event in queued if event.type in self._events]
+        self.stats.count(0, len(queued) - len(events))
+        return events
 
     def handle_events(self, events: list[Event]) -> None:
         """
@@ -33,17 +87,148 @@ class EventHandler:
         :param events: The list of events to handle.
         :return: None.
         """
+        handled = 0
         for event in events:
             if _callable := self._events.get(event.type, None):
                 _callable(event)
+                handled += 1
+        self.stats.count(handled, len(events) - handled)
+
+    def set_timer(self, event_id: int, millis: int, loops: int = 0) -> None:
+        """
+        Sends the event with the given ID every `millis` milliseconds of game time.
+        Works like `pygame.time.set_timer()`, but timers are advanced by the window's frame time,
+        so they pause with their scene and fire on the same frames when a session is replayed.
+
+        :param event_id: The ID of the event to send.
+        :param millis: The time between each event in milliseconds, or 0 to cancel the timer.
+        :param loops: The amount of times to send the event, or 0 (or less) to send it until cancelled.
+        :return: None.
+        """
+        if millis <= 0:
+            self._timers.pop(event_id, None)
+            return
+        self._timers[event_id] = Timer(event_id, millis, loops)
+
+    def tick(self, delta: int) -> None:
+        """
+        Advances all timers, handling the events of any timers that went off.
+
+        :param delta: The time elapsed since the last tick, in milliseconds.
+        :return: None.
+        """
+        if not self._timers:
+            return
+        events = []
+        for event_id, timer in list(self._timers.items()):
+            for _ in range(timer.advance(delta)):
+                events.append(Event(event_id))
+            if timer.done:
+                del self._timers[event_id]
+        self.handle_events(events)
 
     def clear(self) -> None:
         """
-        Clears all registered events.
+        Clears all registered events and timers.
 
         :return: None.
         """
         self._events.clear()
+        self._set_types(())
+        self._timers.clear()
+
+    def _set_types(self, types: tuple[int, ...]) -> None:
+        """
+        Sets the registered event types, and the types to let into the queue along with them.
+
+        :param types: The registered event types.
+        :return: None.
+        """
+        self._types = types
+        self._queued = types + tuple(event_id for event_id in SYSTEM_EVENTS if event_id not in types)
+
+    def _filter(self) -> None:
+        """
+        Makes SDL only queue events of the registered types and `SYSTEM_EVENTS`, if it isn't already.
+        The filter is shared by every handler, so it's applied by whichever handler fetches events.
+
+        :return: None.
+        """
+        global _allowed
+        if _allowed == self._queued:
+            return
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._queued)
+        _allowed = self._queued
+        logger.debug('Event queue filtered to %d event type(s).', len(self._queued))
+
+
+class EventStats:
+    """
+    Counts of the events an EventHandler handled and dropped, in the current frame and in total.
+    Dropped events are the ones without a registered callback.
+    """
+
+    def __init__(self) -> None:
+        self.handled = 0
+        self.dropped = 0
+        self.total_handled = 0
+        self.total_dropped = 0
+
+    def count(self, handled: int, dropped: int) -> None:
+        self.handled += handled
+        self.dropped += dropped
+        self.total_handled += handled
+        self.total_dropped += dropped
+
+    def next_frame(self) -> None:
+        self.handled = 0
+        self.dropped = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'handled': self.handled,
+            'dropped': self.dropped,
+            'total_handled': self.total_handled,
+            'total_dropped': self.total_dropped
+        }
+
+
+class Timer:
+    """
+    A repeating countdown used by the EventHandler to send timed events.
+    """
+
+    def __init__(self, event_id: int, millis: int, loops: int = 0) -> None:
+        self.event_id = event_id
+        self.millis = millis
+        self.loops = loops
+        self._finite = loops > 0
+        self._elapsed = 0
+
+    @property
+    def done(self) -> bool:
+        """
+        Checks if the timer has gone off as many times as it was set to.
+
+        :return: True if the timer is finished, False otherwise.
+        """
+        return self._finite and self.loops <= 0
+
+    def advance(self, delta: int) -> int:
+        """
+        Advances the timer by the given amount of time.
+
+        :param delta: The time to advance by, in milliseconds.
+        :return: The amount of times the timer went off.
+        """
+        self._elapsed += delta
+        fired = self._elapsed // self.millis
+        self._elapsed %= self.millis
+        if self._finite:
+            fired = min(fired, self.loops)
+            self.loops -= fired
+        return fired
 
 
 def new_event() -> int:
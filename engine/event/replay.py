@@ -0,0 +1,162 @@
+import gzip
+import json
+from typing import Optional
+
+import pygame
+from pygame.event import Event
+
+INPUT_EVENTS = frozenset({
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.TEXTINPUT
+})
+"""The event types that come from the user, and are therefore recorded."""
+
+REPLAY_VERSION = 1
+
+
+def split_input(events: list[Event]) -> tuple[list[Event], list[Event]]:
+    """
+    Splits the given events into user input and events sent by the game itself (timers, collisions, etc.).
+
+    :param events: The events to split.
+    :return: A tuple of the input events and the other events.
+    """
+    inputs = []
+    others = []
+    for event in events:
+        (inputs if event.type in INPUT_EVENTS else others).append(event)
+    return inputs, others
+
+
+class EventRecorder:
+    """
+    Records the frame times and user input of a session so it can be replayed by an EventReplayer.
+    """
+
+    def __init__(self, seed: int) -> None:
+        """
+        Creates a new recorder.
+
+        :param seed: The seed the session's random number generator was seeded with.
+        """
+        self._seed = seed
+        self._frames: list[list] = []
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def record(self, delta: int, events: list[Event]) -> None:
+        """
+        Records a single frame. Only input events are kept, everything else is recreated by the game on replay.
+
+        :param delta: The frame time, in milliseconds.
+        :param events: The events of the frame.
+        :return: None.
+        """
+        frame = [delta]
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                frame.append([event.type, _serialize(event.dict)])
+        self._frames.append(frame)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the recording as gzip-compressed JSON.
+
+        :param path: The file to write to.
+        :return: None.
+        """
+        data = {'version': REPLAY_VERSION, 'seed': self._seed, 'frames': self._frames}
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump(data, file, separators=(',', ':'))
+
+
+class EventReplayer:
+    """
+    Plays back a session recorded by an EventRecorder, one frame at a time.
+    """
+
+    def __init__(self, seed: int, frames: list[list]) -> None:
+        self._seed = seed
+        self._frames = frames
+        self._index = 0
+
+    @staticmethod
+    def load(path: str) -> 'EventReplayer':
+        """
+        Loads a recording written by `EventRecorder.save()`.
+
+        :param path: The file to read.
+        :return: A replayer for the recording.
+        :raise ReplayError: Raised if the file is not a supported recording.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version', None) != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {data.get('version', None)} in '{path}'.")
+        return EventReplayer(data['seed'], data['frames'])
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def finished(self) -> bool:
+        return self._index >= len(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def next_frame(self) -> Optional[tuple[int, list[Event]]]:
+        """
+        Gets the next recorded frame.
+
+        :return: A tuple of the frame time in milliseconds and the input events, or None if the replay is finished.
+        """
+        if self.finished:
+            return None
+        delta, *events = self._frames[self._index]
+        self._index += 1
+        return delta, [Event(event_type, _deserialize(attrs)) for event_type, attrs in events]
+
+
+def _serialize(attrs: dict) -> dict:
+    """
+    Keeps the event attributes that can be stored as JSON, such as keys, positions and text.
+
+    :param attrs: The event attributes.
+    :return: The storable event attributes.
+    """
+    kept = {}
+    for name, value in attrs.items():
+        if isinstance(value, (bool, int, float, str)):
+            kept[name] = value
+        elif isinstance(value, tuple) and all(isinstance(v, (int, float)) for v in value):
+            kept[name] = list(value)
+    return kept
+
+
+def _deserialize(attrs: dict) -> dict:
+    """
+    Restores event attributes stored by `_serialize()`.
+
+    :param attrs: The stored event attributes.
+    :return: The event attributes.
+    """
+    return {name: tuple(value) if isinstance(value, list) else value for name, value in attrs.items()}
+
+
+class ReplayError(Exception):
+
+    def __init__(self, msg: str = '') -> None:
+        super().__init__(msg)
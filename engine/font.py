@@ -0,0 +1,42 @@
+from functools import cache
+
+import pygame.font
+from pygame.font import Font
+
+
+def _init() -> None:
+    """
+    Initializes PyGame's font module, if it isn't already.
+
+    :return: None.
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+@cache
+def load_font(path: str, size: int) -> Font:
+    """
+    Loads the font file at the given path. Fonts are cached, so loading the same font and size again is free.
+
+    :param path: The path of the font file.
+    :param size: The size of the font.
+    :return: The loaded font.
+    """
+    _init()
+    return Font(path, size)
+
+
+@cache
+def system_font(name: str, size: int, bold: bool = False) -> Font:
+    """
+    Loads an installed system font.
+    Looking up system fonts can be slow, so this should be done once the font is needed rather than at import time.
+
+    :param name: The name of the font.
+    :param size: The size of the font.
+    :param bold: Whether the font should be bold.
+    :return: The loaded font.
+    """
+    _init()
+    return pygame.font.SysFont(name, size, bold)
@@ -0,0 +1,112 @@
+import atexit
+import logging
+import queue
+import sys
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+_listener: Optional[QueueListener] = None
+_ring: Optional['RingBufferHandler'] = None
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the most recent log records in memory, so they can be inspected (or dumped) after something goes wrong.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        super().__init__()
+        self.records: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def lines(self) -> list[str]:
+        """
+        Formats the kept records.
+
+        :return: The kept records as formatted lines, oldest first.
+        """
+        return [self.format(record) for record in list(self.records)]
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Gets the logger for the given module.
+    Messages should use %-style arguments (`logger.debug('Bat %d spawned.', i)`) rather than f-strings,
+    so they're only formatted if the level is enabled.
+
+    :param name: The name of the module, usually `__name__`.
+    :return: The logger for the module.
+    """
+    return logging.getLogger(name)
+
+
+def configure(level: int = INFO,
+              *,
+              stream: TextIO = sys.stderr,
+              capacity: int = DEFAULT_CAPACITY,
+              fmt: str = DEFAULT_FORMAT) -> None:
+    """
+    Sets up logging for the application.
+    Records at or above the level are put on a queue and written to the stream by a background thread,
+    so a slow or piped terminal never stalls the frame loop. The most recent records are also kept in a ring buffer.
+    Without calling this, only warnings and errors are written (by Python's default handler).
+
+    :param level: The lowest level to log.
+    :param stream: The stream to write to.
+    :param capacity: The amount of records the ring buffer keeps.
+    :param fmt: The format of each written record.
+    :return: None.
+    """
+    global _listener, _ring
+    shutdown()
+    root = logging.getLogger()
+    root.setLevel(level)
+    sink = logging.StreamHandler(stream)
+    sink.setFormatter(logging.Formatter(fmt))
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(records))
+    _ring = RingBufferHandler(capacity)
+    _ring.setFormatter(logging.Formatter(fmt))
+    root.addHandler(_ring)
+    _listener = QueueListener(records, sink)
+    _listener.start()
+
+
+def recent() -> list[str]:
+    """
+    Gets the most recent log records kept by the ring buffer.
+
+    :return: The most recent records as formatted lines, oldest first, or an empty list if logging isn't configured.
+    """
+    return _ring.lines() if _ring is not None else []
+
+
+def shutdown() -> None:
+    """
+    Writes any queued records, stops the background thread and removes the handlers added by `configure()`.
+
+    :return: None.
+    """
+    global _listener, _ring
+    root = logging.getLogger()
+    if _listener is not None:
+        _listener.stop()
+        for handler in list(root.handlers):
+            if isinstance(handler, (QueueHandler, RingBufferHandler)):
+                root.removeHandler(handler)
+        _listener = None
+    _ring = None
+
+
+atexit.register(shutdown)
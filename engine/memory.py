@@ -0,0 +1,174 @@
+import gc
+import weakref
+from typing import Any, Iterable, Optional
+
+from pygame.surface import Surface
+
+
+def surface_bytes(surface: Surface) -> int:
+    """
+    Gets the amount of memory the pixels of a surface take up.
+
+    :param surface: The surface to measure.
+    :return: The size of the surface's pixels, in bytes.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceRecord:
+    """
+    A surface loaded through the engine, with where it came from and who loaded it.
+    """
+
+    __slots__ = ('size', 'path', 'owner', 'dimensions')
+
+    def __init__(self, size: int, path: Optional[str], owner: Optional[str], dimensions: tuple[int, int]) -> None:
+        self.size = size
+        self.path = path
+        self.owner = owner
+        self.dimensions = dimensions
+
+    def as_dict(self) -> dict[str, Any]:
+        return {'bytes': self.size, 'path': self.path, 'owner': self.owner, 'dimensions': self.dimensions}
+
+
+class MemoryTracker:
+    """
+    Keeps track of the memory used by surfaces loaded through the engine, for as long as each surface is alive,
+    and of removed entities so any that are still referenced can be reported as leaks.
+    """
+
+    def __init__(self) -> None:
+        self._surfaces: dict[int, SurfaceRecord] = {}
+        self._removed: weakref.WeakSet = weakref.WeakSet()
+
+    def track(self, surface: Surface, path: Optional[str] = None, owner: Optional[object] = None) -> Surface:
+        """
+        Starts tracking the given surface until it's garbage collected.
+
+        :param surface: The surface to track.
+        :param path: The asset the surface was loaded from, if any.
+        :param owner: The entity (or other object) the surface was loaded for, or None if it's shared.
+        :return: The given surface, so loading can be wrapped in a call to this method.
+        """
+        key = id(surface)
+        label = f'{type(owner).__name__}@{id(owner):x}' if owner is not None else None
+        self._surfaces[key] = SurfaceRecord(surface_bytes(surface), path, label, surface.get_size())
+        weakref.finalize(surface, self._surfaces.pop, key, None)
+        return surface
+
+    def removed(self, entity: object) -> None:
+        """
+        Notes that the entity was removed, so it can be reported if it's never garbage collected.
+
+        :param entity: The removed entity.
+        :return: None.
+        """
+        self._removed.add(entity)
+
+    def total(self) -> int:
+        """
+        Gets the memory used by every tracked surface that's still alive.
+
+        :return: The total size of the tracked surfaces, in bytes.
+        """
+        return sum(record.size for record in self._surfaces.values())
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def by_path(self) -> dict[str, int]:
+        """
+        Gets the memory used per asset, largest first. Surfaces not loaded from a file are grouped under None.
+
+        :return: The total size of the surfaces loaded from each asset path, in bytes.
+        """
+        return self._group('path')
+
+    def by_owner(self) -> dict[str, int]:
+        """
+        Gets the memory used per owning entity, largest first. Shared surfaces are grouped under None.
+
+        :return: The total size of the surfaces loaded for each entity, in bytes.
+        """
+        return self._group('owner')
+
+    def top(self, count: int = 10) -> list[SurfaceRecord]:
+        """
+        Gets the largest tracked surfaces.
+
+        :param count: The amount of surfaces to get.
+        :return: The records of the largest surfaces, largest first.
+        """
+        return sorted(self._surfaces.values(), key=lambda record: record.size, reverse=True)[:count]
+
+    def leaks(self, holders: Iterable[object] = ()) -> list[dict[str, Any]]:
+        """
+        Finds removed entities that are still alive after a full garbage collection.
+
+        :param holders: Objects that may be keeping removed entities alive, such as entity handlers and listeners.
+        Each leaked entity lists which of these refer to it, directly or through one of their lists or dicts.
+        :return: A description of each leaked entity and what's referring to it.
+        """
+        gc.collect()
+        holders = list(holders)
+        leaks = []
+        for entity in list(self._removed):
+            referrers = gc.get_referrers(entity)
+            held_by = [type(holder).__name__ for holder in holders if _refers_to(holder, entity, referrers)]
+            leaks.append({'entity': f'{type(entity).__name__}@{id(entity):x}', 'held_by': held_by})
+        return leaks
+
+    def report(self, count: int = 10) -> dict[str, Any]:
+        """
+        Summarizes the tracked memory.
+
+        :param count: The amount of largest surfaces, assets and owners to include.
+        :return: The summary.
+        """
+        return {
+            'total_bytes': self.total(),
+            'surfaces': len(self),
+            'top_surfaces': [record.as_dict() for record in self.top(count)],
+            'top_paths': dict(list(self.by_path().items())[:count]),
+            'top_owners': dict(list(self.by_owner().items())[:count])
+        }
+
+    def clear(self) -> None:
+        """
+        Stops tracking every surface and removed entity.
+
+        :return: None.
+        """
+        self._surfaces.clear()
+        self._removed = weakref.WeakSet()
+
+    def _group(self, attribute: str) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for record in self._surfaces.values():
+            key = getattr(record, attribute)
+            totals[key] = totals.get(key, 0) + record.size
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _refers_to(holder: object, entity: object, referrers: list[object]) -> bool:
+    """
+    Checks if the holder refers to the entity, either directly or through one of its attributes' containers.
+
+    :param holder: The possible holder.
+    :param entity: The entity.
+    :param referrers: The objects that directly refer to the entity.
+    :return: True if the holder refers to the entity, False otherwise.
+    """
+    if any(referrer is holder or referrer is getattr(holder, '__dict__', None) for referrer in referrers):
+        return True
+    for value in getattr(holder, '__dict__', {}).values():
+        if isinstance(value, dict):
+            value = [item for items in value.values() for item in (items if isinstance(items, list) else [items])]
+        if isinstance(value, (list, tuple, set)) and any(item is entity for item in value):
+            return True
+    return False
+
+
+tracker = MemoryTracker()
+"""The tracker used by the engine when loading surfaces and removing entities."""
@@ -0,0 +1,227 @@
+import time
+from typing import Optional, Protocol
+
+from pymunk import Body, Shape, Space
+
+from engine.window.location import Location
+
+DEFAULT_SLEEP_TIME = 0.5
+DEFAULT_ITERATIONS = 10
+DEFAULT_BUDGET = 4.0
+
+
+class PhysicsBody(Protocol):
+    """
+    Anything with a pymunk body and shape that can be added to Physics, such as a PymunkCircle.
+    """
+
+    body: Body
+    shape: Shape
+    loc: Location
+
+
+class PhysicsStats:
+    """
+    Timing metrics of a Physics simulation, updated every step.
+    """
+
+    def __init__(self) -> None:
+        self.steps = 0
+        """The amount of steps taken."""
+        self.substeps = 0
+        """The amount of substeps used by the last step."""
+        self.last_ms = 0.0
+        """The time the last step took, in milliseconds."""
+        self.average_ms = 0.0
+        """The exponential moving average of the step time, in milliseconds."""
+        self.max_ms = 0.0
+        """The longest time a step took, in milliseconds."""
+        self.over_budget = 0
+        """The amount of steps that took longer than the budget."""
+
+    def record(self, substeps: int, elapsed_ms: float, budget_ms: float) -> None:
+        """
+        Records a step.
+
+        :param substeps: The amount of substeps used.
+        :param elapsed_ms: The time the step took, in milliseconds.
+        :param budget_ms: The time the step was budgeted, in milliseconds.
+        :return: None.
+        """
+        self.steps += 1
+        self.substeps = substeps
+        self.last_ms = elapsed_ms
+        self.average_ms = elapsed_ms if self.steps == 1 else self.average_ms * 0.9 + elapsed_ms * 0.1
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if elapsed_ms > budget_ms:
+            self.over_budget += 1
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(vars(self))
+
+
+class Physics:
+    """
+    Manages a pymunk Space and keeps the locations of its entities in sync with their bodies.
+    Bodies that have come to rest are put to sleep, and are neither simulated nor synced until woken up.
+    """
+
+    def __init__(self,
+                 *,
+                 gravity: tuple[float, float] = (0, 0),
+                 sleep_time: Optional[float] = DEFAULT_SLEEP_TIME,
+                 spatial_hash: Optional[tuple[float, int]] = None,
+                 substeps: int = 1,
+                 iterations: int = DEFAULT_ITERATIONS,
+                 adaptive: bool = False,
+                 budget: float = DEFAULT_BUDGET) -> None:
+        """
+        Creates a new physics simulation.
+
+        :param gravity: The gravity applied to every dynamic body.
+        :param sleep_time: The time in seconds a body has to be idle before it's put to sleep, or None to never sleep.
+        :param spatial_hash: The cell size and expected amount of shapes to use a spatial hash with,
+        or None to use pymunk's default bounding box tree. A spatial hash is faster for many equally sized shapes.
+        :param substeps: The amount of smaller steps each step is split into.
+        More substeps stop fast bodies from passing through thin shapes, at the cost of more time.
+        :param iterations: The amount of iterations pymunk's solver uses per substep. Fewer is faster but less accurate.
+        :param adaptive: Whether to lower the substeps (down to 1) while steps take longer than the budget,
+        and raise them back up to `substeps` once there's headroom again.
+        :param budget: The time a step is budgeted, in milliseconds.
+        :raise PhysicsError: Raised if the substeps or iterations are less than 1.
+        """
+        if substeps < 1 or iterations < 1:
+            raise PhysicsError(f'Substeps and iterations must be at least 1, got {substeps} and {iterations}.')
+        self.space = Space()
+        self.space.gravity = gravity
+        if sleep_time is not None:
+            self.space.sleep_time_threshold = sleep_time
+        if spatial_hash is not None:
+            self.space.use_spatial_hash(*spatial_hash)
+        self.space.iterations = iterations
+        self._synced: list[PhysicsBody] = []
+        self._max_substeps = substeps
+        self._substeps = substeps
+        self.adaptive = adaptive
+        self.budget = budget
+        self.stats = PhysicsStats()
+
+    @property
+    def gravity(self) -> tuple[float, float]:
+        return tuple(self.space.gravity)
+
+    @gravity.setter
+    def gravity(self, value: tuple[float, float]) -> None:
+        self.space.gravity = value
+
+    @property
+    def iterations(self) -> int:
+        return self.space.iterations
+
+    @iterations.setter
+    def iterations(self, value: int) -> None:
+        self.space.iterations = value
+
+    @property
+    def substeps(self) -> int:
+        """
+        Gets the amount of substeps the next step will use, which may be lowered in adaptive mode.
+
+        :return: The amount of substeps the next step will use.
+        """
+        return self._substeps
+
+    @property
+    def max_substeps(self) -> int:
+        return self._max_substeps
+
+    @max_substeps.setter
+    def max_substeps(self, value: int) -> None:
+        """
+        Sets the amount of substeps each step is split into, or the most substeps in adaptive mode.
+
+        :param value: The amount of substeps.
+        :return: None.
+        :raise PhysicsError: Raised if the value is less than 1.
+        """
+        if value < 1:
+            raise PhysicsError(f'Substeps must be at least 1, got {value}.')
+        self._max_substeps = value
+        self._substeps = min(self._substeps, value) if self.adaptive else value
+
+    def add(self, entity: PhysicsBody) -> None:
+        """
+        Adds the entity's body and shape to the simulation.
+        Dynamic bodies start at the entity's current location, and update it after every step.
+
+        :param entity: The entity to add.
+        :return: None.
+        """
+        if entity.body.body_type == Body.DYNAMIC:
+            entity.body.position = entity.loc.as_tuple()
+            self._synced.append(entity)
+        self.space.add(entity.body, entity.shape)
+
+    def remove(self, entity: PhysicsBody) -> None:
+        """
+        Removes the entity's body and shape from the simulation.
+
+        :param entity: The entity to remove.
+        :return: None.
+        """
+        self.space.remove(entity.body, entity.shape)
+        if entity.body.body_type == Body.DYNAMIC:
+            self._synced.remove(entity)
+
+    def step(self, dt: float) -> None:
+        """
+        Advances the simulation in substeps, then syncs every awake body's position to its entity's location.
+
+        :param dt: The time to advance by, in seconds.
+        :return: None.
+        """
+        start = time.perf_counter()
+        substeps = self._substeps
+        substep = dt / substeps
+        for _ in range(substeps):
+            self.space.step(substep)
+        self.sync()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats.record(substeps, elapsed, self.budget)
+        if self.adaptive:
+            self._adapt(elapsed)
+
+    def sync(self) -> None:
+        """
+        Copies the position of every awake dynamic body to its entity's location.
+
+        :return: None.
+        """
+        for entity in self._synced:
+            body = entity.body
+            if body.is_sleeping:
+                continue
+            loc = entity.loc
+            loc.x, loc.y = body.position
+
+    def _adapt(self, elapsed: float) -> None:
+        """
+        Lowers the substeps if the last step was over budget, or raises them if there's room for another substep.
+
+        :param elapsed: The time the last step took, in milliseconds.
+        :return: None.
+        """
+        if elapsed > self.budget and self._substeps > 1:
+            self._substeps -= 1
+        elif (self._substeps < self._max_substeps
+              and elapsed / self._substeps * (self._substeps + 1) < self.budget * 0.8):
+            self._substeps += 1
+
+    def __len__(self) -> int:
+        return len(self.space.bodies)
+
+
+class PhysicsError(Exception):
+
+    def __init__(self, msg: str = '') -> None:
+        super().__init__(msg)
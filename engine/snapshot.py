@@ -0,0 +1,163 @@
+import struct
+from typing import Iterable, Optional
+
+from engine.entity.entity import Entity
+
+DEFAULT_CAPACITY = 120
+"""The amount of snapshots kept by default, five seconds at 24 frames per second."""
+
+_HEADER = struct.Struct('<q')
+"""The frame number at the start of every snapshot."""
+
+
+class SnapshotBuffer:
+    """
+    Saves the state of a fixed list of entities into a preallocated ring buffer of binary snapshots,
+    and restores any saved snapshot onto the same entities without re-creating them.
+    Each entity's state is packed with its own `struct` format (see `Entity.state_format()`), so a snapshot of a few
+    hundred entities is a few kilobytes, and saving one doesn't allocate anything but the packed values.
+
+    Entities are expected to stay registered while their snapshots are in use; removed entities can't be restored.
+    Only entity state is saved. Game state outside entities, such as scores, timers and the random number generator,
+    is up to the caller.
+    """
+
+    def __init__(self, entities: Iterable[Entity], capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Creates a new snapshot buffer.
+
+        :param entities: The entities to save and restore.
+        :param capacity: The amount of snapshots kept, older snapshots are overwritten.
+        :raise SnapshotError: Raised if the capacity is less than 1.
+        """
+        if capacity < 1:
+            raise SnapshotError(f'Snapshot capacity must be at least 1, got {capacity}.')
+        self._entities = list(entities)
+        structs: dict[str, struct.Struct] = {}
+        self._structs = [structs.setdefault(fmt, struct.Struct('<' + fmt))
+                         for fmt in (entity.state_format() for entity in self._entities)]
+        self._size = _HEADER.size + sum(packer.size for packer in self._structs)
+        self._capacity = capacity
+        self._data = bytearray(self._size * capacity)
+        self._frames: list[Optional[int]] = [None] * capacity
+        self._next = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def snapshot_size(self) -> int:
+        """
+        Gets the size of a single snapshot.
+
+        :return: The size of a snapshot, in bytes.
+        """
+        return self._size
+
+    @property
+    def frames(self) -> list[int]:
+        """
+        Gets the frames that have a saved snapshot.
+
+        :return: The saved frames, oldest first.
+        """
+        slots = range(self._next, self._next + self._capacity)
+        return [frame for frame in (self._frames[slot % self._capacity] for slot in slots) if frame is not None]
+
+    @property
+    def latest(self) -> Optional[int]:
+        return self._frames[(self._next - 1) % self._capacity]
+
+    def __len__(self) -> int:
+        return sum(1 for frame in self._frames if frame is not None)
+
+    def __contains__(self, frame: int) -> bool:
+        return frame in self._frames
+
+    def save(self, frame: int) -> None:
+        """
+        Saves the current state of the entities as the snapshot of the given frame, overwriting the oldest snapshot
+        if the buffer is full.
+
+        :param frame: The frame the snapshot is of.
+        :return: None.
+        """
+        slot = self._next
+        self._pack_into(self._data, slot * self._size, frame)
+        self._frames[slot] = frame
+        self._next = (slot + 1) % self._capacity
+
+    def restore(self, frame: Optional[int] = None, *, rewind: bool = True) -> int:
+        """
+        Restores the entities to the snapshot of the given frame.
+
+        :param frame: The frame to restore, or None to restore the latest snapshot.
+        :param rewind: Whether to drop the snapshots saved after the restored one, so resimulating from the restored
+        frame saves its snapshots in their place.
+        :return: The restored frame.
+        :raise SnapshotError: Raised if there's no snapshot of the given frame.
+        """
+        if frame is None:
+            frame = self.latest
+        if frame is None or frame not in self._frames:
+            raise SnapshotError(f'No snapshot of frame {frame}.')
+        # Search newest first, in case a frame was saved more than once.
+        slot = next(slot % self._capacity for slot in range(self._next - 1, self._next - 1 - self._capacity, -1)
+                    if self._frames[slot % self._capacity] == frame)
+        self._unpack_from(self._data, slot * self._size)
+        if rewind:
+            newer = (slot + 1) % self._capacity
+            while newer != self._next:
+                self._frames[newer] = None
+                newer = (newer + 1) % self._capacity
+            self._next = (slot + 1) % self._capacity
+        return frame
+
+    def capture(self, frame: int = 0) -> bytes:
+        """
+        Saves the current state of the entities outside the ring buffer, such as for a checkpoint.
+
+        :param frame: The frame the snapshot is of.
+        :return: The snapshot.
+        """
+        data = bytearray(self._size)
+        self._pack_into(data, 0, frame)
+        return bytes(data)
+
+    def apply(self, data: bytes) -> int:
+        """
+        Restores the entities to a snapshot made by `capture()`.
+
+        :param data: The snapshot.
+        :return: The frame the snapshot is of.
+        :raise SnapshotError: Raised if the snapshot was made for different entities.
+        """
+        if len(data) != self._size:
+            raise SnapshotError(f'Snapshot is {len(data)} bytes, expected {self._size}.')
+        return self._unpack_from(data, 0)
+
+    def clear(self) -> None:
+        self._frames = [None] * self._capacity
+        self._next = 0
+
+    def _pack_into(self, buffer: bytearray, offset: int, frame: int) -> None:
+        _HEADER.pack_into(buffer, offset, frame)
+        offset += _HEADER.size
+        for entity, packer in zip(self._entities, self._structs):
+            packer.pack_into(buffer, offset, *entity.save_state())
+            offset += packer.size
+
+    def _unpack_from(self, buffer: bytes, offset: int) -> int:
+        frame, = _HEADER.unpack_from(buffer, offset)
+        offset += _HEADER.size
+        for entity, packer in zip(self._entities, self._structs):
+            entity.load_state(iter(packer.unpack_from(buffer, offset)))
+            offset += packer.size
+        return frame
+
+
+class SnapshotError(Exception):
+
+    def __init__(self, msg: str = '') -> None:
+        super().__init__(msg)
@@ -1,10 +1,30 @@
-from random import randint
+from random import Random
+from typing import Optional
 
 from pygame.color import Color
 
 BLACK = Color(0, 0, 0)
 WHITE = Color(255, 255, 255)
 
+rng = Random()
+"""
+The random number generator used by the engine and games.
+Everything random should go through this generator so sessions can be reproduced by seeding it.
+"""
+
+
+def seed(value: Optional[int] = None) -> int:
+    """
+    Seeds the shared random number generator.
+
+    :param value: The seed, or None to pick a random seed.
+    :return: The seed used.
+    """
+    if value is None:
+        value = Random().randrange(2 ** 32)
+    rng.seed(value)
+    return value
+
 
 def random_color() -> Color:
     """
@@ -12,4 +32,4 @@ def random_color() -> Color:
 
     :return: A random color.
     """
-    return Color(randint(0, 255), randint(0, 255), randint(0, 255))
+    return Color(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
@@ -0,0 +1,262 @@
+from collections import deque
+from typing import Any, Callable, Optional, Sequence, TYPE_CHECKING
+
+from engine.entity.entity import Entity
+from engine.entity.parallax import Parallax
+from engine.entity.sprite import Sprite
+from engine.log import get_logger
+
+if TYPE_CHECKING:
+    from engine.window.scene import Scene
+
+logger = get_logger(__name__)
+
+DEFAULT_SAMPLES = 30
+"""The amount of frames averaged before the governor changes levels."""
+DEFAULT_HEADROOM = 0.75
+"""The share of the budget frames must fit in before a level is restored."""
+
+
+class DegradationLevel:
+    """
+    A way of making frames cheaper, applied by a FrameGovernor when frames run over budget.
+    `apply()` is called once when the level is reached, and `restore()` once when frames have enough headroom again.
+    Levels whose targets change while they're active (such as entities created later) can also implement `update()`,
+    which is called every frame while the level is active, so it should only look at the entities it affects.
+    """
+
+    def __init__(self,
+                 name: str,
+                 apply: Optional[Callable[['Scene'], Any]] = None,
+                 restore: Optional[Callable[['Scene'], Any]] = None,
+                 update: Optional[Callable[['Scene'], Any]] = None) -> None:
+        """
+        Creates a new degradation level, either from hooks or by subclassing.
+
+        :param name: The name of the level, used in logs and stats.
+        :param apply: Called with the scene when the level is reached.
+        :param restore: Called with the scene when the level is no longer active.
+        :param update: Called with the scene every frame while the level is active, or None if it's not needed.
+        """
+        self.name = name
+        self._apply = apply
+        self._restore = restore
+        self._update = update
+
+    def apply(self, scene: 'Scene') -> None:
+        if self._apply is not None:
+            self._apply(scene)
+
+    def update(self, scene: 'Scene') -> None:
+        if self._update is not None:
+            self._update(scene)
+
+    def restore(self, scene: 'Scene') -> None:
+        if self._restore is not None:
+            self._restore(scene)
+
+
+class SkipFarLayers(DegradationLevel):
+    """
+    Stops drawing the farthest layers of every parallax background.
+    """
+
+    def __init__(self, layers: int = 1) -> None:
+        super().__init__(f'skip {layers} far layer(s)')
+        self.layers = layers
+
+    def apply(self, scene: 'Scene') -> None:
+        self.update(scene)
+
+    def update(self, scene: 'Scene') -> None:
+        # Backgrounds may be replaced while the level is active, such as on a new game.
+        for parallax in scene.entity_handler.of_type(Parallax):
+            parallax.skipped_layers = self.layers
+
+    def restore(self, scene: 'Scene') -> None:
+        for parallax in scene.entity_handler.of_type(Parallax):
+            parallax.skipped_layers = 0
+
+
+class ReduceDistantAnimation(DegradationLevel):
+    """
+    Updates the animations of sprites far away from a focus entity (such as the player) less often.
+    """
+
+    def __init__(self, focus: Entity, distance: float, step: int = 3) -> None:
+        """
+        :param focus: The entity distance is measured from. Its own animation is never reduced.
+        :param distance: The distance from the focus beyond which animations are reduced.
+        :param step: The amount of ticks between animation updates of distant sprites.
+        """
+        super().__init__('reduce distant animation')
+        self.focus = focus
+        self.distance = distance
+        self.step = step
+
+    def apply(self, scene: 'Scene') -> None:
+        self.update(scene)
+
+    def update(self, scene: 'Scene') -> None:
+        # Sprites move in and out of the distance, so they're checked every frame.
+        limit = self.distance * self.distance
+        for sprite in scene.entity_handler.of_type(Sprite):
+            if sprite is not self.focus:
+                sprite.animation_step = self.step if sprite.loc.dist_sqr(self.focus.loc) > limit else 1
+
+    def restore(self, scene: 'Scene') -> None:
+        for sprite in scene.entity_handler.of_type(Sprite):
+            sprite.animation_step = 1
+
+
+class HalveSubsteps(DegradationLevel):
+    """
+    Halves the (maximum) physics substeps of the scene, down to one.
+    """
+
+    def __init__(self) -> None:
+        super().__init__('halve physics substeps')
+        self._original: Optional[int] = None
+
+    def apply(self, scene: 'Scene') -> None:
+        if not scene.has_physics or self._original is not None:
+            return
+        self._original = scene.physics.max_substeps
+        scene.physics.max_substeps = max(1, self._original // 2)
+
+    def restore(self, scene: 'Scene') -> None:
+        if self._original is not None and scene.has_physics:
+            scene.physics.max_substeps = self._original
+        self._original = None
+
+
+class CapSpawns(DegradationLevel):
+    """
+    Lowers the scene's spawn limit, see `EntityHandler.can_spawn()`.
+    """
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(f'cap spawns at {limit}')
+        self.limit = limit
+
+    def apply(self, scene: 'Scene') -> None:
+        scene.entity_handler.spawn_limit = self.limit
+
+    def restore(self, scene: 'Scene') -> None:
+        scene.entity_handler.spawn_limit = None
+
+
+class GovernorStats:
+    """
+    Statistics about the frames a FrameGovernor has seen and the levels it went through.
+    """
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.over_budget = 0
+        """The amount of frames that took longer than the budget."""
+        self.degradations = 0
+        self.restorations = 0
+        self.frames_per_level: dict[int, int] = {}
+        """The amount of frames spent at each level."""
+        self.average_ms = 0.0
+        """The average frame time of the last full sample window."""
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'frames': self.frames,
+            'over_budget': self.over_budget,
+            'degradations': self.degradations,
+            'restorations': self.restorations,
+            'frames_per_level': dict(self.frames_per_level),
+            'average_ms': self.average_ms
+        }
+
+
+class FrameGovernor:
+    """
+    Watches frame times against a budget, and applies degradation levels one by one while frames are over budget,
+    restoring them (last applied first) once frames fit comfortably in the budget again.
+    Levels only change after a full window of samples, and the window starts over after each change,
+    so one slow frame never changes the level and levels don't flap.
+    """
+
+    def __init__(self,
+                 budget: float,
+                 levels: Sequence[DegradationLevel] = (),
+                 *,
+                 samples: int = DEFAULT_SAMPLES,
+                 headroom: float = DEFAULT_HEADROOM) -> None:
+        """
+        Creates a new governor.
+
+        :param budget: The time a frame is budgeted, in milliseconds, usually `1000 / fps`.
+        :param levels: The degradation levels, applied in order.
+        :param samples: The amount of frames averaged before the level changes.
+        :param headroom: The share of the budget the average frame must fit in before a level is restored.
+        """
+        self.budget = budget
+        self.levels = list(levels)
+        self.samples = samples
+        self.headroom = headroom
+        self.stats = GovernorStats()
+        self._level = 0
+        self._times: deque[float] = deque(maxlen=samples)
+
+    @property
+    def level(self) -> int:
+        """
+        Gets the amount of applied degradation levels.
+
+        :return: The current level, 0 if nothing is degraded.
+        """
+        return self._level
+
+    @property
+    def active(self) -> list[DegradationLevel]:
+        return self.levels[:self._level]
+
+    def record(self, scene: 'Scene', elapsed: float) -> None:
+        """
+        Records the time of a frame of the given scene, and changes the level if needed.
+        A level is applied once when it's reached, and active levels are updated every frame.
+
+        :param scene: The scene the frame was of.
+        :param elapsed: The time the frame took, in milliseconds.
+        :return: None.
+        """
+        self.stats.frames += 1
+        self.stats.frames_per_level[self._level] = self.stats.frames_per_level.get(self._level, 0) + 1
+        if elapsed > self.budget:
+            self.stats.over_budget += 1
+        self._times.append(elapsed)
+        if len(self._times) == self.samples:
+            average = sum(self._times) / self.samples
+            self.stats.average_ms = average
+            if average > self.budget and self._level < len(self.levels):
+                self._level += 1
+                self.stats.degradations += 1
+                self._times.clear()
+                self.levels[self._level - 1].apply(scene)
+                logger.info("Frames average %.1fms over a %.1fms budget, applying '%s'.",
+                            average, self.budget, self.levels[self._level - 1].name)
+            elif average < self.budget * self.headroom and self._level > 0:
+                self._level -= 1
+                self.stats.restorations += 1
+                self._times.clear()
+                self.levels[self._level].restore(scene)
+                logger.info("Frames average %.1fms, restoring '%s'.", average, self.levels[self._level].name)
+        for level in self.active:
+            level.update(scene)
+
+    def reset(self, scene: 'Scene') -> None:
+        """
+        Restores every applied level and forgets the recorded frame times.
+
+        :param scene: The scene the levels were applied to.
+        :return: None.
+        """
+        for level in reversed(self.active):
+            level.restore(scene)
+        self._level = 0
+        self._times.clear()
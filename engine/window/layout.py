@@ -0,0 +1,141 @@
+from typing import Callable, Optional, TYPE_CHECKING
+
+from pygame import Rect
+
+from engine.window.location import Location
+from engine.window.resolution import Resolution
+
+if TYPE_CHECKING:
+    from engine.entity.entity import Entity
+
+Placement = Callable[[Resolution, Rect], Location]
+"""Places a box in a window of the given resolution, such as `Location.center` or `Location.top_right`."""
+
+
+class Anchor:
+    """
+    An entity placed at a spot of the window, such as its center or top right corner.
+    """
+
+    def __init__(self,
+                 entity: 'Entity',
+                 placement: Placement,
+                 offset: tuple[int, int] = (0, 0),
+                 box: Optional['Entity'] = None,
+                 follow_size: bool = True) -> None:
+        """
+        Creates a new anchor.
+
+        :param entity: The entity to place.
+        :param placement: Where to place the entity, such as `Location.center`.
+        :param offset: The distance from the placed location, such as a margin from the corner of the window.
+        :param box: The entity whose bounding box is placed, or None to place the entity's own bounding box.
+        Useful for groups, such as placing a menu by the size of its title.
+        :param follow_size: Whether to place the entity again when the size of its box changes, False to only
+        place it again when the resolution changes, such as for a character that moves on its own.
+        """
+        self.entity = entity
+        self.placement = placement
+        self.offset = offset
+        self.box = box
+        self.follow_size = follow_size
+        self._resolved: Optional[tuple[tuple[int, int], tuple[int, int]]] = None
+
+    def update(self, res: Resolution, scale: float = 1) -> None:
+        """
+        Places the entity, if the resolution (or the size of its box, if followed) changed since it was last placed.
+
+        :param res: The resolution of the window.
+        :param scale: The amount to scale the offset by.
+        :return: None.
+        """
+        if not self.follow_size and self._resolved is not None and self._resolved[0] == res.as_tuple():
+            return
+        box = (self.box if self.box is not None else self.entity).bounds()
+        key = (res.as_tuple(), box.size)
+        if key == self._resolved:
+            return
+        loc = self.placement(res, box)
+        self.entity.loc = Location(loc.x + round(self.offset[0] * scale), loc.y + round(self.offset[1] * scale))
+        self._resolved = key
+
+    def invalidate(self) -> None:
+        self._resolved = None
+
+
+class Layout:
+    """
+    The anchors of a scene's entities, which are placed again whenever the window's resolution
+    or the size of an anchored entity (such as text that changed) changes.
+    Checking an anchor costs a call to `bounds()`, so layouts can be updated every frame.
+    """
+
+    def __init__(self, reference: Optional[Resolution] = None) -> None:
+        """
+        Creates a new, empty layout.
+
+        :param reference: The resolution offsets are given at, so they're scaled along with the window,
+        or None to keep offsets the same at any resolution.
+        """
+        self.reference = reference
+        self._anchors: dict['Entity', Anchor] = {}
+
+    def __len__(self) -> int:
+        return len(self._anchors)
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        return entity in self._anchors
+
+    def anchor(self,
+               entity: 'Entity',
+               placement: Placement,
+               offset: tuple[int, int] = (0, 0),
+               *,
+               box: Optional['Entity'] = None,
+               follow_size: bool = True) -> Anchor:
+        """
+        Anchors an entity at a spot of the window, replacing its previous anchor.
+        The entity is placed on the next update.
+
+        :param entity: The entity to place.
+        :param placement: Where to place the entity, such as `Location.center`.
+        :param offset: The distance from the placed location.
+        :param box: The entity whose bounding box is placed, or None to place the entity's own bounding box.
+        :param follow_size: Whether to place the entity again when the size of its box changes.
+        :return: The anchor.
+        """
+        anchor = Anchor(entity, placement, offset, box, follow_size)
+        self._anchors[entity] = anchor
+        return anchor
+
+    def release(self, entity: 'Entity') -> None:
+        """
+        Removes the anchor of an entity, if it has one. The entity keeps its location.
+
+        :param entity: The anchored entity.
+        :return: None.
+        """
+        self._anchors.pop(entity, None)
+
+    def update(self, res: Resolution) -> None:
+        """
+        Places every anchored entity whose placement changed.
+
+        :param res: The resolution of the window.
+        :return: None.
+        """
+        scale = self.reference.ratio_to(res) if self.reference is not None else 1
+        for anchor in self._anchors.values():
+            anchor.update(res, scale)
+
+    def invalidate(self) -> None:
+        """
+        Makes every anchored entity be placed again on the next update, such as after game code moved them.
+
+        :return: None.
+        """
+        for anchor in self._anchors.values():
+            anchor.invalidate()
+
+    def clear(self) -> None:
+        self._anchors.clear()
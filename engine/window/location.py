@@ -1,8 +1,9 @@
 from math import sqrt
-from random import randint
+from typing import Optional
 
 from pygame import Rect
 
+from engine.utils import rng
 from engine.window.resolution import Resolution
 
 
@@ -19,12 +20,14 @@ class Location:
         return f"{self.x}, {self.y}"
 
     @staticmethod
-    def top_left() -> 'Location':
+    def top_left(res: Optional[Resolution] = None, box: Optional[Rect] = None) -> 'Location':
         """
         Corresponds to the top left of the window.
         The coordinate calculations can be summed by:
         (0, 0)
 
+        :param res: The resolution of the window, unused but accepted like the other placements.
+        :param box: The bounding box of the object, unused but accepted like the other placements.
         :return: A location corresponding to the top left of the window.
         """
         return Location(0, 0)
@@ -153,8 +156,8 @@ class Location:
         :param box: The bounding box of the object.
         :return: A random location in the window.
         """
-        w = randint(0, res.width - box.w)
-        h = randint(0, res.height - box.h)
+        w = rng.randint(0, res.width - box.w)
+        h = rng.randint(0, res.height - box.h)
         return Location(w, h)
 
     def add(self, x: int = 0, y: int = 0) -> None:
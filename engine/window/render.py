@@ -0,0 +1,69 @@
+from typing import NamedTuple, Optional
+
+from pygame import Rect
+from pygame.surface import Surface
+
+
+class BlitCommand(NamedTuple):
+    """
+    Draws a surface at a position.
+    """
+
+    surface: Surface
+    position: tuple[int, int]
+    layer: int
+    area: Optional[Rect] = None
+
+
+class RenderBuffer:
+    """
+    A list of render commands, recorded by entities during the update and replayed onto a surface later.
+    Commands only hold surfaces and copied values, so a recorded buffer is unaffected by the next update,
+    which lets the update of one frame run while the previous frame is being drawn.
+
+    Entities can draw to a buffer as if it were a surface, as long as they only call `blit()` or `blits()`.
+    Shapes are blitted from cached surfaces (see `engine.entity.shapes`), so they can be recorded too.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[BlitCommand] = []
+        self.layer = 0
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def blit(self, source: Surface, dest: tuple[int, int], area: Optional[Rect] = None) -> None:
+        """
+        Records drawing the source surface at the given position.
+
+        :param source: The surface to draw.
+        :param dest: The position to draw the surface at.
+        :param area: The part of the surface to draw, or None to draw all of it.
+        :return: None.
+        """
+        self.commands.append(BlitCommand(source, (dest[0], dest[1]), self.layer, area))
+
+    def blits(self, sequence: list[tuple], doreturn: bool = False) -> None:
+        """
+        Records drawing many surfaces, like `Surface.blits()`.
+
+        :param sequence: Tuples of a surface, a position and optionally an area.
+        :param doreturn: Ignored, as nothing is drawn yet.
+        :return: None.
+        """
+        for blit in sequence:
+            self.blit(*blit)
+
+    def render(self, surface: Surface) -> None:
+        """
+        Replays every command onto the given surface, in the order they were recorded, in a single
+        `Surface.blits()` call.
+
+        :param surface: The surface to draw to.
+        :return: None.
+        """
+        surface.blits([(command.surface, command.position, command.area) for command in self.commands], False)
+
+    def clear(self) -> None:
+        self.commands.clear()
+        self.layer = 0
@@ -4,6 +4,7 @@ from enum import Enum
 class Resolution:
     """
     A basic class for storing a specific resolution and scalar.
+    The scalar is relative to the 1024x576 resolution, which has a scalar of 1.0.
     """
 
     def __init__(self, w: int, h: int, scalar: float) -> None:
@@ -31,12 +32,23 @@ class Resolution:
         """
         return self._w, self._h
 
+    def ratio_to(self, res: 'Resolution') -> float:
+        """
+        Gets how many times larger the given resolution is than this one, using the resolution scalars.
+        For example, `P360` to `P720` has a ratio of 2.0.
+
+        :param res: The resolution to compare against.
+        :return: The ratio between the given resolution's scalar and this resolution's scalar.
+        """
+        return res.scalar / self._scalar
+
 
 class Resolutions(Enum):
     """
     An enum for most, if not all, 16:9 ratio resolutions.
     """
 
+    P360 = Resolution(640, 360, 0.625)
     P576 = Resolution(1024, 576, 1.0)
     P648 = Resolution(1152, 648, 1.125)
     P720 = Resolution(1280, 720, 1.25)
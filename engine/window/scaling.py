@@ -0,0 +1,126 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Sequence
+
+import pygame
+from pygame.surface import Surface
+
+from engine.log import get_logger
+from engine.memory import tracker
+
+logger = get_logger(__name__)
+
+Size = tuple[int, int]
+
+
+class AssetScaler:
+    """
+    Keeps the original, unscaled surfaces of image assets, so they can be scaled to any size again
+    (such as when the resolution changes) without reloading them or scaling an already-scaled copy.
+    Originals are only kept while some entity owns them (see `acquire()` and `release()`).
+    Rescaling can be done on a background thread, so changing resolution doesn't stall the frame loop.
+    """
+
+    def __init__(self) -> None:
+        self._originals: dict[str, Surface] = {}
+        self._owners: dict[str, int] = {}
+        self._worker: Optional[ThreadPoolExecutor] = None
+
+    def acquire(self, *paths: str) -> None:
+        """
+        Keeps the originals of the image files at the given paths until they're released as many times.
+        Entities that rescale their images acquire them when they're loaded, and release them when they're removed.
+
+        :param paths: The paths of the image files.
+        :return: None.
+        """
+        for path in paths:
+            self._owners[path] = self._owners.get(path, 0) + 1
+
+    def release(self, *paths: str) -> None:
+        """
+        Releases the originals of the image files at the given paths, forgetting those that have no owners left.
+
+        :param paths: The paths of the image files.
+        :return: None.
+        """
+        for path in paths:
+            owners = self._owners.get(path, 0) - 1
+            if owners > 0:
+                self._owners[path] = owners
+            else:
+                self._owners.pop(path, None)
+                self._originals.pop(path, None)
+
+    def original(self, path: str) -> Surface:
+        """
+        Gets the original surface of the image file at the given path, loading it if it isn't kept.
+        The surface is converted to the display's pixel format if there is a display.
+
+        :param path: The path of the image file.
+        :return: The original surface, which should not be changed as it's shared.
+        """
+        if surface := self._originals.get(path, None):
+            return surface
+        surface = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        tracker.track(surface, path)
+        if path in self._owners:
+            self._originals[path] = surface
+        return surface
+
+    def scale(self, path: str, size: Size) -> Surface:
+        """
+        Scales the original surface of the image file at the given path.
+
+        :param path: The path of the image file.
+        :param size: The size to scale to.
+        :return: A new, scaled surface.
+        """
+        return pygame.transform.scale(self.original(path), size)
+
+    def scaled_size(self, path: str, scalar: float) -> Size:
+        """
+        Gets the size of the image file at the given path when scaled by the given scalar.
+
+        :param path: The path of the image file.
+        :param scalar: The amount to scale by.
+        :return: The scaled size.
+        """
+        width, height = self.original(path).get_size()
+        return int(width * scalar), int(height * scalar)
+
+    def rescale(self, jobs: Sequence[tuple[str, Size]]) -> 'Future[list[Surface]]':
+        """
+        Scales the original surfaces of many image files on a background thread.
+        Originals are loaded first, on the calling thread, so only the scaling happens in the background.
+        The caller should keep using its current surfaces until the returned future is done.
+
+        :param jobs: The path of each image file and the size to scale it to.
+        :return: A future of the scaled surfaces, in the order of the jobs.
+        """
+        originals = [(self.original(path), size) for path, size in jobs]
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rescale')
+        future = self._worker.submit(_scale_all, originals)
+        logger.debug('Rescaling %d image(s) in the background.', len(originals))
+        return future
+
+    def shutdown(self) -> None:
+        """
+        Waits for any background rescaling to finish and stops the background thread.
+        A new thread is started the next time something is rescaled.
+
+        :return: None.
+        """
+        if self._worker is not None:
+            self._worker.shutdown()
+            self._worker = None
+
+
+def _scale_all(originals: list[tuple[Surface, Size]]) -> list[Surface]:
+    return [pygame.transform.scale(surface, size) for surface, size in originals]
+
+
+scaler = AssetScaler()
+"""The asset scaler shared by every entity."""
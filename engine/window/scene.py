@@ -0,0 +1,247 @@
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from engine.entity.entity import EntityHandler
+from engine.event.events import EventHandler
+from engine.window.layout import Layout
+
+if TYPE_CHECKING:
+    from engine.physics.physics import Physics
+    from engine.window.governor import FrameGovernor
+    from engine.window.resolution import Resolution
+
+DEFAULT_SCENE = 'main'
+
+
+class Scene:
+    """
+    Represents a self-contained part of a game, such as a title screen or a level.
+    Each scene has its own entities and events, which are kept while the scene is suspended.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._loaded = False
+        self._active = False
+        self.event_handler = EventHandler()
+        self.entity_handler = EntityHandler()
+        self.layout = Layout()
+        """Places the scene's anchored entities, again whenever the resolution changes."""
+        self._physics: Optional['Physics'] = None
+        self.governor: Optional['FrameGovernor'] = None
+        """Degrades the scene while its frames run over budget, or None to never degrade it."""
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def physics(self) -> 'Physics':
+        """
+        Gets the scene's physics simulation, creating it on first use.
+        Scenes that never use physics never create (or step) a simulation, or import pymunk.
+
+        :return: The scene's physics simulation.
+        """
+        if self._physics is None:
+            from engine.physics.physics import Physics
+            self._physics = Physics()
+        return self._physics
+
+    @physics.setter
+    def physics(self, value: 'Physics') -> None:
+        """
+        Sets the scene's physics simulation, for scenes that need a configured simulation.
+        Should be set before any physics entities are spawned.
+
+        :param value: The physics simulation.
+        :return: None.
+        """
+        self._physics = value
+
+    @property
+    def has_physics(self) -> bool:
+        return self._physics is not None
+
+    def on_load(self) -> None:
+        """
+        Used to create and register the scene's entities and events.
+        Called exactly once, either when the scene is preloaded or the first time it's switched to.
+
+        :return: None.
+        """
+        pass
+
+    def on_enter(self) -> None:
+        """
+        Called every time the scene becomes the active scene.
+
+        :return: None.
+        """
+        pass
+
+    def on_exit(self) -> None:
+        """
+        Called every time the scene stops being the active scene.
+        The scene's entities and events are kept until the scene is unloaded.
+
+        :return: None.
+        """
+        pass
+
+    def resize(self, old: 'Resolution', new: 'Resolution') -> None:
+        """
+        Tells every entity of the scene that the resolution changed. Anchored entities are placed again on the
+        next update of the scene's layout.
+        Should only be called by the Window.
+
+        :param old: The previous resolution.
+        :param new: The new resolution.
+        :return: None.
+        """
+        for entity in self.entity_handler:
+            entity.on_resize(old, new)
+
+    def load(self) -> None:
+        """
+        Loads the scene if it isn't already loaded.
+
+        :return: None.
+        """
+        if not self._loaded:
+            self.on_load()
+            self._loaded = True
+
+    def resume(self) -> None:
+        """
+        Makes the scene active.
+        Should only be called by the SceneManager.
+
+        :return: None.
+        """
+        self._active = True
+        self.on_enter()
+
+    def suspend(self) -> None:
+        """
+        Makes the scene inactive, keeping its entities and events.
+        Should only be called by the SceneManager.
+
+        :return: None.
+        """
+        self._active = False
+        self.on_exit()
+
+    def unload(self) -> None:
+        """
+        Removes all the scene's entities and events.
+        The scene will be loaded again the next time it's switched to.
+
+        :return: None.
+        :raise SceneError: Raised if the scene is currently active.
+        """
+        if self._active:
+            raise SceneError(f"Tried to unload active scene '{self._name}'.")
+        if self.governor is not None:
+            self.governor.reset(self)
+        self.event_handler.clear()
+        self.entity_handler.remove_all()
+        self.entity_handler.clear()
+        self.layout.clear()
+        self._loaded = False
+
+
+class SceneManager:
+    """
+    Keeps track of a game's scenes and which one is active.
+    """
+
+    def __init__(self) -> None:
+        self._scenes: dict[str, Scene] = {}
+        self._active: Optional[Scene] = None
+
+    @property
+    def active(self) -> Optional[Scene]:
+        return self._active
+
+    def __iter__(self) -> Iterator[Scene]:
+        return iter(list(self._scenes.values()))
+
+    def add(self, *scenes: Scene) -> None:
+        """
+        Adds the given scenes. Scenes are not loaded until they're preloaded or switched to.
+
+        :param scenes: The scenes to add.
+        :return: None.
+        :raise SceneError: Raised if a scene with the same name was already added.
+        """
+        for scene in scenes:
+            if scene.name in self._scenes:
+                raise SceneError(f"Scene '{scene.name}' already added.")
+            self._scenes[scene.name] = scene
+
+    def get(self, name: str) -> Scene:
+        """
+        Gets the scene with the given name.
+
+        :param name: The name of the scene.
+        :return: The scene with the given name.
+        :raise SceneError: Raised if no scene has the given name.
+        """
+        if scene := self._scenes.get(name, None):
+            return scene
+        raise SceneError(f"No scene named '{name}'.")
+
+    def preload(self, *names: str) -> None:
+        """
+        Loads the given scenes ahead of time so switching to them is instant.
+        Loads all added scenes if no names are given.
+
+        :param names: The names of the scenes to load.
+        :return: None.
+        """
+        for name in names or tuple(self._scenes):
+            self.get(name).load()
+
+    def switch(self, name: str) -> Scene:
+        """
+        Suspends the active scene and activates the given scene, loading it first if needed.
+
+        :param name: The name of the scene to switch to.
+        :return: The new active scene.
+        """
+        scene = self.get(name)
+        if scene is self._active:
+            return scene
+        scene.load()
+        if self._active is not None:
+            self._active.suspend()
+        self._active = scene
+        scene.resume()
+        return scene
+
+    def unload_all(self) -> None:
+        """
+        Deactivates the active scene and unloads every loaded scene.
+
+        :return: None.
+        """
+        if self._active is not None:
+            self._active.suspend()
+            self._active = None
+        for scene in self._scenes.values():
+            if scene.loaded:
+                scene.unload()
+
+
+class SceneError(Exception):
+
+    def __init__(self, msg: str = '') -> None:
+        super().__init__(msg)
@@ -1,14 +1,27 @@
+import os
 import sys
-from typing import Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, TYPE_CHECKING
 
 import pygame
 from pygame.color import Color
+from pygame.event import Event
+from pygame.surface import Surface
 from pygame.time import Clock
-from pymunk import Space
 
+from engine import utils
 from engine.entity.entity import EntityHandler
 from engine.event.events import EventHandler
+from engine.event.replay import EventRecorder, EventReplayer, split_input
+from engine.memory import tracker
+from engine.window.render import RenderBuffer
 from engine.window.resolution import Resolutions, Resolution
+from engine.window.scaling import scaler
+from engine.window.scene import Scene, SceneManager, DEFAULT_SCENE
+
+if TYPE_CHECKING:
+    from engine.physics.physics import Physics
 
 
 class Window:
@@ -17,17 +30,66 @@ class Window:
                  *,
                  bg: Color = Color(0),
                  title: str = "PyGame",
-                 fps: int = 30) -> None:
+                 fps: int = 30,
+                 render_res: Optional[Union[Resolutions, Resolution]] = None,
+                 headless: bool = False,
+                 seed: Optional[int] = None,
+                 record: Optional[str] = None,
+                 replay: Optional[str] = None,
+                 threaded: bool = False) -> None:
+        """
+        Creates a new window.
+
+        :param res: The resolution of the display.
+        :param bg: The background color.
+        :param title: The title of the window.
+        :param fps: The maximum frames per second.
+        :param render_res: The internal resolution entities are drawn at, or None to draw directly to the display.
+        When given, the internal surface is scaled to the display resolution once per frame.
+        :param headless: Whether to run without a visible window, as fast as possible, with a fixed frame time.
+        Headless windows record their frame times and return from `start()` instead of exiting.
+        :param seed: The seed for the shared random number generator, or None for a random seed.
+        :param record: The file to record the session's input to, or None to not record.
+        :param replay: A recording to replay the input of, or None to use live input. Overrides the seed.
+        :param threaded: Whether to update the next frame in a worker thread while the current frame is drawn.
+        Entities then record render commands instead of drawing, and each frame is shown one frame later.
+        Event handlers and timers still run on the main thread, before the worker is handed the frame.
+        Entity ticks (and collision callbacks) run in the worker while the previous frame is drawn,
+        so they must not touch the display.
+        """
         self.res = res.value if isinstance(res, Resolutions) else res
+        self.render_res = self.res
+        if render_res is not None:
+            self.render_res = render_res.value if isinstance(render_res, Resolutions) else render_res
         self._fps = fps
         self._bg = bg
         self._title = title
         self._running = False
-        self.surface = pygame.display.set_mode(size=self.res.as_tuple())
-        self.event_handler = EventHandler()
-        self.entity_handler = EntityHandler()
+        self._headless = headless
+        self._threaded = threaded
+        self._worker: Optional[ThreadPoolExecutor] = None
+        self._buffer: Optional[RenderBuffer] = None
+        self._requested_res: Optional[Resolution] = None
+        self._replayer = EventReplayer.load(replay) if replay else None
+        self.seed = utils.seed(self._replayer.seed if self._replayer else seed)
+        self._recorder = EventRecorder(self.seed) if record else None
+        self._record_path = record
+        # Governors may change game logic (such as spawn limits) based on wall-clock time, which would break
+        # determinism, so they're only used for live sessions that are neither recorded nor headless.
+        self._governed = not headless and record is None and replay is None
+        self.frame_times: list[float] = []
+        if headless:
+            _use_dummy_display()
+        elif not pygame.display.get_init():
+            pygame.display.init()
+        self.display = pygame.display.set_mode(size=self.res.as_tuple())
+        self.surface = self.display
+        if self.render_res.as_tuple() != self.res.as_tuple():
+            self.surface = tracker.track(Surface(self.render_res.as_tuple()).convert(), owner=self)
+        self.scenes = SceneManager()
+        self.scenes.add(Scene(DEFAULT_SCENE))
+        self.scenes.switch(DEFAULT_SCENE)
         self.clock = Clock()
-        self.space = Space()
 
     def start(self) -> None:
         """
@@ -38,22 +100,107 @@ class Window:
         """
         pygame.display.set_caption(self._title)
         self._running = True
+        step = self.step
+        if self._threaded:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='update')
+            step = self._step_pipelined
 
         while self._running:
-            tick_count = self.clock.tick(self._fps) % self._fps
-            self.space.step(1 / self._fps)
-            self.surface.fill(self._bg)
-            self.event_handler.handle_events(pygame.event.get())
-            self.entity_handler.tick(tick_count)
-            self.entity_handler.draw(self.surface)
-            pygame.display.flip()
+            frame = self._next_frame()
+            if frame is None:
+                break
+            delta, events = frame
+            if self._recorder is not None:
+                self._recorder.record(delta, events)
+            start = time.perf_counter()
+            step(delta, events)
+            elapsed = (time.perf_counter() - start) * 1000
+            if self._headless:
+                self.frame_times.append(elapsed)
+            scene = self.scenes.active
+            if self._governed and scene is not None and scene.governor is not None:
+                scene.governor.record(scene, elapsed)
 
-        self.event_handler.clear()
-        self.entity_handler.remove_all()
-        self.entity_handler.clear()
+        if self._worker is not None:
+            self._worker.shutdown()
+            self._worker = None
+            self._buffer = None
+        scaler.shutdown()
+        if self._recorder is not None:
+            self._recorder.save(self._record_path)
+        self.scenes.unload_all()
+        if self._headless:
+            return
         pygame.quit()
         sys.exit()
 
+    def step(self, delta: int, events: list[Event], draw: bool = True) -> None:
+        """
+        Runs a single frame: handles the events, ticks and draws the active scene and updates the display.
+
+        :param delta: The time elapsed since the last frame, in milliseconds.
+        :param events: The events to handle.
+        :param draw: Whether to draw the frame. Simulations that nobody watches can skip drawing entirely.
+        :return: None.
+        """
+        self._apply_resolution()
+        scene = self._tick(self._handle(delta, events), delta)
+        if not draw:
+            return
+        self.surface.fill(self._bg)
+        scene.entity_handler.draw(self.surface)
+        self._present()
+        pygame.display.flip()
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @property
+    def fps(self) -> int:
+        return self._fps
+
+    @property
+    def budget(self) -> float:
+        """
+        Gets the time each frame may take at the maximum frames per second, for use with a FrameGovernor.
+
+        :return: The frame budget, in milliseconds.
+        """
+        return 1000 / self._fps
+
+    @property
+    def event_handler(self) -> EventHandler:
+        """
+        Gets the event handler of the active scene.
+
+        :return: The event handler of the active scene.
+        """
+        return self.scenes.active.event_handler
+
+    @property
+    def entity_handler(self) -> EntityHandler:
+        """
+        Gets the entity handler of the active scene.
+
+        :return: The entity handler of the active scene.
+        """
+        return self.scenes.active.entity_handler
+
+    @property
+    def physics(self) -> 'Physics':
+        """
+        Gets the physics simulation of the active scene, creating it on first use.
+        Pymunk is only imported once a scene uses physics.
+
+        :return: The physics simulation of the active scene.
+        """
+        return self.scenes.active.physics
+
+    @physics.setter
+    def physics(self, value: 'Physics') -> None:
+        self.scenes.active.physics = value
+
     def stop(self) -> None:
         """
         Stops the game loop and subsequently the pygame window.
@@ -62,3 +209,161 @@ class Window:
         :return: None.
         """
         self._running = False
+
+    def set_resolution(self, res: Union[Resolutions, Resolution]) -> None:
+        """
+        Changes the resolution of the display at the start of the next frame, so it can be called from event
+        handlers (even in threaded mode).
+        When rendering at an internal resolution, only the display changes, and the render surface is scaled to it.
+        Otherwise, entities are told through `Entity.on_resize()` and rescale their assets in the background,
+        and the layouts of every scene place their anchored entities again.
+
+        :param res: The new resolution.
+        :return: None.
+        """
+        self._requested_res = res.value if isinstance(res, Resolutions) else res
+
+    def to_render_coords(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """
+        Converts display coordinates (such as the mouse position) to coordinates on the render surface.
+
+        :param pos: The display coordinates as a tuple (x, y).
+        :return: The corresponding render surface coordinates as a tuple (x, y).
+        """
+        if self.surface is self.display:
+            return pos
+        x = int(pos[0] * self.render_res.width / self.res.width)
+        y = int(pos[1] * self.render_res.height / self.res.height)
+        return x, y
+
+    def _next_frame(self) -> Optional[tuple[int, list[Event]]]:
+        """
+        Gets the frame time and events of the next frame.
+        When replaying, input comes from the recording while events sent by the game come from PyGame.
+
+        :return: A tuple of the frame time in milliseconds and the events, or None if the replay is finished.
+        """
+        if self._replayer is not None:
+            frame = self._replayer.next_frame()
+            if frame is None:
+                return None
+            delta, inputs = frame
+            _, others = split_input(self.event_handler.fetch())
+            return delta, inputs + others
+        if self._headless:
+            return 1000 // self._fps, self.event_handler.fetch()
+        delta = self.clock.tick(self._fps)
+        inputs, others = split_input(self.event_handler.fetch())
+        return delta, inputs + others
+
+    def _handle(self, delta: int, events: list[Event]) -> Scene:
+        """
+        Starts updating the active scene: steps its physics, handles the events and ticks its timers.
+        Always runs on the main thread, so event handlers may touch the display and the window.
+
+        :param delta: The time elapsed since the last frame, in milliseconds.
+        :param events: The events to handle.
+        :return: The scene that's active after the events were handled.
+        """
+        if self.scenes.active.has_physics:
+            self.scenes.active.physics.step(1 / self._fps)
+        self.scenes.active.event_handler.handle_events(events)
+        # Events may switch scenes, so the active scene is fetched again.
+        scene = self.scenes.active
+        scene.event_handler.tick(delta)
+        return scene
+
+    def _tick(self, scene: Scene, delta: int) -> Scene:
+        """
+        Finishes updating the scene: ticks its entities and places its anchored entities.
+
+        :param scene: The scene returned by `_handle()`.
+        :param delta: The time elapsed since the last frame, in milliseconds.
+        :return: The updated scene.
+        """
+        scene.entity_handler.tick(delta)
+        scene.layout.update(self.render_res)
+        return scene
+
+    def _tick_and_record(self, scene: Scene, delta: int) -> RenderBuffer:
+        """
+        Finishes updating the scene and records its render commands, in the worker thread.
+
+        :param scene: The scene returned by `_handle()`.
+        :param delta: The time elapsed since the last frame, in milliseconds.
+        :return: The render commands of the updated scene.
+        """
+        self._tick(scene, delta)
+        buffer = RenderBuffer()
+        scene.entity_handler.render(buffer)
+        return buffer
+
+    def _step_pipelined(self, delta: int, events: list[Event]) -> None:
+        """
+        Runs a single frame in threaded mode: handles the events on the main thread, then ticks the next frame
+        in the worker thread while drawing the render commands of the previous update and updating the display.
+
+        :param delta: The time elapsed since the last frame, in milliseconds.
+        :param events: The events to handle.
+        :return: None.
+        """
+        self._apply_resolution()
+        scene = self._handle(delta, events)
+        update = self._worker.submit(self._tick_and_record, scene, delta)
+        if self._buffer is not None:
+            self.surface.fill(self._bg)
+            self._buffer.render(self.surface)
+            self._present()
+            pygame.display.flip()
+        self._buffer = update.result()
+
+    def _apply_resolution(self) -> None:
+        """
+        Changes the resolution of the display to the one requested by `set_resolution()`, if any.
+
+        :return: None.
+        """
+        res = self._requested_res
+        if res is None:
+            return
+        self._requested_res = None
+        if res.as_tuple() == self.res.as_tuple():
+            return
+        internal = self.surface is not self.display
+        self.res = res
+        self.display = pygame.display.set_mode(size=res.as_tuple())
+        if internal:
+            return
+        old = self.render_res
+        self.render_res = res
+        self.surface = self.display
+        for scene in self.scenes:
+            if scene.loaded:
+                scene.resize(old, res)
+
+    def _present(self) -> None:
+        """
+        Scales the render surface onto the display, if rendering at an internal resolution.
+        Uses `scale2x` when the display is exactly double the render resolution.
+
+        :return: None.
+        """
+        if self.surface is self.display:
+            return
+        if self.res.width == self.render_res.width * 2 and self.res.height == self.render_res.height * 2:
+            pygame.transform.scale2x(self.surface, self.display)
+        else:
+            pygame.transform.scale(self.surface, self.res.as_tuple(), self.display)
+
+
+def _use_dummy_display() -> None:
+    """
+    Switches PyGame to SDL's dummy video driver so no window is opened.
+
+    :return: None.
+    """
+    if pygame.display.get_init() and pygame.display.get_driver() == 'dummy':
+        return
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.quit()
+    pygame.display.init()
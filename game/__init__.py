@@ -1,5 +0,0 @@
-import pygame
-
-pygame.init()
-pygame.font.init()
-pygame.mixer.init()
@@ -1,32 +1,38 @@
-from random import randint
-
-import pygame.font
+import pygame
 from pygame.event import Event
 
 from engine.entity.circle import PymunkCircle
 from engine.entity.rectangle import PymunkRectangle
 from engine.entity.string import String
-from engine.utils import BLACK, new_user_event, spawn_all, random_color, WHITE
+from engine.event.events import new_event
+from engine.font import system_font
+from engine.log import get_logger
+from engine.physics.physics import Physics
+from engine.utils import BLACK, random_color, WHITE, rng
+from engine.window.location import Location
 from engine.window.resolution import Resolutions
 from engine.window.window import Window
 
+logger = get_logger(__name__)
+
 RESOLUTION = Resolutions.P720
-FONT = pygame.font.SysFont("comicsansms", 32, True)
-UPDATE_FPS_EVENT = new_user_event()
-CLOSE_GAP_EVENT = new_user_event()
+UPDATE_FPS_EVENT = new_event()
+CLOSE_GAP_EVENT = new_event()
 
 
 class CannonFodder:
 
     def __init__(self):
-        self.window = Window(RESOLUTION, BLACK, title="Cannon Fodder")
-        self.window.space.gravity = (0, 200)
-        self.fps_string = String(FONT, "FPS: 0")
-        pygame.time.set_timer(UPDATE_FPS_EVENT, 500)
+        self.window = Window(RESOLUTION, bg=BLACK, title="Cannon Fodder")
+        # Balls are all the same size, so a spatial hash sized to them beats the default bounding box tree.
+        # At 30 FPS the balls are fast enough to pass through the walls in a single step, so each step is split up.
+        self.window.physics = Physics(gravity=(0, 200), spatial_hash=(14, 200), substeps=4, adaptive=True)
+        self.fps_string = String(system_font("comicsansms", 32, True), "FPS: 0")
+        self.window.event_handler.set_timer(UPDATE_FPS_EVENT, 500)
         self.register_events()
         self.spawn_boundaries()
         self.spawn_balls()
-        pygame.time.set_timer(CLOSE_GAP_EVENT, 9000, 1)
+        self.window.event_handler.set_timer(CLOSE_GAP_EVENT, 9000, 1)
         self.window.start()
 
     def register_events(self) -> None:
@@ -35,10 +41,10 @@ class CannonFodder:
 
         :return: None.
         """
-        self.window.register_event(pygame.QUIT, self.on_quit)
-        self.window.register_event(pygame.KEYDOWN, self.on_key_press)
-        self.window.register_event(CLOSE_GAP_EVENT, self.close_gap)
-        self.window.register_event(UPDATE_FPS_EVENT, self.update_fps)
+        self.window.event_handler.register(pygame.QUIT, self.on_quit)
+        self.window.event_handler.register(pygame.KEYDOWN, self.on_key_press)
+        self.window.event_handler.register(CLOSE_GAP_EVENT, self.close_gap)
+        self.window.event_handler.register(UPDATE_FPS_EVENT, self.update_fps)
 
     def spawn_boundaries(self) -> None:
         """
@@ -46,16 +52,19 @@ class CannonFodder:
 
         :return: None.
         """
-        top = PymunkRectangle((0, 0), (RESOLUTION.w, 0), 10, self.window.space)
-        left = PymunkRectangle((0, 0), (0, RESOLUTION.h), 10, self.window.space)
-        right = PymunkRectangle((RESOLUTION.w, 0), (RESOLUTION.w, RESOLUTION.h), 10, self.window.space)
-        bottom = PymunkRectangle((0, RESOLUTION.h), (RESOLUTION.w, RESOLUTION.h), 10, self.window.space)
-        top_wall = PymunkRectangle((900, 0), (900, 400), 50, self.window.space, color=WHITE)
-        bottom_wall = PymunkRectangle((900, 600), (900, RESOLUTION.h), 50, self.window.space, color=WHITE)
-        top_shelf = PymunkRectangle((1110, 600), (1230, 600), 10, self.window.space, color=WHITE)
-        bottom_shelf = PymunkRectangle((1080, 650), (1200, 650), 10, self.window.space, color=WHITE)
-        self.window.register_entities(top, left, right, bottom, top_wall, bottom_wall, top_shelf, bottom_shelf)
-        spawn_all(top, left, right, bottom, top_wall, bottom_wall, top_shelf, bottom_shelf)
+        physics = self.window.physics
+        top = PymunkRectangle((0, 0), (RESOLUTION.value.width, 0), 10, physics)
+        left = PymunkRectangle((0, 0), (0, RESOLUTION.value.height), 10, physics)
+        right = PymunkRectangle((RESOLUTION.value.width, 0), RESOLUTION.value.as_tuple(), 10, physics)
+        bottom = PymunkRectangle((0, RESOLUTION.value.height), RESOLUTION.value.as_tuple(), 10, physics)
+        top_wall = PymunkRectangle((900, 0), (900, 400), 50, physics, color=WHITE)
+        bottom_wall = PymunkRectangle((900, 600), (900, RESOLUTION.value.height), 50, physics, color=WHITE)
+        top_shelf = PymunkRectangle((1110, 600), (1230, 600), 10, physics, color=WHITE)
+        bottom_shelf = PymunkRectangle((1080, 650), (1200, 650), 10, physics, color=WHITE)
+        boundaries = (top, left, right, bottom, top_wall, bottom_wall, top_shelf, bottom_shelf)
+        self.window.entity_handler.register_entities(*boundaries)
+        for boundary in boundaries:
+            boundary.spawn()
 
     def spawn_balls(self) -> None:
         """
@@ -64,11 +73,10 @@ class CannonFodder:
         :return: None.
         """
         for _ in range(100):
-            circle = PymunkCircle(7, self.window.space, random_color())
-            circle.loc.x = randint(100, 200)
-            circle.loc.y = randint(200, 600)
+            loc = Location(rng.randint(100, 200), rng.randint(200, 600))
+            circle = PymunkCircle(7, self.window.physics, random_color(), loc)
             circle.body.velocity = (500, -20)
-            self.window.register_entity(circle)
+            self.window.entity_handler.register_entity(circle)
             circle.spawn()
 
     def close_gap(self, _: Event) -> None:
@@ -78,9 +86,9 @@ class CannonFodder:
         :param _: The event, unused/ignored.
         :return: None.
         """
-        print("Closed gap.")
-        gap = PymunkRectangle((900, 400), (900, 600), 50, self.window.space, color=WHITE)
-        self.window.register_entity(gap)
+        logger.info("Closed gap.")
+        gap = PymunkRectangle((900, 400), (900, 600), 50, self.window.physics, color=WHITE)
+        self.window.entity_handler.register_entity(gap)
         gap.spawn()
 
     def update_fps(self, _: Event) -> None:
@@ -92,7 +100,7 @@ class CannonFodder:
         :return: None.
         """
         if not self.fps_string.visible:
-            self.window.register_entity(self.fps_string)
+            self.window.entity_handler.register_entity(self.fps_string)
             self.fps_string.spawn()
         self.fps_string.set_text(f"FPS: {int(self.window.clock.get_fps())}")
 
@@ -104,7 +112,7 @@ class CannonFodder:
         :return: None.
         """
         self.window.stop()
-        print("Game stopping...")
+        logger.info("Game stopping...")
 
     def on_key_press(self, event: Event) -> None:
         """
@@ -1,55 +1,84 @@
-from random import randint
+from typing import Optional, Union
 
 import pygame
 from pygame.event import Event
 
+from engine.audio.audio import AudioManager
+from engine.entity.group import EntityGroup
+from engine.entity.entity import Entity
 from engine.entity.image import Image
 from engine.entity.parallax import Parallax
 from engine.entity.sprite import Sprite, SpriteState
 from engine.entity.string import String
 from engine.event.events import new_event
+from engine.font import load_font
+from engine.log import get_logger
+from engine.utils import rng
+from engine.window.governor import CapSpawns, FrameGovernor, ReduceDistantAnimation, SkipFarLayers
 from engine.window.location import Location
-from engine.window.resolution import Resolutions
+from engine.window.resolution import Resolution, Resolutions
 from engine.window.window import Window
 from game.presets import ParallaxPresets, ParallexPreset, SoundPresets
 
+logger = get_logger(__name__)
+
 RESOLUTION = Resolutions.P720
-TITLE_FONT = pygame.font.Font('game/assets/font/kenvector_future.ttf', 40)
-SUBTITLE_FONT = pygame.font.Font('game/assets/font/kenpixel_mini_square.ttf', 24)
+"""The resolution of the window. Sizes, distances and speeds in this module are given at this resolution."""
+SPRITE_SCALAR = 3.5
+HEALTH_SCALAR = 2.75
+TITLE_SIZE = 40
+SUBTITLE_SIZE = 24
+SUBTITLE_GAP = 50
+TITLE_FONT = 'game/assets/font/kenvector_future.ttf'
+SUBTITLE_FONT = 'game/assets/font/kenpixel_mini_square.ttf'
 COLLIDE_EVENT = new_event()
 UPDATE_SCORE_EVENT = new_event()
 INVINCIBLE_DISABLE_EVENT = new_event()
 SPAWN_BAT_EVENT = new_event()
+BAT_TAG = 'bat'
+PLAYER_CATEGORY = 1 << 0
+ENEMY_CATEGORY = 1 << 1
+BAT_COUNT = 4
 
 
 class Platformer:
 
-    def __init__(self):
-        self.window = Window(RESOLUTION, title='Runner', fps=24)
+    def __init__(self,
+                 *,
+                 preset: Optional[ParallexPreset] = None,
+                 autostart: bool = True,
+                 render_res: Optional[Union[Resolution, Resolutions]] = None,
+                 **window_options):
+        self.window = Window(RESOLUTION, title='Runner', fps=24, render_res=render_res, **window_options)
+        self.audio = AudioManager(enabled=not self.window.headless)
+        self.audio.preload(*SoundPresets.paths(), background=True)
         self.register_events()
-        self.bats: list[Sprite] = []
         self.init_entities()
         self.config_entities()
-        self.new_game()
+        self.window.scenes.active.governor = FrameGovernor(self.window.budget, [
+            SkipFarLayers(2),
+            ReduceDistantAnimation(self.character, self.window.render_res.width / 2),
+            CapSpawns(2)
+        ])
+        self.new_game(preset)
         self.register_entities()
         self.window.entity_handler.spawn_all()
         for bat in self.bats:
             bat.visible = False
-        self.title.visible = True
-        self.subtitle.visible = True
-        self.game_over.visible = False
-        self.score_str.visible = False
-        self.window.start()
+        self.menu.visible = True
+        self.results.visible = False
+        if autostart:
+            self.window.start()
 
-    def new_game(self) -> None:
+    def new_game(self, preset: Optional[ParallexPreset] = None) -> None:
         self.score = 0
         self.started = False
         self.invincible = False
-        self.preset = ParallaxPresets.random()
+        self.preset = preset if preset is not None else ParallaxPresets.random()
         self.parallax = self.from_preset(self.preset)
         self.window.entity_handler.register_entity(self.parallax)
         self.parallax.spawn()
-        self.character.min_y(RESOLUTION.value, self.preset.y_offset)
+        self.character.min_y(self.window.render_res, self.ground)
         self.character.state = SpriteState.IDLE
         self.set_entities()
         self.title.color = self.preset.color
@@ -59,10 +88,8 @@ class Platformer:
         self.health.index = 0
         for bat in self.bats:
             bat.visible = False
-        self.title.visible = True
-        self.subtitle.visible = True
-        self.game_over.visible = False
-        self.score_str.visible = False
+        self.menu.visible = True
+        self.results.visible = False
 
     def register_events(self) -> None:
         self.window.event_handler.register(pygame.QUIT, self.on_quit)
@@ -71,31 +98,40 @@ class Platformer:
         self.window.event_handler.register(UPDATE_SCORE_EVENT, self.update_score)
         self.window.event_handler.register(INVINCIBLE_DISABLE_EVENT, self.disable_invincible)
         self.window.event_handler.register(SPAWN_BAT_EVENT, self.spawn_bat)
-        pygame.time.set_timer(UPDATE_SCORE_EVENT, 1000, -1)
-        pygame.time.set_timer(SPAWN_BAT_EVENT, 666, -1)
+        self.window.event_handler.set_timer(UPDATE_SCORE_EVENT, 1000)
+        self.window.event_handler.set_timer(SPAWN_BAT_EVENT, 666)
 
     def init_entities(self) -> None:
-        self.title = String(TITLE_FONT, 'RUNNER')
-        self.subtitle = String(SUBTITLE_FONT, 'press space to start')
-        self.game_over = String(TITLE_FONT, 'GAME OVER')
-        self.score_str = String(SUBTITLE_FONT, 'You lasted 0 seconds\npress space to restart')
-        self.seconds = String(SUBTITLE_FONT, '0', loc=Location(10, 10))
-        self.character = Sprite(RESOLUTION.value, scalar=3.5)
-        self.health = Image('game/assets/health', 7, scalar=2.75)
-        for i in range(4):
-            self.bats.append(Sprite(RESOLUTION.value, scalar=3.5, gravity=False, default_state=SpriteState.MID_AIR))
-            self.bats[i].loc.x = -250
+        title_font = load_font(TITLE_FONT, round(TITLE_SIZE * self.scale))
+        subtitle_font = load_font(SUBTITLE_FONT, round(SUBTITLE_SIZE * self.scale))
+        self.title = String(title_font, 'RUNNER')
+        self.subtitle = String(subtitle_font, 'press space to start')
+        self.game_over = String(title_font, 'GAME OVER')
+        self.score_str = String(subtitle_font, 'You lasted 0 seconds\npress space to restart')
+        self.menu = EntityGroup()
+        self.menu.attach(self.title)
+        self.menu.attach(self.subtitle)
+        self.results = EntityGroup()
+        self.results.attach(self.game_over)
+        self.results.attach(self.score_str)
+        self.seconds = String(subtitle_font, '0')
+        self.character = Sprite(self.window.render_res, scalar=SPRITE_SCALAR * self.scale, gravity_scale=self.scale)
+        self.health = Image('game/assets/health', 7, scalar=HEALTH_SCALAR * self.scale)
+        layout = self.window.scenes.active.layout
+        # Offsets are given at the game's resolution, so they're scaled along with the parallax's ground.
+        layout.reference = RESOLUTION.value
+        layout.anchor(self.menu, Location.center, box=self.title)
+        layout.anchor(self.results, Location.center, box=self.game_over)
+        layout.anchor(self.seconds, Location.top_left, (10, 10))
+        layout.anchor(self.health, Location.top_right)
 
     def set_entities(self) -> None:
-        self.title.loc = Location.center(RESOLUTION.value, self.title.bounds())
-        self.game_over.loc = Location.center(RESOLUTION.value, self.game_over.bounds())
-        self.subtitle.loc = Location.center(RESOLUTION.value, self.subtitle.bounds())
-        self.subtitle.loc.add(y=50)
-        self.score_str.loc = Location.center(RESOLUTION.value, self.score_str.bounds())
-        self.score_str.loc.add(y=50)
-        self.health.loc = Location.top_right(RESOLUTION.value, self.health.bounds())
-        self.character.loc = Location.bottom_left(RESOLUTION.value, self.character.bounds())
-        self.character.loc.add(50, -self.preset.y_offset)
+        layout = self.window.scenes.active.layout
+        # The character moves on its own, so it's only placed again on a new game or when the resolution changes.
+        layout.anchor(self.character, Location.bottom_left, (50, -self.preset.y_offset), follow_size=False)
+        layout.update(self.window.render_res)
+        self.menu.set_offset(self.subtitle, self.centered_offset(self.menu, self.subtitle, SUBTITLE_GAP))
+        self.results.set_offset(self.score_str, self.centered_offset(self.results, self.score_str, SUBTITLE_GAP))
 
     def config_entities(self) -> None:
         self.character.add_state(SpriteState.IDLE, 'game/assets/character/idle', 12)
@@ -103,66 +139,112 @@ class Platformer:
         self.character.add_state(SpriteState.LAND, 'game/assets/character/land', 1)
         self.character.add_state(SpriteState.MID_AIR, 'game/assets/character/mid_air', 2)
         self.character.add_state(SpriteState.RUN, 'game/assets/character/run', 8)
-        for bat in self.bats:
-            bat.add_state(SpriteState.MID_AIR, 'game/assets/bat/mid_air', 4)
-        self.window.entity_handler.listen(self.character, self.bats, COLLIDE_EVENT)
+        self.character.collision_category = PLAYER_CATEGORY
+        self.character.collision_mask = ENEMY_CATEGORY
+        self.window.entity_handler.on_collision(PLAYER_CATEGORY, ENEMY_CATEGORY, self.post_collision)
 
     def register_entities(self) -> None:
-        self.window.entity_handler.register_entities(self.title, self.game_over, self.subtitle, self.score_str,
-                                                     self.seconds, self.character, self.health)
-        for bat in self.bats:
-            print('bat registered')
-            self.window.entity_handler.register_entity(bat)
+        self.window.entity_handler.register_entities(self.menu, self.results, self.seconds, self.character,
+                                                     self.health)
+        for _ in range(BAT_COUNT):
+            bat = Sprite(self.window.render_res, scalar=SPRITE_SCALAR * self.scale, gravity=False,
+                         default_state=SpriteState.MID_AIR)
+            bat.add_state(SpriteState.MID_AIR, 'game/assets/bat/mid_air', 4)
+            bat.loc.x = -250
+            bat.collision_category = ENEMY_CATEGORY
+            bat.collision_mask = PLAYER_CATEGORY
+            self.window.entity_handler.register_entity(bat, BAT_TAG)
+            logger.debug('Bat registered.')
+
+    def centered_offset(self, group: EntityGroup, entity: Entity, y: int = 0) -> tuple[int, int]:
+        """
+        Gets the offset within the group that centers the entity in the window, moved down by the given amount.
+
+        :param group: The group the entity is part of.
+        :param entity: The entity to center.
+        :param y: The amount to move the entity down by, at `RESOLUTION`.
+        :return: The offset of the entity.
+        """
+        loc = Location.center(self.window.render_res, entity.bounds())
+        return loc.x - group.loc.x, loc.y - group.loc.y + round(y * self.scale)
+
+    @property
+    def scale(self) -> float:
+        """
+        Gets how many times larger the game is drawn than at `RESOLUTION`, such as 0.5 when drawn at 360p.
 
-    def play_sound(self, path: str) -> None:
-        pygame.mixer.music.load(path)
-        pygame.mixer.music.set_volume(0.3)
-        pygame.mixer.music.play()
+        :return: The ratio between the render resolution and `RESOLUTION`.
+        """
+        return RESOLUTION.value.ratio_to(self.window.render_res)
+
+    @property
+    def ground(self) -> int:
+        """
+        Gets the height of the current preset's ground at the current resolution.
+
+        :return: The distance from the bottom of the window to the ground.
+        """
+        return round(self.preset.y_offset * self.scale)
+
+    @property
+    def bats(self) -> list[Sprite]:
+        return self.window.entity_handler.group(BAT_TAG)
+
+    def play_sound(self, path: str, priority: int = 0) -> None:
+        self.audio.play(path, priority=priority, volume=0.3)
 
     def from_preset(self, pre: ParallexPreset) -> Parallax:
-        return Parallax(pre.path, pre.layers, RESOLUTION)
+        return Parallax(pre.path, pre.layers, self.window.render_res)
 
     def spawn_bat(self, _: Event) -> None:
-        if self.title.visible or self.game_over.visible:
+        if self.menu.visible or self.results.visible:
+            return
+        active = sum(1 for bat in self.bats if bat.loc.x > -100)
+        if not self.window.entity_handler.can_spawn(active):
+            logger.debug('Bat spawn skipped, %d bats are already flying.', active)
             return
         i = 0
         for current_bat in self.bats:
             if current_bat.loc.x > -100:
-                print(f'Bat {i} loc: {current_bat.loc.x}, {current_bat.loc.y}')
+                logger.debug('Bat %d loc: %s', i, current_bat.loc)
                 i += 1
                 continue
             current_bat.visible = True
-            vel_x = randint(20, 50)
-            current_bat.loc.x = RESOLUTION.value.width + 200
-            current_bat.loc.y = randint(0, RESOLUTION.value.height - self.preset.y_offset - 100)
+            vel_x = rng.randint(20, 50) * self.scale
+            res = self.window.render_res
+            current_bat.loc.x = res.width + 200
+            current_bat.loc.y = rng.randint(0, res.height - self.ground - round(100 * self.scale))
             current_bat.velocity = (vel_x, 0)
-            print(f'Bat {i} spawned.')
-            i += 1
+            logger.debug('Bat %d spawned.', i)
             break
-        print('No bat to spawn?')
+        else:
+            logger.debug('No bat to spawn.')
 
     def on_key_press(self, event: Event) -> None:
         if event.key == pygame.K_SPACE:
-            print('Space pressed.')
-            if self.game_over.visible:
+            logger.debug('Space pressed.')
+            if self.results.visible:
                 self.parallax.dispose()
                 self.new_game()
                 return
-            if self.title.visible:
-                self.title.visible = False
-                self.subtitle.visible = False
+            if self.menu.visible:
+                self.menu.visible = False
                 self.parallax.scroll = self.preset.scroll
                 self.parallax.speed = self.preset.speed
                 self.parallax.delta = self.preset.delta
                 self.character.state = SpriteState.RUN
                 return
             if self.character.state is SpriteState.RUN:
-                self.character.velocity = (0, -30)
+                self.character.velocity = (0, -30 * self.scale)
         elif event.key == pygame.K_ESCAPE:
             self.on_quit(event)
         elif event.key == pygame.K_KP_ENTER:
             self.health.next()
 
+    @staticmethod
+    def post_collision(_: Sprite, __: Sprite) -> None:
+        pygame.event.post(Event(COLLIDE_EVENT))
+
     def on_collide(self, _: Event) -> None:
         if self.invincible:
             return
@@ -172,25 +254,23 @@ class Platformer:
         else:
             self.play_sound(SoundPresets.rand_hurt())
             self.invincible = True
-            pygame.time.set_timer(INVINCIBLE_DISABLE_EVENT, 2000)
+            self.window.event_handler.set_timer(INVINCIBLE_DISABLE_EVENT, 2000, 1)
 
     def disable_invincible(self, _: Event) -> None:
         self.invincible = False
 
     def update_score(self, _: Event) -> None:
-        if self.game_over.visible or self.title.visible:
+        if self.results.visible or self.menu.visible:
             return
         self.score += 1
         self.seconds.set_text(str(self.score))
 
     def on_death(self) -> None:
-        self.play_sound(SoundPresets.rand_death())
-        self.game_over.visible = True
+        self.play_sound(SoundPresets.rand_death(), priority=1)
         self.score_str.set_text(f'You lasted {self.score} seconds')
-        self.score_str.loc = Location.center(RESOLUTION.value, self.score_str.bounds())
-        self.score_str.loc.add(y=50)
-        self.score_str.visible = True
+        self.results.set_offset(self.score_str, self.centered_offset(self.results, self.score_str, SUBTITLE_GAP))
+        self.results.visible = True
 
     def on_quit(self, _: Event) -> None:
-        print('Closing game...')
+        logger.info('Closing game...')
         self.window.stop()
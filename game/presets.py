@@ -1,8 +1,9 @@
 from enum import Enum
-from random import randint
 
 from pygame import Color
 
+from engine.utils import rng
+
 
 class ParallexPreset:
 
@@ -79,7 +80,7 @@ class ParallaxPresets(Enum):
     @staticmethod
     def random() -> ParallexPreset:
         presets = [p.value for p in ParallaxPresets]
-        return presets[randint(0, len(presets) - 1)]
+        return presets[rng.randint(0, len(presets) - 1)]
 
 
 class SoundPresets(Enum):
@@ -92,14 +93,18 @@ class SoundPresets(Enum):
     HURT_1 = 'game/assets/sound/hurt_1.mp3'
     HURT_2 = 'game/assets/sound/hurt_2.mp3'
 
+    @staticmethod
+    def paths() -> list[str]:
+        return [p.value for p in SoundPresets]
+
     @staticmethod
     def rand_death() -> str:
         death_sounds = [SoundPresets.DEATH_0, SoundPresets.DEATH_1, SoundPresets.DEATH_2, SoundPresets.DEATH_3]
         death_sounds = [p.value for p in death_sounds]
-        return death_sounds[randint(0, len(death_sounds) - 1)]
+        return death_sounds[rng.randint(0, len(death_sounds) - 1)]
 
     @staticmethod
     def rand_hurt() -> str:
         hurt_sounds = [SoundPresets.HURT_0, SoundPresets.HURT_1, SoundPresets.HURT_2]
         hurt_sounds = [p.value for p in hurt_sounds]
-        return hurt_sounds[randint(0, len(hurt_sounds) - 1)]
+        return hurt_sounds[rng.randint(0, len(hurt_sounds) - 1)]
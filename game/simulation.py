@@ -0,0 +1,176 @@
+import json
+import os
+import statistics
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+import pygame
+from pygame.event import Event
+
+from engine.entity.sprite import SpriteState
+from game.platformer import Platformer, COLLIDE_EVENT
+from game.presets import ParallaxPresets
+
+JUMP_LOOKAHEAD = 8
+"""How many frames ahead the scripted runner looks for bats to jump over."""
+DEFAULT_MAX_SECONDS = 300
+
+
+def _init_worker() -> None:
+    """
+    Prepares a worker process for headless sessions, without opening a window or an audio device.
+
+    :return: None.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+def _should_jump(game: Platformer) -> bool:
+    """
+    Decides if the scripted runner should jump, which it does when a bat is about to reach it at a low height.
+
+    :param game: The Platformer being played.
+    :return: True if the runner should jump, False otherwise.
+    """
+    character = game.character.bounds()
+    for bat in game.bats:
+        if not bat.visible:
+            continue
+        vel_x, _ = bat.velocity
+        bounds = bat.bounds()
+        distance = bounds.left - character.right
+        if 0 <= distance <= vel_x * JUMP_LOOKAHEAD and bounds.bottom > character.top:
+            return True
+    return False
+
+
+def run_session(seed: int, preset: Optional[str] = None, max_seconds: int = DEFAULT_MAX_SECONDS) -> dict:
+    """
+    Plays a single headless Platformer session with a scripted runner, as fast as possible.
+
+    :param seed: The seed of the session.
+    :param preset: The name of the parallax preset to play on, or None for a random preset.
+    :param max_seconds: The game time after which the session is stopped if the runner is still alive.
+    :return: The results of the session.
+    """
+    # The event queue belongs to the video subsystem, so it's initialized before clearing events left by a previous
+    # session in this worker. The Window initializes it too, which does nothing when it already is.
+    pygame.display.init()
+    pygame.event.clear()
+    chosen = ParallaxPresets[preset].value if preset else None
+    game = Platformer(preset=chosen, autostart=False, headless=True, seed=seed)
+    window = game.window
+    space = Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' ')
+    frame_time = 1000 // window.fps
+    max_frames = max_seconds * 1000 // frame_time
+    frame_times = []
+    collisions = 0
+    events = [space]
+    frames = 0
+    while frames < max_frames and not game.results.visible:
+        queued = window.event_handler.fetch()
+        collisions += sum(1 for event in queued if event.type == COLLIDE_EVENT)
+        if game.character.state is SpriteState.RUN and _should_jump(game):
+            events.append(space)
+        start = time.perf_counter()
+        window.step(frame_time, events + queued, draw=False)
+        frame_times.append((time.perf_counter() - start) * 1000)
+        events = []
+        frames += 1
+    # Unloading hides every entity, so the results are read first.
+    result = {
+        'seed': seed,
+        'preset': next(p.name for p in ParallaxPresets if p.value is game.preset),
+        'survived': game.score,
+        'died': game.results.visible,
+        'frames': frames,
+        'collisions': collisions,
+        'health_lost': game.health.index,
+        'frame_mean_ms': statistics.fmean(frame_times),
+        'frame_max_ms': max(frame_times)
+    }
+    window.scenes.unload_all()
+    return result
+
+
+def run_batch(sessions: int,
+              *,
+              presets: Optional[list[str]] = None,
+              first_seed: int = 0,
+              workers: Optional[int] = None,
+              max_seconds: int = DEFAULT_MAX_SECONDS) -> dict:
+    """
+    Plays many headless sessions in parallel, one process per core by default, and aggregates their results.
+    Each session has its own seed, so any session can be reproduced on its own with `run_session()`.
+
+    :param sessions: The amount of sessions to play per preset.
+    :param presets: The names of the parallax presets to play on, or None for random presets.
+    :param first_seed: The seed of the first session, following sessions use the seeds after it.
+    :param workers: The amount of worker processes, or None for one per core.
+    :param max_seconds: The game time after which a session is stopped if the runner is still alive.
+    :return: The results of every session, and aggregated results per preset.
+    """
+    jobs = [(first_seed + i, preset) for preset in presets or [None] for i in range(sessions)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'), initializer=_init_worker) as pool:
+        futures = [pool.submit(run_session, seed, preset, max_seconds) for seed, preset in jobs]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+    by_preset: dict[str, list[dict]] = {}
+    for result in results:
+        by_preset.setdefault(result['preset'], []).append(result)
+    return {
+        'sessions': len(results),
+        'elapsed_s': elapsed,
+        'presets': {name: aggregate(preset_results) for name, preset_results in sorted(by_preset.items())},
+        'results': results
+    }
+
+
+def aggregate(results: list[dict]) -> dict:
+    """
+    Summarizes the results of many sessions.
+
+    :param results: The session results.
+    :return: The summarized results.
+    """
+    survived = [result['survived'] for result in results]
+    return {
+        'sessions': len(results),
+        'deaths': sum(1 for result in results if result['died']),
+        'survived_mean': statistics.fmean(survived),
+        'survived_median': statistics.median(survived),
+        'survived_min': min(survived),
+        'survived_max': max(survived),
+        'collisions_mean': statistics.fmean(result['collisions'] for result in results),
+        'frame_mean_ms': statistics.fmean(result['frame_mean_ms'] for result in results),
+        'frame_max_ms': max(result['frame_max_ms'] for result in results)
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(prog='python -m game.simulation', description='Plays headless sessions in parallel.')
+    parser.add_argument('--sessions', type=int, default=100, help='sessions to play per preset')
+    parser.add_argument('--presets', nargs='*', metavar='PRESET', help='parallax presets to play on (default: random)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first session')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per core)')
+    parser.add_argument('--max-seconds', type=int, default=DEFAULT_MAX_SECONDS, help='game time limit per session')
+    parser.add_argument('--output', metavar='FILE', default='simulation.json', help='where to write the results')
+    args = parser.parse_args()
+    report = run_batch(args.sessions, presets=args.presets, first_seed=args.seed, workers=args.workers,
+                       max_seconds=args.max_seconds)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    for name, summary in report['presets'].items():
+        print(f"{name:<12} sessions={summary['sessions']:<5} survived mean={summary['survived_mean']:.1f}s "
+              f"median={summary['survived_median']}s max={summary['survived_max']}s "
+              f"collisions={summary['collisions_mean']:.1f}")
+    print(f"{report['sessions']} sessions in {report['elapsed_s']:.1f}s, written to {args.output}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,26 @@
+from argparse import ArgumentParser
+
+from engine import log
+from engine.window.resolution import Resolutions
 from game.platformer import Platformer
 
 
 def main() -> None:
-    Platformer()
+    parser = ArgumentParser(description='Runs the platformer.')
+    parser.add_argument('--seed', type=int, help='seed for the random number generator')
+    parser.add_argument('--record', metavar='FILE', help='record the session input to the given file')
+    parser.add_argument('--replay', metavar='FILE', help='replay the session input from the given file')
+    parser.add_argument('--headless', action='store_true', help='run without a window, as fast as possible')
+    parser.add_argument('--threaded', action='store_true', help='update the next frame while drawing the current one')
+    parser.add_argument('--render-res', choices=[res.name for res in Resolutions],
+                        help='draw at a lower internal resolution and upscale it to the window')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='the lowest level of messages to log')
+    args = parser.parse_args()
+    log.configure(getattr(log, args.log_level))
+    render_res = Resolutions[args.render_res] if args.render_res else None
+    Platformer(seed=args.seed, record=args.record, replay=args.replay, headless=args.headless,
+               threaded=args.threaded, render_res=render_res)
 
 
 if __name__ == '__main__':